@@ -0,0 +1,45 @@
+"""add_user_date_composite_indexes
+
+Revision ID: 8c2f4d1a9b37
+Revises: 3411bdb260be
+Create Date: 2026-10-14 10:12:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2f4d1a9b37'
+down_revision: Union[str, None] = '3411bdb260be'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_daily_scores_user_date_desc', 'daily_scores',
+            ['user_id', sa.text('score_date DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_journal_entries_user_date', 'journal_entries',
+            ['user_id', 'entry_date'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_journal_entries_user_date', table_name='journal_entries',
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.drop_index(
+            'ix_daily_scores_user_date_desc', table_name='daily_scores',
+            postgresql_concurrently=True, if_exists=True,
+        )
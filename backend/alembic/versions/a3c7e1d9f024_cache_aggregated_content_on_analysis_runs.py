@@ -0,0 +1,28 @@
+"""cache_aggregated_content_on_analysis_runs
+
+Revision ID: a3c7e1d9f024
+Revises: f2b9d7a4c158
+Create Date: 2026-10-14 17:12:36.748120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e1d9f024'
+down_revision: Union[str, None] = 'f2b9d7a4c158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('analysis_runs', sa.Column('aggregated_content', sa.Text(), nullable=True))
+    op.add_column('analysis_runs', sa.Column('aggregated_through', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('analysis_runs', 'aggregated_through')
+    op.drop_column('analysis_runs', 'aggregated_content')
@@ -0,0 +1,45 @@
+"""add_notifications_user_type_created_index
+
+Revision ID: a6d3e8b1f492
+Revises: f4c8a1d6e250
+Create Date: 2026-10-14 23:02:18.417395
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d3e8b1f492'
+down_revision: Union[str, None] = 'f4c8a1d6e250'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_user_type_created', 'notifications',
+            ['user_id', 'notification_type', sa.text('created_at DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        # Redundant with the new index's user_id prefix
+        op.drop_index(
+            'ix_notifications_user_id', table_name='notifications',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_user_id', 'notifications', ['user_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_notifications_user_type_created', table_name='notifications',
+            postgresql_concurrently=True, if_exists=True,
+        )
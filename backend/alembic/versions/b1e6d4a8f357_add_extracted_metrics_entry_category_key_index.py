@@ -0,0 +1,46 @@
+"""add_extracted_metrics_entry_category_key_index
+
+Revision ID: b1e6d4a8f357
+Revises: c8d2f5a7e913
+Create Date: 2026-10-14 18:05:47.291630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b1e6d4a8f357'
+down_revision: Union[str, None] = 'c8d2f5a7e913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_extracted_metrics_entry_category_key', 'extracted_metrics',
+            ['entry_id', 'category', 'key'],
+            unique=False, postgresql_include=['confidence'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        # Redundant with the new index's entry_id prefix
+        op.drop_index(
+            'ix_extracted_metrics_entry_id', table_name='extracted_metrics',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_extracted_metrics_entry_id', 'extracted_metrics', ['entry_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_extracted_metrics_entry_category_key', table_name='extracted_metrics',
+            postgresql_concurrently=True, if_exists=True,
+        )
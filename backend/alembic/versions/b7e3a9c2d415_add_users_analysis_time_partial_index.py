@@ -0,0 +1,39 @@
+"""add_users_analysis_time_partial_index
+
+Revision ID: b7e3a9c2d415
+Revises: 8c2f4d1a9b37
+Create Date: 2026-10-14 14:37:09.284113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3a9c2d415'
+down_revision: Union[str, None] = '8c2f4d1a9b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_analysis_time_partial', 'users', ['analysis_time'],
+            unique=False,
+            postgresql_include=['id', 'timezone'],
+            postgresql_where=sa.text('analysis_time IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_analysis_time_partial', table_name='users',
+            postgresql_concurrently=True, if_exists=True,
+        )
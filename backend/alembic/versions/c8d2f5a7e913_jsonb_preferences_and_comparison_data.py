@@ -0,0 +1,41 @@
+"""jsonb_preferences_and_comparison_data
+
+Revision ID: c8d2f5a7e913
+Revises: a3c7e1d9f024
+Create Date: 2026-10-14 17:40:19.062538
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d2f5a7e913'
+down_revision: Union[str, None] = 'a3c7e1d9f024'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table, column in (('users', 'preferences'), ('daily_scores', 'comparison_data')):
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using=f'{column}::jsonb',
+            server_default=sa.text("'{}'"),
+        )
+
+
+def downgrade() -> None:
+    for table, column in (('users', 'preferences'), ('daily_scores', 'comparison_data')):
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using=f'{column}::json',
+            server_default=None,
+        )
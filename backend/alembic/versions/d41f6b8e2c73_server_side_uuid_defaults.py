@@ -0,0 +1,43 @@
+"""server_side_uuid_defaults
+
+Revision ID: d41f6b8e2c73
+Revises: b7e3a9c2d415
+Create Date: 2026-10-14 16:02:41.517392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f6b8e2c73'
+down_revision: Union[str, None] = 'b7e3a9c2d415'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    'users',
+    'user_goals',
+    'goal_activity_links',
+    'journal_entries',
+    'extracted_metrics',
+    'entry_embeddings',
+    'daily_scores',
+    'score_metrics',
+    'analysis_runs',
+    'notifications',
+)
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is core from Postgres 13; pgcrypto provides it on older servers
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,41 @@
+"""unique_daily_score_per_user_date
+
+Revision ID: d7a2c9e4b816
+Revises: b1e6d4a8f357
+Create Date: 2026-10-14 18:52:03.614927
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a2c9e4b816'
+down_revision: Union[str, None] = 'b1e6d4a8f357'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows that lost a concurrent select-then-insert upsert: keep the newest per day
+DUPLICATE_SCORES = """
+    SELECT id FROM (
+        SELECT id, row_number() OVER (
+            PARTITION BY user_id, score_date ORDER BY created_at DESC, id
+        ) AS rn
+        FROM daily_scores
+    ) ranked
+    WHERE rn > 1
+"""
+
+
+def upgrade() -> None:
+    op.execute(f"DELETE FROM score_metrics WHERE daily_score_id IN ({DUPLICATE_SCORES})")
+    op.execute(f"DELETE FROM daily_scores WHERE id IN ({DUPLICATE_SCORES})")
+    op.create_unique_constraint(
+        'uq_daily_scores_user_date', 'daily_scores', ['user_id', 'score_date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_daily_scores_user_date', 'daily_scores', type_='unique')
@@ -0,0 +1,47 @@
+"""size_short_categorical_columns
+
+Revision ID: e5a8c3f1b692
+Revises: d41f6b8e2c73
+Create Date: 2026-10-14 16:31:08.904215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a8c3f1b692'
+down_revision: Union[str, None] = 'd41f6b8e2c73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ALTER ... TYPE varchar(n) aborts on any longer value; trim legacy rows to fit
+    for table in ('user_goals', 'extracted_metrics'):
+        op.execute(
+            f"UPDATE {table} SET category = left(btrim(category), 32) "
+            "WHERE length(category) > 32"
+        )
+    # Anything that isn't a voice upload was typed in
+    op.execute(
+        "UPDATE journal_entries SET input_source = CASE "
+        "WHEN lower(btrim(input_source)) = 'voice' THEN 'voice' ELSE 'text' END "
+        "WHERE input_source IS NULL OR input_source NOT IN ('text', 'voice')"
+    )
+    op.alter_column('user_goals', 'category', type_=sa.String(length=32), existing_type=sa.String())
+    op.alter_column('extracted_metrics', 'category', type_=sa.String(length=32), existing_type=sa.String())
+    op.alter_column('journal_entries', 'input_source', type_=sa.String(length=8), existing_type=sa.String())
+    op.create_check_constraint(
+        'ck_journal_entries_input_source', 'journal_entries',
+        "input_source IN ('text', 'voice')",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_journal_entries_input_source', 'journal_entries', type_='check')
+    op.alter_column('journal_entries', 'input_source', type_=sa.String(), existing_type=sa.String(length=8))
+    op.alter_column('extracted_metrics', 'category', type_=sa.String(), existing_type=sa.String(length=32))
+    op.alter_column('user_goals', 'category', type_=sa.String(), existing_type=sa.String(length=32))
@@ -0,0 +1,47 @@
+"""cover_daily_scores_user_date_index
+
+Revision ID: e9b4f2c6a173
+Revises: d7a2c9e4b816
+Create Date: 2026-10-14 21:37:09.664218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9b4f2c6a173'
+down_revision: Union[str, None] = 'd7a2c9e4b816'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_daily_scores_user_date_covering', 'daily_scores',
+            ['user_id', sa.text('score_date DESC')],
+            unique=False, postgresql_include=['composite_score', 'verdict'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        # Same key columns as the new index, without the INCLUDE payload
+        op.drop_index(
+            'ix_daily_scores_user_date_desc', table_name='daily_scores',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_daily_scores_user_date_desc', 'daily_scores',
+            ['user_id', sa.text('score_date DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_daily_scores_user_date_covering', table_name='daily_scores',
+            postgresql_concurrently=True, if_exists=True,
+        )
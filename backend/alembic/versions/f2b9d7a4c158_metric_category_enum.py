@@ -0,0 +1,76 @@
+"""metric_category_enum
+
+Revision ID: f2b9d7a4c158
+Revises: e5a8c3f1b692
+Create Date: 2026-10-14 16:48:52.310674
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b9d7a4c158'
+down_revision: Union[str, None] = 'e5a8c3f1b692'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of app.ai_pipeline.schemas.extraction.CategoryLiteral at this revision
+metric_category = postgresql.ENUM(
+    'productivity', 'fitness', 'learning', 'discipline', 'well-being', 'creativity', 'social',
+    name='metric_category',
+)
+
+# Legacy spellings seen before categories were validated; anything else is dropped
+CATEGORY_ALIASES = {
+    'wellbeing': 'well-being',
+    'well_being': 'well-being',
+    'well being': 'well-being',
+    'wellness': 'well-being',
+    'health': 'well-being',
+    'mental health': 'well-being',
+    'work': 'productivity',
+    'exercise': 'fitness',
+    'study': 'learning',
+    'creative': 'creativity',
+}
+
+_VALID = ', '.join(f"'{value}'" for value in metric_category.enums)
+
+
+def upgrade() -> None:
+    # The USING cast aborts on the first value outside the enum, so normalise first
+    op.execute(
+        "UPDATE extracted_metrics SET category = lower(btrim(category)) "
+        "WHERE category IS DISTINCT FROM lower(btrim(category))"
+    )
+    aliases = sa.table('extracted_metrics', sa.column('category', sa.String))
+    for alias, category in CATEGORY_ALIASES.items():
+        op.execute(aliases.update().where(aliases.c.category == alias).values(category=category))
+    # Unmappable metrics (and their goal links, which have no ON DELETE) can't be kept
+    op.execute(
+        "DELETE FROM goal_activity_links WHERE metric_id IN ("
+        f"SELECT id FROM extracted_metrics WHERE category NOT IN ({_VALID}))"
+    )
+    op.execute(f"DELETE FROM extracted_metrics WHERE category NOT IN ({_VALID})")
+
+    metric_category.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        'extracted_metrics', 'category',
+        type_=metric_category,
+        existing_type=sa.String(length=32),
+        postgresql_using='category::metric_category',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'extracted_metrics', 'category',
+        type_=sa.String(length=32),
+        existing_type=metric_category,
+        postgresql_using='category::text',
+    )
+    metric_category.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,46 @@
+"""cover_score_metrics_trend_reads
+
+Revision ID: f4c8a1d6e250
+Revises: e9b4f2c6a173
+Create Date: 2026-10-14 22:14:52.083517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c8a1d6e250'
+down_revision: Union[str, None] = 'e9b4f2c6a173'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_score_metrics_daily_score_category', 'score_metrics',
+            ['daily_score_id', 'category'],
+            unique=False, postgresql_include=['score'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        # Redundant with the new index's daily_score_id prefix
+        op.drop_index(
+            'ix_score_metrics_daily_score_id', table_name='score_metrics',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_score_metrics_daily_score_id', 'score_metrics', ['daily_score_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_score_metrics_daily_score_category', table_name='score_metrics',
+            postgresql_concurrently=True, if_exists=True,
+        )
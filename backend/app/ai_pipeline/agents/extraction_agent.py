@@ -1,35 +1,107 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from functools import lru_cache
+
 import instructor
-from openai import AzureOpenAI
-from app.ai_pipeline.schemas.extraction import ExtractionResult
+import orjson
+from instructor import openai_schema
+from instructor.exceptions import IncompleteOutputException
+from app.ai_pipeline.cache import SEVEN_DAYS, llm_cache, llm_cached
+from app.ai_pipeline.concurrency import gather_bounded
+from app.ai_pipeline.retry import llm_retry, reask_retries
+from app.ai_pipeline.prompts.extraction import (
+    EXTRACTION_CACHED_SYSTEM_PROMPT,
+    EXTRACTION_GROUPED_USER_PREFIX,
+    EXTRACTION_SYSTEM_PROMPT,
+    EXTRACTION_USER_PREFIX,
+    PROMPT_VERSION,
+)
+from app.ai_pipeline.clients import DEFAULT_MAX_TOKENS, Provider, create_instructor_client
+from app.ai_pipeline.schemas.extraction import ExtractionResult, GroupedExtractionResult
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Fitted to observed ExtractionResult sizes (~600-900 tokens for 5-10 activities)
+EXTRACTION_MAX_TOKENS = 1200
+
+# Entries packed into one grouped extraction request; keeps the combined
+# output under DEFAULT_MAX_TOKENS at EXTRACTION_MAX_TOKENS per entry
+GROUPED_ENTRIES_PER_REQUEST = 3
+
+# Terminal states reported by the Batch API
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
 
 class ExtractionAgent:
     """
-    Azure OpenAI-based agent for extracting structured activities from journal text.
+    LLM-based agent for extracting structured activities from journal text.
 
     Uses instructor library for automatic Pydantic parsing and retry logic.
     """
 
-    def __init__(self):
+    def __init__(self, provider: Provider | None = None):
         """
-        Initialize extraction agent with Azure OpenAI credentials from settings.
+        Initialize with the configured LLM provider's credentials.
+
+        Args:
+            provider: "azure" or "anthropic" (defaults to settings.LLM_PROVIDER)
         """
-        if not settings.AZURE_OPENAI_API_KEY:
-            raise ValueError(
-                "AZURE_OPENAI_API_KEY is required. Set it in environment."
-            )
+        self.provider = provider or settings.LLM_PROVIDER
+        # Resolving once up front still fails fast on missing credentials
+        _, self.deployment = create_instructor_client(self.provider)
 
-        # Create Azure OpenAI client and wrap with instructor
-        azure_client = AzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_API_BASE,
-        )
-        self.client = instructor.from_openai(azure_client)
-        self.deployment = settings.AZURE_OPENAI_DEPLOYMENT
+    @property
+    def client(self) -> instructor.AsyncInstructor:
+        """
+        Instructor client on the current event loop's HTTP pool.
 
-    def extract(self, text: str) -> ExtractionResult:
+        Looked up per call rather than stored: the agent is a process-wide
+        singleton, and a client captured at construction would pin the first
+        loop's connection pool.
+        """
+        client, _ = create_instructor_client(self.provider)
+        return client
+
+    def _build_messages(self, text: str, prefix: str = EXTRACTION_USER_PREFIX) -> list[dict]:
+        """
+        Build chat messages shared by real-time and batch requests.
+
+        The static system prompt goes first as its own message so the
+        provider's automatic prefix caching can reuse it across requests.
+        """
+        return [
+            {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+            {"role": "user", "content": "".join((prefix, text))},
+        ]
+
+    def _request_kwargs(self, text: str, prefix: str = EXTRACTION_USER_PREFIX) -> dict:
+        """
+        Provider-specific prompt arguments for a real-time request.
+
+        Anthropic only caches prefixes up to an explicit breakpoint, so the
+        system prompt is sent as a content block marked ephemeral; the
+        cached prefix covers the tool schema and system prompt plus worked
+        examples (over the 1024-token minimum) and only the journal text is
+        billed at the full input rate. Azure caches shared prefixes
+        automatically and keeps the plain system prompt.
+        """
+        if self.provider != "anthropic":
+            return {"messages": self._build_messages(text, prefix)}
+        return {
+            "system": [{
+                "type": "text",
+                "text": EXTRACTION_CACHED_SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            }],
+            "messages": [
+                {"role": "user", "content": "".join((prefix, text))},
+            ],
+        }
+
+    @llm_cached(ExtractionResult, version=PROMPT_VERSION)
+    async def extract(self, text: str) -> ExtractionResult:
         """
         Extract structured activities from journal entry text.
 
@@ -42,39 +114,259 @@ class ExtractionAgent:
         Returns:
             ExtractionResult with list of ExtractedActivity objects
         """
-        system_prompt = """You are an expert at extracting structured, quantifiable activities from personal journal entries.
-
-Your task is to identify activities mentioned in the journal text and extract them with:
-1. Category (productivity, fitness, learning, discipline, well-being, creativity, social)
-2. Key (specific metric name like 'workout_duration', 'hours_deep_work', 'books_read')
-3. Value (numeric value - duration in minutes, count, rating on scale)
-4. Evidence (the exact text snippet that supports this extraction)
-5. Confidence (0-1 score: use 1.0 for explicit numbers, 0.7-0.9 for inferred/estimated values)
-
-Guidelines:
-- Extract ALL quantifiable activities mentioned
-- Convert time mentions to minutes (e.g., "2 hours" → 120)
-- For implicit activities, estimate reasonable values (e.g., "quick workout" → ~20-30 minutes, confidence 0.7)
-- Include evidence text that clearly shows where you got the information
-- Focus on activities that can be measured or counted
-- If multiple related activities, create separate extractions (e.g., "ran 5 miles in 45 minutes" → distance AND duration)
-
-Categories:
-- productivity: work sessions, tasks completed, focus time, meetings
-- fitness: workouts, steps, running distance, gym time
-- learning: study time, courses, books read, lessons
-- discipline: meditation, journaling, habit tracking, routines
-- well-being: sleep hours, mood ratings, stress management, therapy
-- creativity: writing time, art projects, music practice, creative work
-- social: conversations, networking events, quality time with others"""
-
-        user_prompt = f"{system_prompt}\n\nExtract all quantifiable activities from this journal entry:\n\n{text}"
-
-        # Use instructor to get structured output with automatic retries
-        result = self.client.chat.completions.create(
+        try:
+            return await self._create(text, EXTRACTION_MAX_TOKENS)
+        except IncompleteOutputException:
+            logger.warning(
+                f"Extraction hit max_tokens={EXTRACTION_MAX_TOKENS}, retrying with {DEFAULT_MAX_TOKENS}"
+            )
+            return await self._create(text, DEFAULT_MAX_TOKENS)
+
+    @llm_retry
+    async def _create(
+        self,
+        text: str,
+        max_tokens: int,
+        response_model: type = ExtractionResult,
+        prefix: str = EXTRACTION_USER_PREFIX,
+    ):
+        """Run one extraction request and log its output token usage."""
+        # Re-ask on validation errors only; truncation and provider errors surface
+        # immediately (transient ones are retried with backoff by llm_retry)
+        result, completion = await self.client.chat.completions.create_with_completion(
+            model=self.deployment,
+            max_tokens=max_tokens,
+            response_model=response_model,
+            max_retries=reask_retries(),
+            **self._request_kwargs(text, prefix),
+        )
+
+        usage = getattr(completion, "usage", None)
+        output_tokens = getattr(usage, "completion_tokens", None) or getattr(usage, "output_tokens", None)
+        # Anthropic reports cache_read_input_tokens; Azure nests cached_tokens in prompt_tokens_details
+        cached_tokens = getattr(usage, "cache_read_input_tokens", None)
+        if cached_tokens is None:
+            cached_tokens = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None)
+        logger.info(
+            f"Extraction output tokens: {output_tokens} (max_tokens={max_tokens}), "
+            f"cached input tokens: {cached_tokens}"
+        )
+
+        return result
+
+    async def extract_stream(self, text: str) -> AsyncIterator[ExtractionResult]:
+        """
+        Stream partial extraction results as activities are decoded.
+
+        Consumers can start on the first activities while later ones are
+        still being generated; the final yield is the complete result.
+
+        Args:
+            text: Journal entry content (markdown)
+
+        Yields:
+            Partial ExtractionResult objects
+        """
+        stream = self.client.chat.completions.create_partial(
             model=self.deployment,
-            messages=[{"role": "user", "content": user_prompt}],
+            max_tokens=DEFAULT_MAX_TOKENS,
             response_model=ExtractionResult,
+            **self._request_kwargs(text),
         )
+        async for partial in stream:
+            yield partial
 
-        return result
+    async def extract_many(self, texts: list[str], limit: int = 10) -> list[ExtractionResult]:
+        """
+        Extract activities from many journal texts concurrently.
+
+        Requests are bounded by a semaphore so batch jobs don't trip
+        the deployment's rate limits; transient failures are retried
+        per request.
+
+        Args:
+            texts: Journal entry contents
+            limit: Maximum number of in-flight requests
+
+        Returns:
+            ExtractionResult per text, in input order
+        """
+        return await gather_bounded(self.extract, texts, limit=limit)
+
+    async def extract_grouped(
+        self,
+        texts: list[str],
+        group_size: int = GROUPED_ENTRIES_PER_REQUEST,
+        limit: int = 10,
+    ) -> list[ExtractionResult | None]:
+        """
+        Extract activities from many texts, several entries per request.
+
+        For backfills on providers without a Batch API: entries are sent
+        group_size at a time as <entry id="N"> blocks, so the system prompt
+        and round trip are paid once per group. Like extract_batch(), texts
+        already in extract()'s response cache are skipped and per-entry
+        results are written back under the same keys.
+
+        Args:
+            texts: Journal entry contents
+            group_size: Entries per request
+            limit: Maximum number of in-flight requests
+
+        Returns:
+            ExtractionResult per text in input order, None where the model
+            returned nothing for that entry
+        """
+        if not texts:
+            return []
+
+        keys = [ExtractionAgent.extract.cache_key(self, text) for text in texts]
+        cached = await asyncio.gather(*(llm_cache.get(key) for key in keys))
+        results: list[ExtractionResult | None] = [
+            None if value is None else ExtractionResult.model_validate_json(value)
+            for value in cached
+        ]
+        pending = [index for index, result in enumerate(results) if result is None]
+        groups = [pending[i:i + group_size] for i in range(0, len(pending), group_size)]
+
+        async def run(group: list[int]) -> None:
+            for index, result in (await self._extract_group(group, texts)).items():
+                results[index] = result
+                await llm_cache.set(keys[index], result.model_dump_json(), SEVEN_DAYS)
+
+        await gather_bounded(run, groups, limit=limit)
+        logger.info(
+            f"Extracted {len(pending)} entries in {len(groups)} grouped requests "
+            f"({len(texts) - len(pending)} cached)"
+        )
+        return results
+
+    async def _extract_group(self, group: list[int], texts: list[str]) -> dict[int, ExtractionResult]:
+        """Run one grouped request; maps text index to its result."""
+        content = "\n\n".join(
+            f'<entry id="{index}">\n{texts[index]}\n</entry>' for index in group
+        )
+        try:
+            grouped = await self._create(
+                content,
+                min(EXTRACTION_MAX_TOKENS * len(group), DEFAULT_MAX_TOKENS),
+                response_model=GroupedExtractionResult,
+                prefix=EXTRACTION_GROUPED_USER_PREFIX,
+            )
+        except IncompleteOutputException:
+            logger.warning(f"Grouped extraction of {len(group)} entries truncated, extracting one by one")
+            return {index: await self.extract(texts[index]) for index in group}
+
+        wanted = set(group)
+        return {
+            item.entry_id: ExtractionResult(activities=item.activities, raw_text=texts[item.entry_id])
+            for item in grouped.entries
+            if item.entry_id in wanted
+        }
+
+    async def extract_batch(
+        self, texts: list[str], poll_interval: float = 60.0
+    ) -> list[ExtractionResult | None]:
+        """
+        Extract activities from many texts via the Azure OpenAI Batch API.
+
+        Batch jobs run at half the per-token cost with a 24h completion
+        window, so this path is for backfills and scheduled re-extraction;
+        user-facing submissions should keep using extract().
+
+        Requests use the same prompt and tool-call schema instructor sends
+        for ExtractionResult, so outputs parse identically. Texts already
+        in extract()'s response cache are served from it and left out of
+        the batch; batch results are written back under the same keys.
+
+        Args:
+            texts: Journal entry contents
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            ExtractionResult per text in input order, None where the
+            request failed or its output could not be parsed
+
+        Raises:
+            ValueError: If the agent is not using the Azure provider
+            RuntimeError: If the batch job does not complete
+        """
+        if self.provider != "azure":
+            raise ValueError("Batch extraction is only supported for the azure provider")
+        if not texts:
+            return []
+
+        keys = [ExtractionAgent.extract.cache_key(self, text) for text in texts]
+        cached = await asyncio.gather(*(llm_cache.get(key) for key in keys))
+        results: list[ExtractionResult | None] = [
+            None if value is None else ExtractionResult.model_validate_json(value)
+            for value in cached
+        ]
+        pending = [index for index, result in enumerate(results) if result is None]
+        if not pending:
+            logger.info(f"All {len(texts)} extraction batch texts served from cache")
+            return results
+
+        # Not under llm_retry: let the SDK retry transient errors while polling a long batch
+        azure_client = self.client.client.with_options(max_retries=2)
+
+        schema = openai_schema(ExtractionResult).openai_schema
+        lines = []
+        for index in pending:
+            text = texts[index]
+            lines.append(orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": {
+                    "model": self.deployment,
+                    "messages": self._build_messages(text),
+                    "tools": [{"type": "function", "function": schema}],
+                    "tool_choice": {"type": "function", "function": {"name": schema["name"]}},
+                },
+            }))
+
+        batch_file = await azure_client.files.create(
+            file=("extraction_batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = await azure_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(
+            f"Submitted extraction batch {batch.id} with {len(pending)} requests "
+            f"({len(texts) - len(pending)} cached)"
+        )
+
+        while batch.status not in BATCH_FINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await azure_client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Extraction batch {batch.id} ended with status {batch.status}")
+
+        output = await azure_client.files.content(batch.output_file_id)
+
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            index = int(record["custom_id"])
+            try:
+                message = record["response"]["body"]["choices"][0]["message"]
+                arguments = message["tool_calls"][0]["function"]["arguments"]
+                results[index] = ExtractionResult.model_validate_json(arguments)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                logger.warning(f"Batch {batch.id} request {index} failed: {record.get('error') or e}")
+                continue
+            await llm_cache.set(keys[index], results[index].model_dump_json(), SEVEN_DAYS)
+
+        return results
+
+
+@lru_cache(maxsize=None)
+def get_extraction_agent(provider: Provider | None = None) -> ExtractionAgent:
+    """Process-wide ExtractionAgent per provider (None = settings.LLM_PROVIDER)."""
+    return ExtractionAgent(provider)
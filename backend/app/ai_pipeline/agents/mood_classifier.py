@@ -1,9 +1,79 @@
 """Mood classification agent for safety-first verdict generation."""
-import instructor
-from openai import AzureOpenAI
+import re
+from types import MappingProxyType
+
+from app.ai_pipeline.clients import DEFAULT_MAX_TOKENS, Provider, create_instructor_client, fast_model_for
 from app.core.config import settings
 from app.ai_pipeline.schemas.mood import MoodClassification, MoodLevel
-from app.ai_pipeline.prompts.mood_classification import MOOD_CLASSIFICATION_PROMPT
+from app.ai_pipeline.cache import llm_cached
+from app.ai_pipeline.retry import llm_retry, reask_retries
+from app.ai_pipeline.prompts.mood_classification import MOOD_CLASSIFICATION_PROMPT, PROMPT_VERSION
+
+# Keyword patterns for MockMoodClassifier, one alternation per signal type
+CRISIS_KEYWORDS = [
+    "self-harm", "self harm", "suicide", "suicidal", "kill myself", "want to die", "end it all",
+    "hopeless", "nothing matters", "what's the point", "no one cares", "completely alone",
+]
+STRUGGLING_KEYWORDS = ["tired", "failed", "missed", "frustrated", "exhausted", "disappointed"]
+THRIVING_KEYWORDS = ["great", "amazing", "crushed it", "killed it", "achieved", "accomplished"]
+
+_CRISIS_RE = re.compile("|".join(map(re.escape, CRISIS_KEYWORDS)))
+_STRUGGLING_RE = re.compile("|".join(map(re.escape, STRUGGLING_KEYWORDS)))
+_THRIVING_RE = re.compile("|".join(map(re.escape, THRIVING_KEYWORDS)))
+
+# Entries at least this long always go to the LLM; distress is often phrased
+# without any keyword ("better off without me"), so only one-liners qualify
+FAST_PATH_MAX_LENGTH = 40
+
+# Below this confidence the cheap model's answer is re-checked by the full model
+CASCADE_CONFIDENCE = 0.6
+
+
+def _keyword_classification(journal_content: str, confidence: float) -> MoodClassification:
+    """Classify mood from keyword hits alone."""
+    content_lower = journal_content.lower()
+
+    crisis_flag = _CRISIS_RE.search(content_lower) is not None
+
+    # Unique keyword hits in order of first appearance
+    negative_signals = list(dict.fromkeys(_STRUGGLING_RE.findall(content_lower)))
+    positive_signals = list(dict.fromkeys(_THRIVING_RE.findall(content_lower)))
+
+    if crisis_flag or len(negative_signals) > len(positive_signals):
+        level = MoodLevel.STRUGGLING
+    elif len(positive_signals) > len(negative_signals):
+        level = MoodLevel.THRIVING
+    else:
+        level = MoodLevel.STABLE
+
+    return MoodClassification(
+        level=level,
+        confidence=confidence,
+        crisis_flag=crisis_flag,
+        reasoning="Mock classification based on keyword matching",
+        positive_signals=positive_signals,
+        negative_signals=negative_signals
+    )
+
+
+_TIER_MAP = MappingProxyType({
+    MoodLevel.STRUGGLING: "supportive_only",
+    MoodLevel.STABLE: "light_edge",
+    MoodLevel.THRIVING: "full_edge",
+})
+
+
+def get_messaging_tier(classification: MoodClassification) -> str:
+    """
+    Determine messaging tier based on classification.
+
+    Returns:
+        "supportive_only" - No edge, only encouragement
+        "light_edge" - Normal feedback with gentle challenge
+        "full_edge" - Can handle direct challenge, celebrate wins hard
+    """
+    # CRITICAL: Crisis flag always returns supportive_only
+    return "supportive_only" if classification.crisis_flag else _TIER_MAP[classification.level]
 
 
 class MoodClassifier:
@@ -21,22 +91,41 @@ class MoodClassifier:
     Crisis flag overrides everything - if detected, always supportive only.
     """
 
-    def __init__(self):
+    def __init__(self, provider: Provider | None = None):
         """
-        Initialize mood classifier with Azure OpenAI credentials from settings.
+        Initialize with the configured LLM provider's credentials.
+
+        Args:
+            provider: "azure" or "anthropic" (defaults to settings.LLM_PROVIDER)
         """
-        if not settings.AZURE_OPENAI_API_KEY:
-            raise ValueError(
-                "AZURE_OPENAI_API_KEY is required. Set it in environment."
-            )
+        self.provider = provider or settings.LLM_PROVIDER
+        self.client, self.fallback_deployment = create_instructor_client(self.provider)
+        # Classification runs on the cheaper model; the full model is the cascade fallback
+        self.deployment = fast_model_for(self.provider)
 
-        azure_client = AzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_API_BASE,
-        )
-        self.client = instructor.from_openai(azure_client)
-        self.deployment = settings.AZURE_OPENAI_DEPLOYMENT
+    def _fast_path(self, journal_content: str) -> MoodClassification | None:
+        """
+        Classify very short, unambiguous entries locally.
+
+        Returns None (use the LLM) when any crisis keyword matches, when no
+        signal keyword matches at all, when struggling and thriving signals
+        conflict, or when the entry is long enough that keywords are an
+        unreliable summary. The heuristic never grants THRIVING (full edge);
+        positive-only entries are capped at STABLE.
+        """
+        if len(journal_content) >= FAST_PATH_MAX_LENGTH:
+            return None
+
+        result = _keyword_classification(journal_content, confidence=0.6)
+        has_positive = bool(result.positive_signals)
+        has_negative = bool(result.negative_signals)
+        if result.crisis_flag or has_positive == has_negative:
+            return None
+
+        if result.level == MoodLevel.THRIVING:
+            result.level = MoodLevel.STABLE
+        result.reasoning = "Keyword heuristic: short entry with one-sided, non-crisis signals"
+        return result
 
     async def classify(
         self,
@@ -46,10 +135,57 @@ class MoodClassifier:
         """
         Classify mood from journal content.
 
+        Obvious non-crisis entries are classified locally; everything
+        else goes to the LLM.
+
         Args:
             journal_content: The journal entry text to analyze
             score_context: Optional context about today's scores
 
+        Returns:
+            MoodClassification with level, confidence, and crisis_flag
+        """
+        result = self._fast_path(journal_content)
+        if result is not None:
+            return result
+
+        return await self._classify_llm(journal_content, score_context)
+
+    @llm_cached(MoodClassification, version=PROMPT_VERSION)
+    async def _classify_llm(
+        self,
+        journal_content: str,
+        score_context: str | None = None
+    ) -> MoodClassification:
+        """
+        Classify mood with the cheaper model, escalating when unsure.
+
+        Low-confidence results are re-run on the full model.
+        """
+        result = await self.classify_with_model(journal_content, self.deployment, score_context)
+
+        if result.confidence < CASCADE_CONFIDENCE and self.fallback_deployment != self.deployment:
+            result = await self.classify_with_model(
+                journal_content, self.fallback_deployment, score_context
+            )
+
+        return result
+
+    @llm_retry
+    async def classify_with_model(
+        self,
+        journal_content: str,
+        model: str,
+        score_context: str | None = None
+    ) -> MoodClassification:
+        """
+        Classify mood with a specific model/deployment (uncached).
+
+        Args:
+            journal_content: The journal entry text to analyze
+            model: Model or deployment name to use
+            score_context: Optional context about today's scores
+
         Returns:
             MoodClassification with level, confidence, and crisis_flag
         """
@@ -59,32 +195,19 @@ class MoodClassifier:
         )
 
         # Use instructor for structured output
-        result = self.client.chat.completions.create(
-            model=self.deployment,
+        result = await self.client.chat.completions.create(
+            model=model,
+            max_tokens=DEFAULT_MAX_TOKENS,
             messages=[{"role": "user", "content": prompt}],
-            response_model=MoodClassification
+            response_model=MoodClassification,
+            max_retries=reask_retries(),
         )
 
         return result
 
     def get_messaging_tier(self, classification: MoodClassification) -> str:
-        """
-        Determine messaging tier based on classification.
-
-        Returns:
-            "supportive_only" - No edge, only encouragement
-            "light_edge" - Normal feedback with gentle challenge
-            "full_edge" - Can handle direct challenge, celebrate wins hard
-        """
-        # CRITICAL: Crisis flag always returns supportive_only
-        if classification.crisis_flag:
-            return "supportive_only"
-
-        return {
-            MoodLevel.STRUGGLING: "supportive_only",
-            MoodLevel.STABLE: "light_edge",
-            MoodLevel.THRIVING: "full_edge"
-        }[classification.level]
+        """Determine messaging tier based on classification."""
+        return get_messaging_tier(classification)
 
 
 class MockMoodClassifier:
@@ -94,48 +217,14 @@ class MockMoodClassifier:
     Returns predictable classifications based on simple keyword matching.
     """
 
-    def classify(
+    async def classify(
         self,
         journal_content: str,
         score_context: str | None = None
     ) -> MoodClassification:
-        """Mock classification based on keywords (sync for testing)."""
-        content_lower = journal_content.lower()
-
-        # Check for crisis indicators
-        crisis_keywords = ["self-harm", "suicide", "hopeless", "nothing matters", "what's the point"]
-        crisis_flag = any(kw in content_lower for kw in crisis_keywords)
-
-        # Simple keyword-based classification
-        struggling_keywords = ["tired", "failed", "missed", "frustrated", "exhausted", "disappointed"]
-        thriving_keywords = ["great", "amazing", "crushed it", "killed it", "achieved", "accomplished"]
-
-        negative_signals = [kw for kw in struggling_keywords if kw in content_lower]
-        positive_signals = [kw for kw in thriving_keywords if kw in content_lower]
-
-        if crisis_flag or len(negative_signals) > len(positive_signals):
-            level = MoodLevel.STRUGGLING
-        elif len(positive_signals) > len(negative_signals):
-            level = MoodLevel.THRIVING
-        else:
-            level = MoodLevel.STABLE
-
-        return MoodClassification(
-            level=level,
-            confidence=0.7,
-            crisis_flag=crisis_flag,
-            reasoning="Mock classification based on keyword matching",
-            positive_signals=positive_signals,
-            negative_signals=negative_signals
-        )
+        """Mock classification based on keywords."""
+        return _keyword_classification(journal_content, confidence=0.7)
 
     def get_messaging_tier(self, classification: MoodClassification) -> str:
         """Same logic as real classifier."""
-        if classification.crisis_flag:
-            return "supportive_only"
-
-        return {
-            MoodLevel.STRUGGLING: "supportive_only",
-            MoodLevel.STABLE: "light_edge",
-            MoodLevel.THRIVING: "full_edge"
-        }[classification.level]
+        return get_messaging_tier(classification)
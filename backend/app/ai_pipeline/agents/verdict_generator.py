@@ -1,36 +1,98 @@
-"""Verdict generation agent using Azure OpenAI with instructor."""
-import instructor
-from openai import AzureOpenAI
+"""Verdict generation agent using instructor-patched LLM clients."""
+from collections.abc import AsyncIterator
+
+from app.ai_pipeline.clients import DEFAULT_MAX_TOKENS, Provider, create_instructor_client
 from app.core.config import settings
 from app.ai_pipeline.schemas.verdict import Verdict, VerdictInput, VerdictType, ActivityReference, TomorrowAction
-from app.ai_pipeline.prompts.verdict_generation import build_verdict_prompt
+from app.ai_pipeline.cache import llm_cached
+from app.ai_pipeline.retry import llm_retry, reask_retries
+from app.ai_pipeline.prompts.verdict_generation import build_verdict_prompt, PROMPT_VERSION
+
+
+# Static (headline, message) pairs for MockVerdictGenerator, by tone tier and verdict
+_MOCK_TONE_MESSAGES: dict[str, dict[VerdictType, tuple[str, str]]] = {
+    "supportive_only": {
+        VerdictType.BETTER: (
+            "You made progress today.",
+            "Every step forward counts. You showed up and that matters. Keep nurturing this momentum."
+        ),
+        VerdictType.SAME: (
+            "Steady as you go.",
+            "Maintaining is its own kind of progress. You held the line today."
+        ),
+        VerdictType.WORSE: (
+            "A rest day for your momentum.",
+            "That's okay - even the best have off days. Tomorrow is a fresh start."
+        ),
+        VerdictType.FIRST_DAY: (
+            "Your journey begins.",
+            "Welcome! Today marks the first step. Showing up is the hardest part, and you did it."
+        ),
+    },
+    "light_edge": {
+        VerdictType.BETTER: (
+            "You moved the needle today.",
+            "Nice work showing up. That effort puts you ahead of yesterday. Can you build on it tomorrow?"
+        ),
+        VerdictType.SAME: (
+            "Holding steady.",
+            "Not bad, not great. Consistency matters, but tomorrow's a chance to push a bit harder."
+        ),
+        VerdictType.WORSE: (
+            "Not your strongest showing.",
+            "What got in the way? Tomorrow's a chance to get back on track."
+        ),
+        VerdictType.FIRST_DAY: (
+            "Day one is done.",
+            "You've started. That's more than most. Now let's see what day two brings."
+        ),
+    },
+    "full_edge": {
+        VerdictType.BETTER: (
+            "You showed up harder than yesterday.",
+            "This is how you become someone different. Keep this energy."
+        ),
+        VerdictType.SAME: (
+            "Treading water.",
+            "Same as yesterday means no growth. What's holding you back from pushing harder?"
+        ),
+        VerdictType.WORSE: (
+            "Remember those goals?",
+            "They didn't take a day off. What happened? Tomorrow, no excuses."
+        ),
+        VerdictType.FIRST_DAY: (
+            "Day one. Let's see if there's a day two.",
+            "Starting is easy. Continuing is where most people fail. Prove them wrong."
+        ),
+    },
+}
+
+_MOCK_FALLBACK_MESSAGE = ("Today happened.", "Check in tomorrow.")
 
 
 class VerdictGenerator:
     """
     Generates emotional verdicts with activity-specific messaging.
 
-    Uses Azure OpenAI to create personalized daily verdicts that:
+    Uses the configured LLM provider to create personalized daily verdicts that:
     - Reference specific activities (never generic)
     - Adapt tone based on mood tier
     - Include actionable guidance for tomorrow
     """
 
-    def __init__(self):
-        """Initialize with Azure OpenAI credentials from settings."""
-        if not settings.AZURE_OPENAI_API_KEY:
-            raise ValueError(
-                "AZURE_OPENAI_API_KEY is required. Set it in environment."
-            )
-        azure_client = AzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_API_BASE,
-        )
-        self.client = instructor.from_openai(azure_client)
-        self.deployment = settings.AZURE_OPENAI_DEPLOYMENT
+    def __init__(self, provider: Provider | None = None):
+        """
+        Initialize with the configured LLM provider's credentials.
+
+        Args:
+            provider: "azure" or "anthropic" (defaults to settings.LLM_PROVIDER)
+        """
+        self.provider = provider or settings.LLM_PROVIDER
+        self.client, self.deployment = create_instructor_client(self.provider)
 
-    def generate(
+    @llm_cached(Verdict, version=PROMPT_VERSION)
+    @llm_retry
+    async def generate(
         self,
         verdict_input: VerdictInput,
         tone_tier: str
@@ -56,16 +118,58 @@ class VerdictGenerator:
             tone_tier=tone_tier
         )
 
-        result = self.client.chat.completions.create(
+        result = await self.client.chat.completions.create(
             model=self.deployment,
+            max_tokens=DEFAULT_MAX_TOKENS,
             messages=[{"role": "user", "content": prompt}],
-            response_model=Verdict
+            response_model=Verdict,
+            max_retries=reask_retries(),
         )
 
         # Inject the tone that was applied for transparency
         result.tone_applied = tone_tier
         return result
 
+    async def generate_stream(
+        self,
+        verdict_input: VerdictInput,
+        tone_tier: str
+    ) -> AsyncIterator[Verdict]:
+        """
+        Stream progressively completed verdicts as tokens arrive.
+
+        Each yielded object is a partial Verdict whose fields fill in as
+        generation proceeds, so the headline can be shown before the
+        message finishes. Streamed results bypass the response cache.
+
+        Args:
+            verdict_input: Score data and activities
+            tone_tier: "supportive_only", "light_edge", or "full_edge"
+
+        Yields:
+            Partial Verdict objects, the last one complete
+        """
+        prompt = build_verdict_prompt(
+            verdict_type=verdict_input.verdict_type.value,
+            today_score=verdict_input.today_score,
+            yesterday_score=verdict_input.yesterday_score,
+            score_delta=verdict_input.score_delta,
+            streak_days=verdict_input.streak_days,
+            activities=verdict_input.activities,
+            goal_categories=verdict_input.goal_categories,
+            tone_tier=tone_tier
+        )
+
+        stream = self.client.chat.completions.create_partial(
+            model=self.deployment,
+            max_tokens=DEFAULT_MAX_TOKENS,
+            messages=[{"role": "user", "content": prompt}],
+            response_model=Verdict
+        )
+        async for partial in stream:
+            partial.tone_applied = tone_tier
+            yield partial
+
 
 class MockVerdictGenerator:
     """
@@ -74,7 +178,7 @@ class MockVerdictGenerator:
     Returns predictable verdicts based on input.
     """
 
-    def generate(
+    async def generate(
         self,
         verdict_input: VerdictInput,
         tone_tier: str
@@ -101,66 +205,8 @@ class MockVerdictGenerator:
                 )
             )
 
-        # Generate tone-appropriate messages
-        tone_messages = {
-            "supportive_only": {
-                VerdictType.BETTER: (
-                    "You made progress today.",
-                    "Every step forward counts. You showed up and that matters. Keep nurturing this momentum."
-                ),
-                VerdictType.SAME: (
-                    "Steady as you go.",
-                    "Maintaining is its own kind of progress. You held the line today."
-                ),
-                VerdictType.WORSE: (
-                    "A rest day for your momentum.",
-                    "That's okay - even the best have off days. Tomorrow is a fresh start."
-                ),
-                VerdictType.FIRST_DAY: (
-                    "Your journey begins.",
-                    "Welcome! Today marks the first step. Showing up is the hardest part, and you did it."
-                ),
-            },
-            "light_edge": {
-                VerdictType.BETTER: (
-                    "You moved the needle today.",
-                    "Nice work showing up. That effort puts you ahead of yesterday. Can you build on it tomorrow?"
-                ),
-                VerdictType.SAME: (
-                    "Holding steady.",
-                    "Not bad, not great. Consistency matters, but tomorrow's a chance to push a bit harder."
-                ),
-                VerdictType.WORSE: (
-                    "Not your strongest showing.",
-                    "What got in the way? Tomorrow's a chance to get back on track."
-                ),
-                VerdictType.FIRST_DAY: (
-                    "Day one is done.",
-                    "You've started. That's more than most. Now let's see what day two brings."
-                ),
-            },
-            "full_edge": {
-                VerdictType.BETTER: (
-                    "You showed up harder than yesterday.",
-                    "This is how you become someone different. Keep this energy."
-                ),
-                VerdictType.SAME: (
-                    "Treading water.",
-                    "Same as yesterday means no growth. What's holding you back from pushing harder?"
-                ),
-                VerdictType.WORSE: (
-                    "Remember those goals?",
-                    "They didn't take a day off. What happened? Tomorrow, no excuses."
-                ),
-                VerdictType.FIRST_DAY: (
-                    "Day one. Let's see if there's a day two.",
-                    "Starting is easy. Continuing is where most people fail. Prove them wrong."
-                ),
-            },
-        }
-
-        messages = tone_messages.get(tone_tier, tone_messages["light_edge"])
-        headline, message = messages.get(verdict_input.verdict_type, ("Today happened.", "Check in tomorrow."))
+        messages = _MOCK_TONE_MESSAGES.get(tone_tier, _MOCK_TONE_MESSAGES["light_edge"])
+        headline, message = messages.get(verdict_input.verdict_type, _MOCK_FALLBACK_MESSAGE)
 
         return Verdict(
             verdict_type=verdict_input.verdict_type,
@@ -176,3 +222,11 @@ class MockVerdictGenerator:
             ],
             tone_applied=tone_tier
         )
+
+    async def generate_stream(
+        self,
+        verdict_input: VerdictInput,
+        tone_tier: str
+    ) -> AsyncIterator[Verdict]:
+        """Yield the mock verdict as a single complete event."""
+        yield await self.generate(verdict_input, tone_tier)
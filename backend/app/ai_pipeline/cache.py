@@ -0,0 +1,77 @@
+"""Response caching for LLM agent calls."""
+import dataclasses
+import functools
+import logging
+
+import orjson
+from pydantic import BaseModel
+
+from app.core.cache import TwoTierCache, make_key
+
+logger = logging.getLogger(__name__)
+
+ONE_DAY = 24 * 3600
+SEVEN_DAYS = 7 * ONE_DAY
+
+llm_cache = TwoTierCache("llm")
+
+
+def _key_part(value) -> str:
+    """Render an argument deterministically for inclusion in a cache key."""
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    if dataclasses.is_dataclass(value):
+        return orjson.dumps(value).decode()
+    return str(value)
+
+
+def llm_cached(response_model: type[BaseModel], ttl: int = SEVEN_DAYS, version: str = ""):
+    """
+    Cache an async agent method's structured result.
+
+    The key covers the agent class, its deployment, the response model's
+    JSON schema, an optional prompt version and every call argument, so
+    changing any of them naturally invalidates old entries. The wrapper's
+    cache_key(self, *args, **kwargs) exposes the same key so bulk paths
+    can read and fill the cache for calls they make another way.
+
+    Args:
+        response_model: Pydantic model the method returns
+        ttl: Time-to-live in seconds (default 7 days)
+        version: Prompt version to fold into the key
+    """
+    schema_hash = make_key(
+        orjson.dumps(response_model.model_json_schema(), option=orjson.OPT_SORT_KEYS).decode()
+    )
+
+    def build_key(self, args, kwargs) -> str:
+        return make_key(
+            type(self).__name__,
+            getattr(self, "deployment", ""),
+            schema_hash,
+            version,
+            *(_key_part(arg) for arg in args),
+            *(f"{name}={_key_part(value)}" for name, value in sorted(kwargs.items())),
+        )
+
+    def cache_key(self, *args, **kwargs) -> str:
+        return build_key(self, args, kwargs)
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            key = build_key(self, args, kwargs)
+
+            cached = await llm_cache.get(key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit for {method.__qualname__}")
+                return response_model.model_validate_json(cached)
+
+            result = await method(self, *args, **kwargs)
+            await llm_cache.set(key, result.model_dump_json(), ttl)
+            return result
+
+        wrapper.cache_key = cache_key
+        return wrapper
+
+    return decorator
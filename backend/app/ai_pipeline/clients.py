@@ -0,0 +1,149 @@
+"""Shared LLM client construction for AI pipeline agents."""
+import asyncio
+from functools import lru_cache
+from typing import Literal
+
+import httpx
+import instructor
+from anthropic import AsyncAnthropic
+from openai import AsyncAzureOpenAI
+
+from app.core.config import settings
+
+Provider = Literal["azure", "anthropic"]
+
+# Anthropic requires an explicit output cap; applied to both providers
+DEFAULT_MAX_TOKENS = 4096
+
+# Transient errors are retried with backoff by retry.llm_retry; SDK-level
+# retries would multiply its attempts
+SDK_MAX_RETRIES = 0
+
+_shared_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP client used by every LLM SDK client.
+
+    Sharing one connection pool means agents constructed per request
+    reuse warm keep-alive connections instead of paying a new TLS
+    handshake each time. Pooled connections belong to the event loop that
+    opened them, so a caller on a different loop (e.g. a Celery task run
+    with asyncio.run) gets a fresh client instead of the old loop's pool.
+    """
+    global _shared_http_client, _http_client_loop
+    loop = _running_loop()
+    if _shared_http_client is None or (
+        loop is not None and _http_client_loop is not None and loop is not _http_client_loop
+    ):
+        # The previous loop's pool can't be closed from here; it is dropped with its loop
+        _shared_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+        _http_client_loop = loop
+    elif _http_client_loop is None:
+        _http_client_loop = loop
+    return _shared_http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client's pool; called from the app lifespan on shutdown."""
+    global _shared_http_client, _http_client_loop
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+        _http_client_loop = None
+
+
+def _azure_client(http_client: httpx.AsyncClient) -> AsyncAzureOpenAI:
+    if not settings.AZURE_OPENAI_API_KEY:
+        raise ValueError(
+            "AZURE_OPENAI_API_KEY is required. Set it in environment."
+        )
+    return AsyncAzureOpenAI(
+        api_key=settings.AZURE_OPENAI_API_KEY,
+        api_version=settings.AZURE_OPENAI_API_VERSION,
+        azure_endpoint=settings.AZURE_OPENAI_API_BASE,
+        http_client=http_client,
+        max_retries=SDK_MAX_RETRIES,
+    )
+
+
+def _anthropic_client(http_client: httpx.AsyncClient) -> AsyncAnthropic:
+    if not settings.ANTHROPIC_API_KEY:
+        raise ValueError(
+            "ANTHROPIC_API_KEY is required. Set it in environment."
+        )
+    return AsyncAnthropic(
+        api_key=settings.ANTHROPIC_API_KEY,
+        http_client=http_client,
+        max_retries=SDK_MAX_RETRIES,
+    )
+
+
+# Keyed on the HTTP client so a rebuilt pool also rebuilds the SDK client on top of it
+@lru_cache(maxsize=1)
+def _azure_instructor(http_client: httpx.AsyncClient) -> instructor.AsyncInstructor:
+    return instructor.from_openai(_azure_client(http_client))
+
+
+@lru_cache(maxsize=1)
+def _anthropic_instructor(http_client: httpx.AsyncClient) -> instructor.AsyncInstructor:
+    return instructor.from_anthropic(
+        _anthropic_client(http_client), mode=instructor.Mode.ANTHROPIC_TOOLS
+    )
+
+
+def get_azure_instructor() -> instructor.AsyncInstructor:
+    """Process-wide instructor client for Azure OpenAI."""
+    return _azure_instructor(get_http_client())
+
+
+def get_anthropic_instructor() -> instructor.AsyncInstructor:
+    """Process-wide instructor client for Anthropic."""
+    return _anthropic_instructor(get_http_client())
+
+
+def create_instructor_client(provider: Provider) -> tuple[instructor.AsyncInstructor, str]:
+    """
+    Return the shared instructor-patched async client for a provider.
+
+    Clients are built once per process (and event loop), so constructing
+    agents per request does not re-patch or open new connection pools.
+
+    Args:
+        provider: "azure" or "anthropic"
+
+    Returns:
+        Tuple of (instructor client, model/deployment name)
+
+    Raises:
+        ValueError: If the provider is unknown or its API key is missing
+    """
+    if provider == "azure":
+        return get_azure_instructor(), settings.AZURE_OPENAI_DEPLOYMENT
+    if provider == "anthropic":
+        return get_anthropic_instructor(), settings.ANTHROPIC_MODEL
+    raise ValueError(f"Unknown LLM provider: {provider}")
+
+
+def fast_model_for(provider: Provider) -> str:
+    """
+    Cheaper model/deployment for classification-style tasks.
+
+    Falls back to the main Azure deployment when no dedicated mood
+    deployment is configured.
+    """
+    if provider == "azure":
+        return settings.AZURE_OPENAI_MOOD_DEPLOYMENT or settings.AZURE_OPENAI_DEPLOYMENT
+    return settings.ANTHROPIC_MOOD_MODEL
@@ -0,0 +1,35 @@
+"""Bounded concurrency helpers for LLM agent calls."""
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def gather_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int = 10,
+) -> list[R]:
+    """
+    Run func over items concurrently with at most `limit` calls in flight.
+
+    Transient API errors are retried inside the agent methods themselves
+    (see app.ai_pipeline.retry).
+
+    Args:
+        func: Async callable applied to each item
+        items: Inputs to process
+        limit: Maximum number of concurrent calls
+
+    Returns:
+        Results in the same order as items
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(run(item) for item in items))
@@ -0,0 +1,26 @@
+"""Shared helpers for composing AI agents in a journal analysis."""
+import logging
+
+from app.ai_pipeline.agents.mood_classifier import MockMoodClassifier
+from app.ai_pipeline.retry import AgentUnavailableError
+from app.ai_pipeline.schemas.mood import MoodClassification
+
+logger = logging.getLogger(__name__)
+
+
+async def classify_with_fallback(
+    mood_classifier,
+    text: str,
+    score_context: str | None = None,
+) -> MoodClassification:
+    """
+    Classify mood, degrading to keyword classification if the LLM is unavailable.
+
+    Keeps verdicts shipping during provider outages; the keyword
+    classifier still honours crisis keywords.
+    """
+    try:
+        return await mood_classifier.classify(text, score_context)
+    except AgentUnavailableError as e:
+        logger.warning(f"Mood classifier unavailable, using keyword fallback: {e}")
+        return await MockMoodClassifier().classify(text, score_context)
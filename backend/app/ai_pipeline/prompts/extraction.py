@@ -0,0 +1,85 @@
+"""Extraction prompt for journal activity extraction."""
+
+EXTRACTION_SYSTEM_PROMPT = """You are an expert at extracting structured, quantifiable activities from personal journal entries.
+
+Your task is to identify activities mentioned in the journal text and extract them with:
+1. Category (productivity, fitness, learning, discipline, well-being, creativity, social)
+2. Key (specific metric name like 'workout_duration', 'deep_work_duration', 'books_read')
+3. Value (numeric value - duration in minutes, count, rating on scale)
+4. Evidence (the exact text snippet that supports this extraction)
+5. Confidence (0-1 score: use 1.0 for explicit numbers, 0.7-0.9 for inferred/estimated values)
+
+Guidelines:
+- Extract ALL quantifiable activities mentioned
+- Convert time mentions to minutes (e.g., "2 hours" → 120)
+- For implicit activities, estimate reasonable values (e.g., "quick workout" → ~20-30 minutes, confidence 0.7)
+- Include evidence text that clearly shows where you got the information
+- Focus on activities that can be measured or counted
+- If multiple related activities, create separate extractions (e.g., "ran 5 miles in 45 minutes" → distance AND duration)
+
+Categories:
+- productivity: work sessions, tasks completed, focus time, meetings
+- fitness: workouts, steps, running distance, gym time
+- learning: study time, courses, books read, lessons
+- discipline: meditation, journaling, habit tracking, routines
+- well-being: sleep hours, mood ratings, stress management, therapy
+- creativity: writing time, art projects, music practice, creative work
+- social: conversations, networking events, quality time with others"""
+
+# Worked examples appended on Anthropic only: they lift the static prefix past
+# its 1024-token caching minimum, which Azure's automatic caching doesn't need
+EXTRACTION_EXAMPLES = """
+
+Examples:
+
+Entry: "Woke up at 6, did a 30 min HIIT session before work. Knocked out 3 hours of deep work on the quarterly report and cleared 12 emails."
+Extractions:
+- fitness / workout_duration = 30 (evidence: "did a 30 min HIIT session", confidence 1.0)
+- productivity / deep_work_duration = 180 (evidence: "3 hours of deep work on the quarterly report", confidence 1.0)
+- productivity / emails_cleared = 12 (evidence: "cleared 12 emails", confidence 1.0)
+
+Entry: "Read a couple chapters of Atomic Habits on the train. Meditated briefly before bed. Slept terribly, maybe 5 hours."
+Extractions:
+- learning / chapters_read = 2 (evidence: "Read a couple chapters of Atomic Habits", confidence 0.8)
+- discipline / meditation_duration = 10 (evidence: "Meditated briefly before bed", confidence 0.7)
+- well-being / sleep_duration = 300 (evidence: "Slept terribly, maybe 5 hours", confidence 0.8)
+
+Entry: "Ran 5k this morning in 28 minutes. Spent the afternoon sketching for about an hour and a half. Called mom for 20 minutes."
+Extractions:
+- fitness / running_distance_km = 5 (evidence: "Ran 5k this morning", confidence 1.0)
+- fitness / running_duration = 28 (evidence: "in 28 minutes", confidence 1.0)
+- creativity / sketching_duration = 90 (evidence: "sketching for about an hour and a half", confidence 0.9)
+- social / call_duration = 20 (evidence: "Called mom for 20 minutes", confidence 1.0)
+
+Entry: "Lazy day. Watched TV and didn't really do much. Felt a bit down, mood maybe 4/10."
+Extractions:
+- well-being / mood_rating = 4 (evidence: "mood maybe 4/10", confidence 0.9)
+(Watching TV is not a goal-related activity; do not extract it.)
+
+Entry: "Practiced guitar 45 mins, wrote 800 words of my novel, and finished the Python course module on decorators. Skipped the gym again."
+Extractions:
+- creativity / guitar_practice_duration = 45 (evidence: "Practiced guitar 45 mins", confidence 1.0)
+- creativity / words_written = 800 (evidence: "wrote 800 words of my novel", confidence 1.0)
+- learning / course_modules_completed = 1 (evidence: "finished the Python course module on decorators", confidence 1.0)
+(A skipped activity has no value to extract; do not invent a zero-minute workout.)
+
+Entry: "Team standup plus two long meetings, roughly 3 hours of meetings total. Journaled for 10 minutes tonight and kept my no-sugar streak going, day 14."
+Extractions:
+- productivity / meeting_duration = 180 (evidence: "roughly 3 hours of meetings total", confidence 0.9)
+- discipline / journaling_duration = 10 (evidence: "Journaled for 10 minutes tonight", confidence 1.0)
+- discipline / no_sugar_streak_days = 14 (evidence: "kept my no-sugar streak going, day 14", confidence 1.0)
+
+Use snake_case keys, reuse the same key for the same kind of activity across entries, and keep evidence to the shortest snippet that justifies the value."""
+
+EXTRACTION_CACHED_SYSTEM_PROMPT = EXTRACTION_SYSTEM_PROMPT + EXTRACTION_EXAMPLES
+
+EXTRACTION_USER_PREFIX = "Extract all quantifiable activities from this journal entry:\n\n"
+
+# Grouped requests reuse the same system prompt (and its cached prefix)
+EXTRACTION_GROUPED_USER_PREFIX = (
+    "Extract all quantifiable activities from each journal entry below. Each entry is "
+    "wrapped in <entry id=\"N\"> tags and is independent of the others: return one item "
+    "per entry with its id, and take evidence only from that entry's own text.\n\n"
+)
+
+PROMPT_VERSION = "1.2.0"
@@ -1,4 +1,7 @@
 """Verdict generation prompts with tone tiers."""
+from functools import lru_cache
+
+import orjson
 
 # Base context shared across all tiers
 VERDICT_BASE_CONTEXT = """
@@ -67,7 +70,23 @@ Remember: Generic messages like "Great job!" or "Keep it up!" are FAILURES.
 Every message must reference something specific the user did or didn't do.
 """
 
-PROMPT_VERSION = "1.0.0"
+PROMPT_VERSION = "1.1.0"
+
+TONE_MAP = {
+    "supportive_only": TONE_SUPPORTIVE_ONLY,
+    "light_edge": TONE_LIGHT_EDGE,
+    "full_edge": TONE_FULL_EDGE,
+}
+
+
+@lru_cache(maxsize=len(TONE_MAP) + 1)
+def _compose_template(tone_tier: str) -> str:
+    """Merge base context and tone instructions into one single-pass template."""
+    return (
+        VERDICT_PROMPT_TEMPLATE
+        .replace("{base_context}", VERDICT_BASE_CONTEXT)
+        .replace("{tone_instructions}", TONE_MAP.get(tone_tier, TONE_LIGHT_EDGE))
+    )
 
 
 def build_verdict_prompt(
@@ -81,24 +100,12 @@ def build_verdict_prompt(
     tone_tier: str
 ) -> str:
     """Build complete prompt with appropriate tone tier."""
-    tone_map = {
-        "supportive_only": TONE_SUPPORTIVE_ONLY,
-        "light_edge": TONE_LIGHT_EDGE,
-        "full_edge": TONE_FULL_EDGE
-    }
-
-    base = VERDICT_BASE_CONTEXT.format(
+    return _compose_template(tone_tier).format(
         verdict_type=verdict_type,
         today_score=today_score,
         yesterday_score=yesterday_score or "N/A (first day)",
         score_delta=score_delta or "N/A",
         streak_days=streak_days,
-        activities=activities,
-        goal_categories=goal_categories
-    )
-
-    return VERDICT_PROMPT_TEMPLATE.format(
-        base_context=base,
-        tone_instructions=tone_map.get(tone_tier, TONE_LIGHT_EDGE),
-        activities=activities
+        activities=orjson.dumps(activities).decode(),
+        goal_categories=goal_categories,
     )
@@ -0,0 +1,80 @@
+"""Retry policy for transient LLM provider errors."""
+import logging
+from json import JSONDecodeError
+
+import anthropic
+import openai
+from instructor.validators import AsyncValidationError
+from pydantic import ValidationError
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+logger = logging.getLogger(__name__)
+
+# Errors worth retrying: throttling, timeouts, dropped connections, 5xx
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    anthropic.RateLimitError,
+    anthropic.APITimeoutError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError,
+)
+
+
+class AgentUnavailableError(Exception):
+    """Raised when an LLM agent call still fails after all retries."""
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    logger.warning(
+        f"{retry_state.fn.__qualname__} attempt {retry_state.attempt_number} failed: "
+        f"{retry_state.outcome.exception()}"
+    )
+
+
+def _raise_unavailable(retry_state: RetryCallState) -> None:
+    error = retry_state.outcome.exception()
+    raise AgentUnavailableError(
+        f"{retry_state.fn.__qualname__} failed after {retry_state.attempt_number} attempts: {error}"
+    ) from error
+
+
+# 3 attempts with jittered exponential backoff; non-transient errors propagate as-is
+llm_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(min=1, max=20),
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    after=_log_retry,
+    retry_error_callback=_raise_unavailable,
+)
+
+
+# Outputs instructor can fix by re-asking the model with the validation error
+REASK_ERRORS = (ValidationError, JSONDecodeError, AsyncValidationError)
+
+
+def reask_retries(attempts: int = 3) -> AsyncRetrying:
+    """
+    instructor max_retries policy that only re-asks on invalid output.
+
+    instructor wraps anything its retry loop gives up on in
+    InstructorRetryException, which would hide transient provider errors
+    from llm_retry. With reraise=True and retries limited to validation
+    failures, rate limits and timeouts surface unchanged, after one HTTP
+    attempt, so llm_retry's backoff and AgentUnavailableError apply.
+    Build one per call: AsyncRetrying keeps per-run state.
+    """
+    return AsyncRetrying(
+        stop=stop_after_attempt(attempts),
+        retry=retry_if_exception_type(REASK_ERRORS),
+        reraise=True,
+    )
@@ -1,5 +1,12 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
+# Allowed activity categories; rendered as a JSON Schema enum in tool calls
+CategoryLiteral = Literal[
+    "productivity", "fitness", "learning", "discipline", "well-being", "creativity", "social"
+]
+
 
 class ExtractedActivity(BaseModel):
     """
@@ -14,11 +21,11 @@ class ExtractedActivity(BaseModel):
     - creativity: writing, art, music
     - social: conversations, networking, relationships
     """
-    category: str = Field(
-        description="Activity category (productivity, fitness, learning, discipline, well-being, creativity, social)"
+    category: CategoryLiteral = Field(
+        description="Activity category"
     )
     key: str = Field(
-        description="Specific metric key (e.g., 'workout_duration', 'hours_deep_work', 'books_read')"
+        description="Specific metric key (e.g., 'workout_duration', 'deep_work_duration', 'books_read')"
     )
     value: float = Field(
         description="Numeric value for the activity (duration in minutes, count, rating, etc.)"
@@ -32,6 +39,8 @@ class ExtractedActivity(BaseModel):
         description="Confidence score (0-1): 1.0 for explicit numbers, 0.7-0.9 for inferred values"
     )
 
+    model_config = {"extra": "ignore", "validate_assignment": False}
+
 
 class ExtractionResult(BaseModel):
     """
@@ -46,6 +55,36 @@ class ExtractionResult(BaseModel):
         description="Original journal text (for debugging and validation)"
     )
 
+    model_config = {"extra": "ignore", "validate_assignment": False}
+
+
+class EntryExtraction(BaseModel):
+    """Activities extracted from one <entry> of a grouped extraction request."""
+    entry_id: int = Field(
+        description="The id attribute of the <entry> these activities come from"
+    )
+    activities: list[ExtractedActivity] = Field(
+        default_factory=list,
+        description="List of extracted activities with metrics for this entry"
+    )
+
+    model_config = {"extra": "ignore", "validate_assignment": False}
+
+
+class GroupedExtractionResult(BaseModel):
+    """
+    Result of extracting several journal entries in a single request.
+
+    Used by backfills to pay for the system prompt once per group rather
+    than once per entry.
+    """
+    entries: list[EntryExtraction] = Field(
+        default_factory=list,
+        description="One item per <entry> in the input, in any order"
+    )
+
+    model_config = {"extra": "ignore", "validate_assignment": False}
+
 
 class GoalSuggestion(BaseModel):
     """
@@ -71,3 +110,5 @@ class GoalSuggestion(BaseModel):
         le=1.0,
         description="Confidence that this is a meaningful goal suggestion"
     )
+
+    model_config = {"extra": "ignore", "validate_assignment": False}
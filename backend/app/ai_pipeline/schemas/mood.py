@@ -30,4 +30,4 @@ class MoodClassification(BaseModel):
         description="Negative indicators found in journal"
     )
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "extra": "ignore", "validate_assignment": False}
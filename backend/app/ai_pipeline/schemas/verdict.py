@@ -40,6 +40,9 @@ class Verdict(BaseModel):
     )
     tone_applied: str = Field(description="supportive_only, light_edge, or full_edge")
 
+    # tone_applied is set after generation; don't re-run validators on assignment
+    model_config = {"extra": "ignore", "validate_assignment": False}
+
 
 class VerdictInput(BaseModel):
     """Input data for verdict generation."""
@@ -1,8 +1,72 @@
 import re
+from collections import Counter
+from collections.abc import Collection
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Sequence
-from app.ai_pipeline.scoring.schemas import GoalScoreInput, GoalScoreOutput, ScoringResult
+from app.ai_pipeline.scoring import scoring_kernel
+from app.ai_pipeline.scoring.scoring_kernel import EffortLevel
+from app.ai_pipeline.scoring.schemas import (
+    GoalScoreInput,
+    GoalScoreInputInternal,
+    GoalScoreInternal,
+    ScoringResultInternal,
+)
 from app.models.goal import UserGoal
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional C extension
+    ahocorasick = None
+
+# Compiled once at import; the scorer itself is stateless
+_TOKEN_PATTERN = re.compile(r"[a-z]+")
+_NUMBER_PATTERN = re.compile(r'\b(\d+(?:\.\d+)?)\s*(?:hours?|hrs?|minutes?|mins?|pages?|miles?|km|reps?|sets?|times?)\b', re.IGNORECASE)
+# Sentence without surrounding whitespace, so matches need no strip()
+_SENTENCE_PATTERN = re.compile(r'[^.!?\s](?:[^.!?]*[^.!?\s])?')
+
+# Distinct (entry content, goal set) results kept by DeterministicScorer.score_entry
+SCORE_CACHE_SIZE = 256
+
+# Evidence points saturate at 4 sentences (min(count * 3, 10)); 3 are kept for display
+EVIDENCE_LIMIT = 4
+
+
+class KeywordHits:
+    """Whole-word category keyword hits from a single pass over lowercased journal text."""
+
+    def __init__(self):
+        # tag -> keywords in order of first appearance (dict as an ordered set)
+        self.matched: dict[str, dict[str, None]] = {}
+        self.positions: dict[str, list[int]] = {}
+
+    def add(self, tag: str, keyword: str, start: int) -> None:
+        self.matched.setdefault(tag, {})[keyword] = None
+        self.positions.setdefault(tag, []).append(start)
+
+    def get(self, tag: str) -> list[str]:
+        return list(self.matched.get(tag, ()))
+
+
+@dataclass(slots=True)
+class JournalView:
+    """Per-entry derived text state, computed once and shared by every goal."""
+    content: str  # Evidence source; offsets line up with content_lower
+    content_lower: str
+    has_numbers: bool
+    hits: KeywordHits
+    tokens: frozenset[str]
+    token_counts: Counter
+
+
+def _is_word_at(text: str, start: int, end: int) -> bool:
+    """True if text[start:end] is not embedded in a longer word."""
+    if start > 0 and (text[start - 1].isalnum() or text[start - 1] == "_"):
+        return False
+    if end < len(text) and (text[end].isalnum() or text[end] == "_"):
+        return False
+    return True
+
 class DeterministicScorer:
     """
     Deterministic scoring engine for journal entries.
@@ -17,7 +81,7 @@ class DeterministicScorer:
     """
 
     # Category-specific keywords (extend as needed)
-    CATEGORY_KEYWORDS: dict[str, list[str]] = {
+    CATEGORY_KEYWORDS: dict[str, frozenset[str]] = {k: frozenset(v) for k, v in {
         "fitness": ["workout", "exercise", "gym", "run", "running", "walk", "weights", "cardio",
                    "pushups", "squats", "yoga", "stretch", "miles", "steps", "active"],
         "productivity": ["work", "project", "task", "completed", "finished", "shipped", "meeting",
@@ -30,7 +94,7 @@ class DeterministicScorer:
                       "morning", "schedule", "planned", "followed", "stuck"],
         "wellbeing": ["happy", "grateful", "mood", "feeling", "relaxed", "calm", "peace",
                      "joy", "content", "mindful", "present", "balanced"],
-    }
+    }.items()}
 
     # Effort indicators (positive)
     EFFORT_POSITIVE = ["hard", "challenging", "pushed", "intense", "maximum", "best", "crushed",
@@ -44,21 +108,80 @@ class DeterministicScorer:
     ACTIVITY_VERBS = ["did", "completed", "finished", "worked", "exercised", "practiced",
                       "wrote", "read", "studied", "built", "created", "made", "went", "ran"]
 
-    def __init__(self):
-        # Pre-compile regex patterns for efficiency
-        self._number_pattern = re.compile(r'\b(\d+(?:\.\d+)?)\s*(?:hours?|hrs?|minutes?|mins?|pages?|miles?|km|reps?|sets?|times?)\b', re.IGNORECASE)
-        self._activity_pattern = re.compile(r'\b(' + '|'.join(self.ACTIVITY_VERBS) + r')\b', re.IGNORECASE)
+    # Set forms for token intersection
+    EFFORT_POSITIVE_SET = frozenset(EFFORT_POSITIVE)
+    EFFORT_NEGATIVE_SET = frozenset(EFFORT_NEGATIVE)
+    ACTIVITY_VERBS_SET = frozenset(ACTIVITY_VERBS)
+
+    def scan(self, content_lower: str) -> KeywordHits:
+        """
+        Find all whole-word category keyword hits in one pass over the text.
+
+        Uses an Aho-Corasick automaton when pyahocorasick is installed,
+        otherwise a single compiled alternation.
+        """
+        hits = KeywordHits()
+        if _AUTOMATON is not None:
+            for end, (word, tags) in _AUTOMATON.iter(content_lower):
+                start = end - len(word) + 1
+                if _is_word_at(content_lower, start, end + 1):
+                    for tag in tags:
+                        hits.add(tag, word, start)
+        else:
+            for match in _KEYWORD_PATTERN.finditer(content_lower):
+                word = match.group(1)
+                for tag in _KEYWORD_TAGS[word]:
+                    hits.add(tag, word, match.start())
+        return hits
+
+    def build_view(self, journal_content: str) -> JournalView:
+        """Lowercase, tokenize and keyword-scan a journal entry once."""
+        content_lower = journal_content.lower()
+
+        # Offsets come from the lowercased text; a few code points change length when lowered
+        content = journal_content if len(journal_content) == len(content_lower) else content_lower
+
+        token_counts = Counter(_TOKEN_PATTERN.findall(content_lower))
+
+        return JournalView(
+            content=content,
+            content_lower=content_lower,
+            has_numbers=bool(_NUMBER_PATTERN.search(content_lower)),
+            hits=self.scan(content_lower),
+            tokens=frozenset(token_counts),
+            token_counts=token_counts,
+        )
 
-    def score_goal(self, input: GoalScoreInput) -> GoalScoreOutput:
-        """Score a single goal against journal content."""
-        content_lower = input.journal_content.lower()
+    def score_goal(
+        self,
+        input: GoalScoreInput | GoalScoreInputInternal,
+        view: JournalView | None = None,
+    ) -> GoalScoreInternal:
+        """
+        Score a single goal against journal content.
+
+        Args:
+            input: Goal and journal content (Pydantic DTO or internal record)
+            view: Precomputed view of input.journal_content (built here if omitted)
+        """
+        if view is None:
+            view = self.build_view(input.journal_content)
+        content_lower = view.content_lower
+        hits = view.hits
 
         # 1. Check if goal category mentioned (keyword matching)
         keywords = self._get_keywords_for_category(input.goal_category)
-        keyword_matches = [kw for kw in keywords if kw in content_lower]
+        category_lower = input.goal_category.lower()
+        if category_lower in self.CATEGORY_KEYWORDS:
+            keyword_matches = hits.get(category_lower)
+            positions = hits.positions.get(category_lower, [])
+        else:
+            pattern = re.compile(r'\b' + re.escape(category_lower) + r'\b')
+            positions = [m.start() for m in pattern.finditer(content_lower)]
+            keyword_matches = list(keywords) if positions else []
 
         # 2. Extract evidence (sentences containing keywords)
-        evidence = self._extract_evidence(input.journal_content, keyword_matches)
+        evidence = self._extract_evidence(view, positions)
 
         # 3. Detect if user "showed up" (any engagement with category)
         showed_up = len(keyword_matches) > 0 or self._category_in_description(
@@ -66,14 +189,14 @@ class DeterministicScorer:
         )
 
         # 4. Detect effort level
-        effort_level = self._assess_effort(content_lower, keyword_matches)
+        effort_level = self._assess_effort(view, keyword_matches)
 
         # 5. Calculate base score
         base_score = self._calculate_base_score(
             showed_up=showed_up,
             keyword_count=len(keyword_matches),
             effort_level=effort_level,
-            has_quantifiers=bool(self._number_pattern.search(content_lower)),
+            has_quantifiers=view.has_numbers,
             evidence_count=len(evidence)
         )
 
@@ -86,11 +209,11 @@ class DeterministicScorer:
             base_score=base_score
         )
 
-        return GoalScoreOutput(
+        return GoalScoreInternal(
             category=input.goal_category,
             base_score=base_score,
             showed_up=showed_up,
-            effort_level=effort_level,
+            effort_level=effort_level.label,
             evidence=evidence[:3],  # Limit to top 3 evidence pieces
             reasoning=reasoning
         )
@@ -99,21 +222,38 @@ class DeterministicScorer:
         self,
         journal_content: str,
         goals: Sequence[UserGoal]
-    ) -> ScoringResult:
-        """Score a journal entry against all user goals."""
-        goal_scores: list[GoalScoreOutput] = []
-
-        for goal in goals:
-            if not goal.is_active:
-                continue
-
-            input = GoalScoreInput(
-                goal_category=goal.category,
-                goal_description=goal.description,
-                target_value=goal.target_value,
+    ) -> ScoringResultInternal:
+        """
+        Score a journal entry against all user goals.
+
+        Memoized on the content and the active goals' scoring inputs, so
+        re-scoring an unchanged day (retries, re-runs) skips the text scan.
+        The returned result is shared between callers; treat it as read-only.
+        """
+        goal_inputs = tuple(
+            (goal.category, goal.description, goal.target_value)
+            for goal in goals
+            if goal.is_active
+        )
+        return self._score_entry(journal_content, goal_inputs)
+
+    @lru_cache(maxsize=SCORE_CACHE_SIZE)
+    def _score_entry(
+        self,
+        journal_content: str,
+        goal_inputs: tuple[tuple[str, str, float], ...],
+    ) -> ScoringResultInternal:
+        goal_scores: list[GoalScoreInternal] = []
+        view = self.build_view(journal_content)
+
+        for category, description, target_value in goal_inputs:
+            input = GoalScoreInputInternal(
+                goal_category=category,
+                goal_description=description,
+                target_value=target_value,
                 journal_content=journal_content
             )
-            score = self.score_goal(input)
+            score = self.score_goal(input, view)
             goal_scores.append(score)
 
         # Calculate overall engagement
@@ -130,122 +270,107 @@ class DeterministicScorer:
             )
             overall_engagement = total_weighted / goals_total
 
-        return ScoringResult(
+        return ScoringResultInternal(
             goal_scores=goal_scores,
             overall_engagement=min(100.0, overall_engagement),
             goals_addressed=goals_addressed,
             goals_total=goals_total
         )
 
-    def _get_keywords_for_category(self, category: str) -> list[str]:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _get_keywords_for_category(category: str) -> frozenset[str]:
         """Get keywords for a category, with fallback to category name itself."""
         category_lower = category.lower()
-        if category_lower in self.CATEGORY_KEYWORDS:
-            return self.CATEGORY_KEYWORDS[category_lower]
+        if category_lower in DeterministicScorer.CATEGORY_KEYWORDS:
+            return DeterministicScorer.CATEGORY_KEYWORDS[category_lower]
         # Fallback: use the category name itself as a keyword
-        return [category_lower]
+        return frozenset({category_lower})
 
     def _category_in_description(self, content: str, description: str) -> bool:
         """Check if goal description keywords appear in content."""
         # Extract significant words from description (>3 chars)
-        desc_words = [w.lower() for w in description.split() if len(w) > 3]
+        desc_words = [w for w in description.lower().split() if len(w) > 3]
         return any(word in content for word in desc_words)
 
-    def _extract_evidence(self, content: str, keywords: list[str]) -> list[str]:
-        """Extract sentences containing keywords as evidence."""
-        if not keywords:
+    def _extract_evidence(
+        self, view: JournalView, positions: list[int], limit: int = EVIDENCE_LIMIT
+    ) -> list[str]:
+        """
+        Extract sentences containing keywords as evidence.
+
+        Sentences are streamed and the scan stops once `limit` are found.
+
+        Args:
+            view: Precomputed journal view
+            positions: Start offsets of keyword matches in the lowercased content
+            limit: Maximum sentences to collect
+
+        Returns:
+            Matching sentences in document order
+        """
+        if not positions:
             return []
 
-        sentences = re.split(r'[.!?]+', content)
+        pending = sorted(positions)
+        i = 0
         evidence = []
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-            sentence_lower = sentence.lower()
-            if any(kw in sentence_lower for kw in keywords):
-                evidence.append(sentence)
+        for match in _SENTENCE_PATTERN.finditer(view.content):
+            start, end = match.span()
+            while i < len(pending) and pending[i] < start:
+                i += 1
+            if i == len(pending):
+                break
+            if pending[i] < end:
+                evidence.append(match.group())
+                if len(evidence) >= limit:
+                    break
 
         return evidence
 
-    def _assess_effort(self, content: str, keyword_matches: list[str]) -> str:
+    def _assess_effort(self, view: JournalView, keyword_matches: Collection[str]) -> EffortLevel:
         """Assess effort level based on language and quantifiers."""
         if not keyword_matches:
-            return "none"
+            return EffortLevel.NONE
 
-        # Check for positive effort indicators
-        positive_count = sum(1 for word in self.EFFORT_POSITIVE if word in content)
-        negative_count = sum(1 for word in self.EFFORT_NEGATIVE if word in content)
+        # Distinct positive/negative effort words present (whole tokens, so "harder" is not "hard")
+        positive_count = len(view.tokens & self.EFFORT_POSITIVE_SET)
+        negative_count = len(view.tokens & self.EFFORT_NEGATIVE_SET)
 
         # Check for quantifiers (numbers usually indicate more effort)
-        has_numbers = bool(self._number_pattern.search(content))
+        has_numbers = view.has_numbers
 
         # Activity verb count
-        activity_count = len(self._activity_pattern.findall(content))
+        activity_count = sum(view.token_counts[verb] for verb in self.ACTIVITY_VERBS_SET)
 
         # Scoring logic
-        effort_score = (
-            positive_count * 2
-            - negative_count
-            + (2 if has_numbers else 0)
-            + min(activity_count, 3)
+        return EffortLevel(
+            scoring_kernel.effort_index(positive_count, negative_count, has_numbers, activity_count)
         )
 
-        if effort_score >= 6:
-            return "exceptional"
-        elif effort_score >= 4:
-            return "substantial"
-        elif effort_score >= 2:
-            return "moderate"
-        elif effort_score >= 1:
-            return "minimal"
-        else:
-            return "none"
-
     def _calculate_base_score(
         self,
         showed_up: bool,
         keyword_count: int,
-        effort_level: str,
+        effort_level: EffortLevel,
         has_quantifiers: bool,
         evidence_count: int
     ) -> float:
         """Calculate deterministic base score (0-100)."""
-        if not showed_up:
-            return 0.0
-
-        # Base: 30 points for showing up
-        score = 30.0
-
-        # Keyword relevance: up to 20 points
-        score += min(keyword_count * 5, 20)
-
-        # Effort level: up to 30 points
-        effort_points = {
-            "none": 0,
-            "minimal": 5,
-            "moderate": 15,
-            "substantial": 25,
-            "exceptional": 30
-        }
-        score += effort_points.get(effort_level, 0)
-
-        # Quantifiers present: 10 points (indicates specificity)
-        if has_quantifiers:
-            score += 10
-
-        # Evidence richness: up to 10 points
-        score += min(evidence_count * 3, 10)
-
-        return min(100.0, score)
+        return scoring_kernel.base_score(
+            showed_up,
+            keyword_count,
+            effort_level,
+            has_quantifiers,
+            evidence_count,
+        )
 
     def _generate_reasoning(
         self,
         category: str,
         showed_up: bool,
         keyword_matches: list[str],
-        effort_level: str,
+        effort_level: EffortLevel,
         base_score: float
     ) -> str:
         """Generate human-readable reasoning for the score."""
@@ -257,7 +382,33 @@ class DeterministicScorer:
         if keyword_matches:
             parts.append(f"(keywords: {', '.join(keyword_matches[:3])})")
 
-        parts.append(f"with {effort_level} effort")
+        parts.append(f"with {effort_level.label} effort")
         parts.append(f"-> base score {base_score:.0f}/100")
 
         return " ".join(parts)
+
+
+def _build_keyword_index(category_keywords: dict[str, frozenset[str]]):
+    """Build (keyword -> categories, automaton or None, fallback regex or None)."""
+    # keyword -> every category it belongs to
+    keyword_tags: dict[str, list[str]] = {}
+    for tag, words in category_keywords.items():
+        for word in words:
+            keyword_tags.setdefault(word, []).append(tag)
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for word, tags in keyword_tags.items():
+            automaton.add_word(word, (word, tags))
+        automaton.make_automaton()
+        return keyword_tags, automaton, None
+
+    # Plain capture group: a keyword may belong to several categories
+    pattern = re.compile(r'\b(' + '|'.join(map(re.escape, keyword_tags)) + r')\b')
+    return keyword_tags, None, pattern
+
+
+_KEYWORD_TAGS, _AUTOMATON, _KEYWORD_PATTERN = _build_keyword_index(DeterministicScorer.CATEGORY_KEYWORDS)
+
+# Shared stateless instance
+SCORER = DeterministicScorer()
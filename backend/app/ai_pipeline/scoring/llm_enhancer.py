@@ -1,11 +1,23 @@
-"""LLM-based score enhancement using Azure OpenAI via instructor."""
+"""LLM-based score enhancement using async Azure OpenAI via instructor."""
+
+from functools import lru_cache
+from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
-from openai import AzureOpenAI
 import instructor
+from pydantic import BaseModel, Field, ValidationInfo, model_validator
 from app.core.config import settings
-from app.ai_pipeline.scoring.schemas import GoalScoreOutput, ScoringResult
-from app.ai_pipeline.scoring.prompts import SCORE_ENHANCEMENT_PROMPT, SCORE_ENHANCEMENT_SYSTEM
+from app.ai_pipeline.cache import llm_cached, ONE_DAY
+from app.ai_pipeline.clients import DEFAULT_MAX_TOKENS, get_azure_instructor
+from app.ai_pipeline.concurrency import gather_bounded
+from app.ai_pipeline.retry import llm_retry, reask_retries
+from app.ai_pipeline.scoring.schemas import GoalScoreInternal, ScoringResultInternal
+from app.ai_pipeline.scoring.prompts import (
+    SCORE_ENHANCEMENT_PROMPT,
+    SCORE_ENHANCEMENT_BATCH_PROMPT,
+    SCORE_ENHANCEMENT_GOAL_ROW,
+    SCORE_ENHANCEMENT_SYSTEM,
+    PROMPT_VERSION,
+)
 
 
 class EnhancedScore(BaseModel):
@@ -17,14 +29,46 @@ class EnhancedScore(BaseModel):
     adjustment_reasoning: str = Field(description="Why the adjustment was made")
     confidence: float = Field(ge=0, le=1, default=0.8, description="Confidence in adjustment")
 
-    @field_validator("adjustment")
-    @classmethod
-    def validate_adjustment_bounds(cls, v: float) -> float:
-        """Ensure adjustment is within +/-20 guardrail."""
-        if abs(v) > 20:
-            # Clamp to bounds
-            return 20.0 if v > 0 else -20.0
-        return v
+    def _context_base_score(self, context: dict[str, Any]) -> float | None:
+        return context.get("base_score")
+
+    @model_validator(mode="after")
+    def enforce_guardrails(self, info: ValidationInfo) -> "EnhancedScore":
+        """
+        Clamp the adjustment to the +/-20 guardrail in a single pass.
+
+        When a validation context carries the deterministic base score,
+        it replaces whatever original_score the LLM echoed back.
+        """
+        if info.context:
+            base_score = self._context_base_score(info.context)
+            if base_score is not None:
+                self.original_score = float(base_score)
+
+        delta = self.adjusted_score - self.original_score
+        if abs(delta) > 20:
+            delta = 20.0 if delta > 0 else -20.0
+        self.adjusted_score = min(100.0, max(0.0, self.original_score + delta))
+        self.adjustment = self.adjusted_score - self.original_score
+        return self
+
+
+class GoalEnhancement(EnhancedScore):
+    """EnhancedScore tagged with the [G<n>] goal it belongs to in a batch prompt."""
+
+    goal_id: int = Field(description="Number from the goal's [G<n>] label")
+
+    def _context_base_score(self, context: dict[str, Any]) -> float | None:
+        base_scores = context.get("base_scores")
+        if base_scores is None or not 0 <= self.goal_id < len(base_scores):
+            return None
+        return base_scores[self.goal_id]
+
+
+class EnhancedScoreBatch(BaseModel):
+    """One LLM response covering every goal in an entry."""
+
+    scores: list[GoalEnhancement]
 
 
 class LLMScoreEnhancer:
@@ -36,22 +80,31 @@ class LLMScoreEnhancer:
     """
 
     def __init__(self):
-        """Initialize with Azure OpenAI credentials from settings."""
-        if not settings.AZURE_OPENAI_API_KEY:
-            raise ValueError("AZURE_OPENAI_API_KEY not configured")
-
-        # Create Azure OpenAI client and wrap with instructor
-        azure_client = AzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_API_BASE,
-        )
-        self.client = instructor.from_openai(azure_client)
+        """
+        Initialize with the shared async Azure OpenAI client.
+
+        Raises:
+            ValueError: If AZURE_OPENAI_API_KEY is not configured
+        """
+        get_azure_instructor()  # fail fast when Azure is unconfigured
         self.deployment = settings.AZURE_OPENAI_DEPLOYMENT
 
-    def enhance_score(
+    @property
+    def client(self) -> instructor.AsyncInstructor:
+        """
+        Instructor client on the current event loop's HTTP pool.
+
+        Looked up per request: get_llm_enhancer() shares one enhancer per
+        process, and a client stored in __init__ would keep the first
+        loop's connection pool.
+        """
+        return get_azure_instructor()
+
+    @llm_cached(EnhancedScore, ttl=ONE_DAY, version=PROMPT_VERSION)
+    @llm_retry
+    async def enhance_score(
         self,
-        goal_score: GoalScoreOutput,
+        goal_score: GoalScoreInternal,
         goal_description: str,
         target_value: float,
         journal_content: str
@@ -67,6 +120,9 @@ class LLMScoreEnhancer:
 
         Returns:
             EnhancedScore with adjustment and reasoning
+
+        Results are cached for 24h keyed on deployment and inputs, so
+        re-scoring an unchanged entry skips the Azure round-trip.
         """
         # Calculate valid adjustment range
         min_score = max(0, goal_score.base_score - 20)
@@ -89,33 +145,50 @@ class LLMScoreEnhancer:
 
         # Call Azure OpenAI with instructor for structured output
         full_prompt = f"{SCORE_ENHANCEMENT_SYSTEM}\n\n{prompt}"
-        response = self.client.chat.completions.create(
+        return await self.client.chat.completions.create(
             model=self.deployment,
+            max_tokens=DEFAULT_MAX_TOKENS,
             messages=[{"role": "user", "content": full_prompt}],
-            response_model=EnhancedScore
+            response_model=EnhancedScore,
+            validation_context={"base_score": goal_score.base_score},
+            max_retries=reask_retries(),
         )
 
-        # Enforce guardrails (belt and suspenders)
-        adjustment = response.adjusted_score - goal_score.base_score
-        if abs(adjustment) > 20:
-            # Clamp to guardrail
-            adjustment = 20.0 if adjustment > 0 else -20.0
-            response.adjusted_score = goal_score.base_score + adjustment
-            response.adjustment = adjustment
-
-        response.original_score = goal_score.base_score
-
-        return response
+    @llm_cached(EnhancedScoreBatch, ttl=ONE_DAY, version=PROMPT_VERSION)
+    @llm_retry
+    async def _enhance_batch(
+        self, goal_rows: str, base_scores: list[float], journal_content: str
+    ) -> EnhancedScoreBatch:
+        """Score every goal in one request; the journal is sent once, not per goal."""
+        prompt = SCORE_ENHANCEMENT_BATCH_PROMPT.format(
+            journal_content=journal_content,
+            goals=goal_rows,
+        )
+        return await self.client.chat.completions.create(
+            model=self.deployment,
+            max_tokens=DEFAULT_MAX_TOKENS,
+            messages=[
+                {"role": "system", "content": SCORE_ENHANCEMENT_SYSTEM},
+                {"role": "user", "content": prompt},
+            ],
+            response_model=EnhancedScoreBatch,
+            validation_context={"base_scores": base_scores},
+            max_retries=reask_retries(),
+        )
 
-    def enhance_scoring_result(
+    async def enhance_scoring_result(
         self,
-        result: ScoringResult,
+        result: ScoringResultInternal,
         goals_with_descriptions: list[tuple[str, str, float]],  # (category, description, target)
         journal_content: str
     ) -> list[EnhancedScore]:
         """
         Enhance all scores in a ScoringResult.
 
+        All goals go out in a single batched request. Any goal the batch
+        response leaves out is enhanced individually, concurrently with
+        at most AZURE_OPENAI_MAX_CONCURRENCY requests in flight.
+
         Args:
             result: Complete deterministic scoring result
             goals_with_descriptions: List of (category, description, target_value) tuples
@@ -130,22 +203,62 @@ class LLMScoreEnhancer:
             for cat, desc, target in goals_with_descriptions
         }
 
-        enhanced_scores = []
-        for goal_score in result.goal_scores:
+        if not result.goal_scores:
+            return []
+
+        rows = []
+        for goal_id, goal_score in enumerate(result.goal_scores):
             desc, target = goal_lookup.get(
                 goal_score.category,
                 (goal_score.category, 1.0)
             )
-
-            enhanced = self.enhance_score(
-                goal_score=goal_score,
+            rows.append(SCORE_ENHANCEMENT_GOAL_ROW.format(
+                goal_id=goal_id,
+                category=goal_score.category,
                 goal_description=desc,
                 target_value=target,
-                journal_content=journal_content
-            )
-            enhanced_scores.append(enhanced)
+                base_score=goal_score.base_score,
+                min_score=max(0, goal_score.base_score - 20),
+                max_score=min(100, goal_score.base_score + 20),
+                showed_up=goal_score.showed_up,
+                effort_level=goal_score.effort_level,
+                evidence="; ".join(goal_score.evidence) if goal_score.evidence else "None",
+                base_reasoning=goal_score.reasoning,
+            ))
+
+        batch = await self._enhance_batch(
+            "\n\n".join(rows),
+            [gs.base_score for gs in result.goal_scores],
+            journal_content,
+        )
+        by_id = {score.goal_id: score for score in batch.scores}
+
+        enhanced: list[EnhancedScore | None] = [
+            by_id.get(i) for i in range(len(result.goal_scores))
+        ]
+
+        # Fall back to per-goal calls for anything the batch response dropped
+        missing = [i for i, score in enumerate(enhanced) if score is None]
+        if missing:
+            async def enhance(i: int) -> EnhancedScore:
+                goal_score = result.goal_scores[i]
+                desc, target = goal_lookup.get(
+                    goal_score.category,
+                    (goal_score.category, 1.0)
+                )
+                return await self.enhance_score(
+                    goal_score=goal_score,
+                    goal_description=desc,
+                    target_value=target,
+                    journal_content=journal_content
+                )
+
+            for i, score in zip(missing, await gather_bounded(
+                enhance, missing, limit=settings.AZURE_OPENAI_MAX_CONCURRENCY
+            )):
+                enhanced[i] = score
 
-        return enhanced_scores
+        return enhanced
 
 
 class MockLLMScoreEnhancer:
@@ -155,9 +268,9 @@ class MockLLMScoreEnhancer:
     Returns base scores unchanged with mock reasoning.
     """
 
-    def enhance_score(
+    async def enhance_score(
         self,
-        goal_score: GoalScoreOutput,
+        goal_score: GoalScoreInternal,
         goal_description: str,
         target_value: float,
         journal_content: str
@@ -171,9 +284,9 @@ class MockLLMScoreEnhancer:
             confidence=1.0
         )
 
-    def enhance_scoring_result(
+    async def enhance_scoring_result(
         self,
-        result: ScoringResult,
+        result: ScoringResultInternal,
         goals_with_descriptions: list[tuple[str, str, float]],
         journal_content: str
     ) -> list[EnhancedScore]:
@@ -184,7 +297,7 @@ class MockLLMScoreEnhancer:
         }
 
         return [
-            self.enhance_score(
+            await self.enhance_score(
                 gs,
                 goal_lookup.get(gs.category, (gs.category, 1.0))[0],
                 goal_lookup.get(gs.category, (gs.category, 1.0))[1],
@@ -192,3 +305,13 @@ class MockLLMScoreEnhancer:
             )
             for gs in result.goal_scores
         ]
+
+
+@lru_cache(maxsize=1)
+def get_llm_enhancer() -> LLMScoreEnhancer | MockLLMScoreEnhancer:
+    """Process-wide score enhancer, falling back to the mock when Azure is unconfigured."""
+    try:
+        return LLMScoreEnhancer()
+    except ValueError:
+        # API key not configured, use mock
+        return MockLLMScoreEnhancer()
@@ -32,8 +32,41 @@ Review the base score and adjust it if the deterministic analysis missed importa
 
 Return a structured response with your adjusted score and reasoning."""
 
+SCORE_ENHANCEMENT_BATCH_PROMPT = """You are a scoring assistant for a personal growth journaling app. Your job is to review deterministic base scores for several goals and adjust each based on contextual understanding.
+
+## Today's Journal Entry
+{journal_content}
+
+## Goals and Deterministic Analysis
+{goals}
+
+## Your Task
+For every goal above, review the base score and adjust it if the deterministic analysis missed important context. Consider:
+
+1. **Hidden effort**: Did the user work hard in ways not captured by keywords?
+2. **Quality vs quantity**: Was this high-quality engagement even if brief?
+3. **Context clues**: Does surrounding text suggest more/less effort than detected?
+4. **Goal alignment**: How well did activities actually serve the stated goal?
+
+## Constraints
+- You may adjust each score by at most +/-20 points from its base score, within its valid range
+- If no adjustment needed, return the base score unchanged
+- Always explain your reasoning per goal
+- Return exactly one score per goal, with goal_id set to the number in its [G<n>] label
+
+Return a structured response with one adjusted score and reasoning per goal."""
+
+SCORE_ENHANCEMENT_GOAL_ROW = """[G{goal_id}] "{category}" goal: "{goal_description}" (target: {target_value})
+- Base Score: {base_score}/100 -> Valid range: [{min_score}, {max_score}]
+- Showed Up: {showed_up}
+- Effort Level: {effort_level}
+- Evidence Found: {evidence}
+- Reasoning: {base_reasoning}"""
+
 SCORE_ENHANCEMENT_SYSTEM = """You are a fair and consistent scoring assistant. Your adjustments should be:
 - Conservative: Only adjust when there's clear contextual evidence
 - Explainable: Always provide specific reasoning
 - Bounded: Never exceed the +/-20 point guardrail
 - Consistent: Similar contexts should produce similar adjustments"""
+
+PROMPT_VERSION = "1.0.0"
@@ -1,6 +1,39 @@
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 from typing import Literal
 
+EffortLabel = Literal["none", "minimal", "moderate", "substantial", "exceptional"]
+
+
+# Internal hot-path records: the scorer builds one per goal per entry, so
+# these skip Pydantic validation. Convert with from_internal() at the API edge.
+
+@dataclass(slots=True, frozen=True)
+class GoalScoreInputInternal:
+    goal_category: str
+    goal_description: str
+    target_value: float
+    journal_content: str
+
+
+@dataclass(slots=True, frozen=True)
+class GoalScoreInternal:
+    category: str
+    base_score: float
+    showed_up: bool
+    effort_level: EffortLabel
+    evidence: list[str] = field(default_factory=list)
+    reasoning: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class ScoringResultInternal:
+    goal_scores: list[GoalScoreInternal]
+    overall_engagement: float
+    goals_addressed: int
+    goals_total: int
+
+
 class GoalScoreInput(BaseModel):
     """Input for scoring a single goal against journal content."""
     goal_category: str
@@ -13,13 +46,35 @@ class GoalScoreOutput(BaseModel):
     category: str
     base_score: float = Field(ge=0, le=100, description="Deterministic base score 0-100")
     showed_up: bool = Field(description="Did user engage with this goal at all?")
-    effort_level: Literal["none", "minimal", "moderate", "substantial", "exceptional"]
+    effort_level: EffortLabel
     evidence: list[str] = Field(default_factory=list, description="Quotes/phrases from journal supporting score")
     reasoning: str = Field(description="Human-readable explanation of score")
 
+    @classmethod
+    def from_internal(cls, obj: GoalScoreInternal) -> "GoalScoreOutput":
+        """Validate an internal scorer record into the external DTO."""
+        return cls(
+            category=obj.category,
+            base_score=obj.base_score,
+            showed_up=obj.showed_up,
+            effort_level=obj.effort_level,
+            evidence=list(obj.evidence),
+            reasoning=obj.reasoning,
+        )
+
 class ScoringResult(BaseModel):
     """Complete scoring result for all goals."""
     goal_scores: list[GoalScoreOutput]
     overall_engagement: float = Field(ge=0, le=100, description="How engaged was user overall")
     goals_addressed: int = Field(description="Number of goals with evidence in journal")
     goals_total: int = Field(description="Total number of active goals")
+
+    @classmethod
+    def from_internal(cls, obj: ScoringResultInternal) -> "ScoringResult":
+        """Validate an internal scoring result into the external DTO."""
+        return cls(
+            goal_scores=[GoalScoreOutput.from_internal(gs) for gs in obj.goal_scores],
+            overall_engagement=obj.overall_engagement,
+            goals_addressed=obj.goals_addressed,
+            goals_total=obj.goals_total,
+        )
@@ -0,0 +1,85 @@
+"""
+Numeric core of deterministic scoring.
+
+Kept to plain ints/bools so it compiles with numba.njit when numba is
+installed (bulk rescoring/backfills); otherwise runs as ordinary Python.
+"""
+from enum import IntEnum
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional JIT
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+class EffortLevel(IntEnum):
+    """Effort level ordinal; indexes EFFORT_POINTS directly."""
+    NONE = 0
+    MINIMAL = 1
+    MODERATE = 2
+    SUBSTANTIAL = 3
+    EXCEPTIONAL = 4
+
+    @property
+    def label(self) -> str:
+        """Wire/display form, e.g. "substantial"."""
+        return self.name.lower()
+
+
+# Base-score points per EffortLevel
+EFFORT_POINTS = (0, 5, 15, 25, 30)
+
+
+@njit(cache=True)
+def effort_index(positive_count: int, negative_count: int, has_numbers: bool, activity_count: int) -> int:
+    """Map effort signals to an EffortLevel ordinal."""
+    effort_score = (
+        positive_count * 2
+        - negative_count
+        + (2 if has_numbers else 0)
+        + min(activity_count, 3)
+    )
+
+    if effort_score >= 6:
+        return 4
+    elif effort_score >= 4:
+        return 3
+    elif effort_score >= 2:
+        return 2
+    elif effort_score >= 1:
+        return 1
+    return 0
+
+
+@njit(cache=True)
+def base_score(
+    showed_up: bool,
+    keyword_count: int,
+    effort_idx: int,
+    has_quantifiers: bool,
+    evidence_count: int,
+) -> float:
+    """Deterministic base score (0-100); see DeterministicScorer._calculate_base_score."""
+    if not showed_up:
+        return 0.0
+
+    # Base: 30 points for showing up
+    score = 30.0
+
+    # Keyword relevance: up to 20 points
+    score += min(keyword_count * 5, 20)
+
+    # Effort level: up to 30 points
+    score += EFFORT_POINTS[effort_idx]
+
+    # Quantifiers present: 10 points (indicates specificity)
+    if has_quantifiers:
+        score += 10
+
+    # Evidence richness: up to 10 points
+    score += min(evidence_count * 3, 10)
+
+    return min(100.0, score)
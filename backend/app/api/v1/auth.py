@@ -2,19 +2,16 @@ from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordRequestForm
 from typing import Annotated
 
-from app.deps import DbSession, CurrentUser
+from app.deps import CurrentUser, UserServiceDep
 from app.schemas.user import UserCreate, UserRead
 from app.schemas.token import Token
 from app.core.security import create_access_token
-from app.services.user_service import UserService
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-async def register(user_in: UserCreate, db: DbSession):
-    service = UserService(db)
-
+async def register(user_in: UserCreate, service: UserServiceDep):
     if await service.get_by_email(user_in.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -31,10 +28,9 @@ async def register(user_in: UserCreate, db: DbSession):
 
 @router.post("/login", response_model=Token)
 async def login(
-    db: DbSession,
+    service: UserServiceDep,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ):
-    service = UserService(db)
     user = await service.authenticate(form_data.username, form_data.password)
 
     if not user:
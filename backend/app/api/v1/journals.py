@@ -1,8 +1,10 @@
 from datetime import date
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, HTTPException, Response, status, Query
+from fastapi.responses import StreamingResponse
 
+from app.ai_pipeline.agents.extraction_agent import get_extraction_agent
 from app.deps import DbSession, CurrentUser
-from app.schemas.journal import JournalCreate, JournalRead, JournalUpdate
+from app.schemas.journal import JOURNAL_LIST_ADAPTER, JournalCreate, JournalRead, JournalUpdate
 from app.services.journal_service import JournalService
 
 router = APIRouter(prefix="/journals", tags=["journals"])
@@ -30,19 +32,29 @@ async def list_journals(
     current_user: CurrentUser,
     from_date: date | None = Query(None),
     to_date: date | None = Query(None),
-    page: int = Query(1, ge=1),
+    before: date | None = Query(None, description="Return entries strictly before this date"),
     limit: int = Query(10, ge=1, le=100),
 ):
-    """List journal entries with optional date filtering and pagination."""
+    """
+    List journal entries with optional date filtering and keyset pagination.
+
+    Entries are newest first; pass the entry_date of the last item as
+    `before` to fetch the next page.
+    """
     service = JournalService(db)
     journals = await service.list(
         user_id=current_user.id,
         from_date=from_date,
         to_date=to_date,
-        page=page,
+        before=before,
         limit=limit,
     )
-    return journals
+    return Response(
+        content=JOURNAL_LIST_ADAPTER.dump_json(
+            JOURNAL_LIST_ADAPTER.validate_python(journals, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get("/{entry_date}", response_model=JournalRead)
@@ -63,6 +75,41 @@ async def get_journal(
     return journal
 
 
+@router.get("/{entry_date}/extraction/stream")
+async def stream_extraction(
+    entry_date: date,
+    db: DbSession,
+    current_user: CurrentUser,
+):
+    """
+    Stream activity extraction for a journal entry as Server-Sent Events.
+
+    Each event carries the extraction JSON decoded so far, so the client
+    can show the first activities while later ones are still generating.
+    This is a preview; the stored metrics come from the extraction that
+    runs when the entry is saved.
+
+    Raises:
+        404: If there is no journal entry for the date
+    """
+    service = JournalService(db)
+    journal = await service.get_by_date(current_user.id, entry_date)
+
+    if not journal:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Journal entry not found",
+        )
+
+    stream = get_extraction_agent().extract_stream(journal.content_markdown)
+
+    async def events():
+        async for extraction in stream:
+            yield f"data: {extraction.model_dump_json()}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.put("/{entry_date}", response_model=JournalRead)
 async def update_journal(
     entry_date: date,
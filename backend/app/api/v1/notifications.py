@@ -1,9 +1,16 @@
 """Notification API endpoints."""
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Body, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, literal
+from sqlalchemy import update as sql_update
+from sqlalchemy.dialects.postgresql import JSONB
+from app.core.auth_cache import auth_cache
 from app.deps import CurrentUser, DbSession
-from app.services.notification_service import NotificationService
+from app.models.user import User
+from app.services.notification_service import NotificationAction, NotificationService
 from app.schemas.notification import (
+    NOTIFICATION_LIST_ADAPTER,
     NotificationRead,
     NotificationPreferencesRead,
     NotificationPreferencesUpdate,
@@ -17,7 +24,7 @@ async def get_pending_notifications(
     db: DbSession,
     current_user: CurrentUser,
     limit: int = 10,
-) -> list[NotificationRead]:
+) -> Response:
     """
     Get pending (undelivered) notifications for current user.
 
@@ -25,22 +32,37 @@ async def get_pending_notifications(
     """
     service = NotificationService(db)
     notifications = await service.get_pending_notifications(current_user.id, limit)
-    return notifications
+    return Response(
+        content=NOTIFICATION_LIST_ADAPTER.dump_json(
+            NOTIFICATION_LIST_ADAPTER.validate_python(notifications, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
+
+
+def _preferences_response(prefs: dict | None) -> ORJSONResponse:
+    """
+    Render NotificationPreferencesRead straight from the preferences dict.
+
+    All three fields are plain JSON scalars with defaults, so building and
+    re-validating a Pydantic instance per request buys nothing.
+    """
+    prefs = prefs or {}
+    return ORJSONResponse({
+        "notifications_enabled": prefs.get("notifications_enabled", True),
+        "notification_time": prefs.get("notification_time", "18:00"),
+        "timezone": prefs.get("timezone", "UTC"),
+    })
 
 
 @router.get("/preferences", response_model=NotificationPreferencesRead)
 async def get_notification_preferences(
     current_user: CurrentUser,
-) -> NotificationPreferencesRead:
+) -> ORJSONResponse:
     """
     Get current user's notification preferences.
     """
-    prefs = current_user.preferences or {}
-    return NotificationPreferencesRead(
-        notifications_enabled=prefs.get("notifications_enabled", True),
-        notification_time=prefs.get("notification_time", "18:00"),
-        timezone=prefs.get("timezone", "UTC"),
-    )
+    return _preferences_response(current_user.preferences)
 
 
 @router.patch("/preferences", response_model=NotificationPreferencesRead)
@@ -48,103 +70,68 @@ async def update_notification_preferences(
     db: DbSession,
     current_user: CurrentUser,
     update: NotificationPreferencesUpdate,
-) -> NotificationPreferencesRead:
+) -> ORJSONResponse:
     """
     Update current user's notification preferences.
 
     Allows enabling/disabling notifications and setting preferred notification time.
     """
-    prefs = current_user.preferences or {}
-
-    if update.notifications_enabled is not None:
-        prefs["notifications_enabled"] = update.notifications_enabled
-    if update.notification_time is not None:
-        prefs["notification_time"] = update.notification_time
-    if update.timezone is not None:
-        prefs["timezone"] = update.timezone
-
-    current_user.preferences = prefs
+    changes = update.model_dump(exclude_none=True)
+    if not changes:
+        return _preferences_response(current_user.preferences)
+
+    # Merge server-side in one UPDATE ... RETURNING: no read-modify-write race,
+    # no refresh, and only the preferences column comes back
+    merged = func.coalesce(User.preferences, literal({}, JSONB)).op("||")(literal(changes, JSONB))
+    result = await db.execute(
+        sql_update(User)
+        .where(User.id == current_user.id)
+        .values(preferences=merged)
+        .returning(User.preferences)
+    )
+    preferences = result.scalar_one()
     await db.commit()
-    await db.refresh(current_user)
+    await auth_cache.invalidate(current_user.id)
 
-    return NotificationPreferencesRead(
-        notifications_enabled=prefs.get("notifications_enabled", True),
-        notification_time=prefs.get("notification_time", "18:00"),
-        timezone=prefs.get("timezone", "UTC"),
-    )
+    return _preferences_response(preferences)
 
 
-@router.patch("/{notification_id}/delivered", response_model=NotificationRead)
-async def mark_notification_delivered(
+@router.patch("/delivered", response_model=list[UUID])
+async def mark_notifications_delivered(
     db: DbSession,
     current_user: CurrentUser,
-    notification_id: UUID,
-) -> NotificationRead:
+    notification_ids: list[UUID] = Body(..., max_length=100),
+) -> list[UUID]:
     """
-    Mark a notification as delivered.
+    Mark a batch of notifications as delivered.
 
-    Called by mobile when notification is shown to user.
+    Called by mobile once per fetched page instead of once per notification.
+    Returns the IDs that were newly marked; unknown, foreign, or already
+    delivered IDs are ignored.
     """
     service = NotificationService(db)
-    notification = await service.mark_delivered(notification_id)
-
-    if not notification:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Notification not found",
-        )
-
-    if notification.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to modify this notification",
-        )
-
-    return notification
+    return await service.mark_delivered_bulk(notification_ids, current_user.id)
 
 
-@router.patch("/{notification_id}/read", response_model=NotificationRead)
-async def mark_notification_read(
+@router.patch("/{notification_id}/{action}", response_model=NotificationRead)
+async def update_notification_status(
     db: DbSession,
     current_user: CurrentUser,
     notification_id: UUID,
+    action: NotificationAction,
 ) -> NotificationRead:
     """
-    Mark a notification as read.
+    Record a notification lifecycle event.
 
-    Called by mobile when user interacts with notification.
-    """
-    service = NotificationService(db)
-    notification = await service.mark_read(notification_id)
-
-    if not notification:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Notification not found",
-        )
-
-    if notification.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to modify this notification",
-        )
+    - delivered: mobile showed the notification
+    - read: user interacted with it
+    - dismiss: dismissed without reading (fatigue tracking - dismissals
+      indicate the notification wasn't valuable)
 
-    return notification
-
-
-@router.patch("/{notification_id}/dismiss", response_model=NotificationRead)
-async def dismiss_notification(
-    db: DbSession,
-    current_user: CurrentUser,
-    notification_id: UUID,
-) -> NotificationRead:
-    """
-    Dismiss a notification without reading.
-
-    Used for fatigue tracking - dismissals indicate notification wasn't valuable.
+    Returns 404 if the notification does not exist or belongs to another user.
     """
     service = NotificationService(db)
-    notification = await service.dismiss_notification(notification_id)
+    notification = await service.apply_action(notification_id, current_user.id, action)
 
     if not notification:
         raise HTTPException(
@@ -152,10 +139,4 @@ async def dismiss_notification(
             detail="Notification not found",
         )
 
-    if notification.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to modify this notification",
-        )
-
     return notification
@@ -1,9 +1,13 @@
 """Scoring API endpoints."""
 
 from datetime import date, datetime
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, HTTPException, Request, status, Query
+from sqlalchemy import JSON, func, literal_column, select
+from sqlalchemy.orm import raiseload, selectinload
 
+from app.core.response_cache import response_cache
 from app.deps import DbSession, CurrentUser
+from app.models.daily_score import DailyScore, ScoreMetric
 from app.schemas.score import (
     ScoreRequest,
     ScoringResponse,
@@ -14,6 +18,41 @@ from app.services.scoring_service import ScoringService
 
 router = APIRouter(prefix="/scores", tags=["scores"])
 
+# Shared base statement so every score read reuses the same compiled-SQL cache entry
+_BASE_SCORE_STMT = select(DailyScore).options(selectinload(DailyScore.metrics), raiseload("*"))
+
+# Flat history rows: each day carries its metrics as a JSON array, no ORM instances
+_METRICS_JSON = func.coalesce(
+    select(
+        func.json_agg(
+            func.json_build_object(
+                # Keys as SQL literals: bound params here have no inferable type
+                literal_column("'id'"), ScoreMetric.id,
+                literal_column("'category'"), ScoreMetric.category,
+                literal_column("'score'"), ScoreMetric.score,
+                literal_column("'weight'"), ScoreMetric.weight,
+                literal_column("'reasoning'"), ScoreMetric.reasoning,
+            )
+        )
+    )
+    .where(ScoreMetric.daily_score_id == DailyScore.id)
+    .scalar_subquery(),
+    literal_column("'[]'::json"),
+    type_=JSON,
+)
+_HISTORY_STMT = select(
+    DailyScore.id,
+    DailyScore.user_id,
+    DailyScore.score_date,
+    DailyScore.verdict,
+    DailyScore.composite_score,
+    DailyScore.summary,
+    DailyScore.actionable_advice,
+    DailyScore.comparison_data,
+    DailyScore.created_at,
+    _METRICS_JSON.label("metrics"),
+)
+
 
 @router.post("/score", response_model=ScoringResponse)
 async def trigger_scoring(
@@ -60,64 +99,34 @@ async def trigger_scoring(
 
 @router.get("/today", response_model=DailyScoreRead)
 async def get_today_score(
+    request: Request,
     db: DbSession,
     current_user: CurrentUser,
 ):
     """Get today's score if it exists."""
-    from sqlalchemy import select
-    from app.models.daily_score import DailyScore
-    from sqlalchemy.orm import selectinload
-
-    today = date.today()
-    result = await db.execute(
-        select(DailyScore)
-        .options(selectinload(DailyScore.metrics))
-        .where(
-            DailyScore.user_id == current_user.id,
-            DailyScore.score_date == today,
-        )
-    )
-    score = result.scalar_one_or_none()
-
-    if not score:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No score found for today",
+    async def build():
+        today = date.today()
+        result = await db.execute(
+            _BASE_SCORE_STMT.where(
+                DailyScore.user_id == current_user.id,
+                DailyScore.score_date == today,
+            )
         )
+        score = result.scalar_one_or_none()
 
-    return score
-
-
-@router.get("/{score_date}", response_model=DailyScoreRead)
-async def get_score_by_date(
-    score_date: date,
-    db: DbSession,
-    current_user: CurrentUser,
-):
-    """Get score for a specific date."""
-    from sqlalchemy import select
-    from app.models.daily_score import DailyScore
-    from sqlalchemy.orm import selectinload
-
-    result = await db.execute(
-        select(DailyScore)
-        .options(selectinload(DailyScore.metrics))
-        .where(
-            DailyScore.user_id == current_user.id,
-            DailyScore.score_date == score_date,
-        )
-    )
-    score = result.scalar_one_or_none()
+        if not score:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No score found for today",
+            )
 
-    if not score:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No score found for {score_date}",
-        )
+        return score
 
-    return score
+    return await response_cache.respond(request, current_user.id, DailyScoreRead, build)
 
 
+# Fixed paths must be registered before /{score_date}, which would otherwise
+# capture them and fail date validation
 @router.get("/streaks/all", response_model=StreakResponse)
 async def get_all_streaks(
     db: DbSession,
@@ -131,10 +140,12 @@ async def get_all_streaks(
 
 @router.get("/history", response_model=list[DailyScoreRead])
 async def get_score_history(
+    request: Request,
     db: DbSession,
     current_user: CurrentUser,
     from_date: date | None = Query(None, description="Start date for history"),
     to_date: date | None = Query(None, description="End date for history"),
+    before: date | None = Query(None, description="Return scores strictly before this date"),
     limit: int = Query(30, ge=1, le=365, description="Maximum number of scores to return"),
 ):
     """
@@ -143,18 +154,14 @@ async def get_score_history(
     Args:
         from_date: Start date (inclusive)
         to_date: End date (inclusive)
+        before: Keyset cursor; pass the score_date of the last item for the next page
         limit: Maximum number of scores (default 30, max 365)
 
     Returns:
         List of DailyScoreRead ordered by date descending
     """
-    from sqlalchemy import select
-    from app.models.daily_score import DailyScore
-    from sqlalchemy.orm import selectinload
-
     query = (
-        select(DailyScore)
-        .options(selectinload(DailyScore.metrics))
+        _HISTORY_STMT
         .where(DailyScore.user_id == current_user.id)
         .order_by(DailyScore.score_date.desc())
         .limit(limit)
@@ -164,8 +171,35 @@ async def get_score_history(
         query = query.where(DailyScore.score_date >= from_date)
     if to_date:
         query = query.where(DailyScore.score_date <= to_date)
+    if before:
+        query = query.where(DailyScore.score_date < before)
 
-    result = await db.execute(query)
-    scores = list(result.scalars().all())
+    async def build():
+        result = await db.execute(query)
+        return [dict(row._mapping) for row in result]
 
-    return scores
+    return await response_cache.respond(request, current_user.id, list[DailyScoreRead], build)
+
+
+@router.get("/{score_date}", response_model=DailyScoreRead)
+async def get_score_by_date(
+    score_date: date,
+    db: DbSession,
+    current_user: CurrentUser,
+):
+    """Get score for a specific date."""
+    result = await db.execute(
+        _BASE_SCORE_STMT.where(
+            DailyScore.user_id == current_user.id,
+            DailyScore.score_date == score_date,
+        )
+    )
+    score = result.scalar_one_or_none()
+
+    if not score:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No score found for {score_date}",
+        )
+
+    return score
@@ -1,7 +1,12 @@
+import asyncio
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, status, Query
+from uuid import UUID
+from fastapi import APIRouter, HTTPException, Request, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.deps import DbSession, CurrentUser
+from app.core.response_cache import response_cache
+from app.db.session import run_in_read_session
+from app.deps import CurrentUser
 from app.schemas.trend import (
     TrendDataPoint,
     WeekOverWeekComparison,
@@ -9,14 +14,13 @@ from app.schemas.trend import (
     TrendsResponse,
 )
 from app.services.trend_service import TrendService
-from app.services.goal_service import GoalService
 
 router = APIRouter(prefix="/trends", tags=["trends"])
 
 
 @router.get("/", response_model=TrendsResponse)
 async def get_all_trends(
-    db: DbSession,
+    request: Request,
     current_user: CurrentUser,
     days: int = Query(default=7, ge=1, le=30, description="Number of days for trend data"),
 ):
@@ -25,41 +29,51 @@ async def get_all_trends(
 
     Returns trend data points and week-over-week comparison for each goal
     that has been scored. Data is structured for mobile visualization.
+    Responses are cached briefly per user (see app.core.response_cache).
     """
-    trend_service = TrendService(db)
-    goal_service = GoalService(db)
-
-    # Get all goals for descriptions
-    goals = await goal_service.list(current_user.id)
-    goal_descriptions = {g.category: g.description for g in goals}
-
-    # Get trends for all scored categories
-    all_trends = await trend_service.get_all_goals_trends(current_user.id, days)
-
-    trends_list: list[GoalTrendRead] = []
-    for category, data_points in all_trends.items():
-        # Calculate week-over-week for this category
-        wow = await trend_service.calculate_week_over_week(current_user.id, category)
-
-        trends_list.append(
-            GoalTrendRead(
-                goal_category=category,
-                goal_description=goal_descriptions.get(category),
-                data_points=[
-                    TrendDataPoint(date=dp.date, score=dp.score)
-                    for dp in data_points
-                ],
-                week_over_week=WeekOverWeekComparison(
-                    this_week_avg=wow.this_week_avg,
-                    last_week_avg=wow.last_week_avg,
-                    percentage_change=wow.percentage_change,
-                    trend=wow.trend,
-                ),
-            )
+    return await response_cache.respond(
+        request, current_user.id, TrendsResponse,
+        lambda: _build_all_trends(current_user.id, days),
+    )
+
+
+def _goal_descriptions(db: AsyncSession, user_id: UUID):
+    return TrendService(db).get_goal_descriptions(user_id)
+
+
+def _all_goals_trends(db: AsyncSession, user_id: UUID, days: int):
+    return TrendService(db).get_all_goals_trends(user_id, days)
+
+
+def _goal_trend_with_week_over_week(db: AsyncSession, user_id: UUID, goal_category: str, days: int):
+    return TrendService(db).get_goal_trend_with_week_over_week(user_id, goal_category, days)
+
+
+def _week_over_week_bulk(db: AsyncSession, user_id: UUID):
+    return TrendService(db).calculate_week_over_week_bulk(user_id)
+
+
+async def _build_all_trends(user_id: UUID, days: int) -> TrendsResponse:
+    # Independent reads, each in its own replica session so they run concurrently
+    goal_descriptions, all_trends, wow_by_category = await asyncio.gather(
+        run_in_read_session(_goal_descriptions, user_id),
+        run_in_read_session(_all_goals_trends, user_id, days),
+        run_in_read_session(_week_over_week_bulk, user_id),
+    )
+    no_data = TrendService._classify_week_over_week(None, None)
+
+    trends_list = [
+        _goal_trend_read(
+            category,
+            goal_descriptions.get(category),
+            data_points,
+            wow_by_category.get(category, no_data),
         )
+        for category, data_points in all_trends.items()
+    ]
 
-    return TrendsResponse(
-        user_id=current_user.id,
+    return TrendsResponse.model_construct(
+        user_id=user_id,
         generated_at=datetime.now(),
         trends=trends_list,
     )
@@ -68,7 +82,7 @@ async def get_all_trends(
 @router.get("/{goal_category}", response_model=GoalTrendRead)
 async def get_goal_trend(
     goal_category: str,
-    db: DbSession,
+    request: Request,
     current_user: CurrentUser,
     days: int = Query(default=7, ge=1, le=30, description="Number of days for trend data"),
 ):
@@ -78,11 +92,18 @@ async def get_goal_trend(
     Returns trend data points and week-over-week comparison for the specified goal.
     Returns 404 if no data exists for this goal category.
     """
-    trend_service = TrendService(db)
-    goal_service = GoalService(db)
+    return await response_cache.respond(
+        request, current_user.id, GoalTrendRead,
+        lambda: _build_goal_trend(current_user.id, goal_category, days),
+    )
 
-    # Get trend data
-    data_points = await trend_service.get_goal_trend(current_user.id, goal_category, days)
+
+async def _build_goal_trend(user_id: UUID, goal_category: str, days: int) -> GoalTrendRead:
+    # Trend points and week-over-week share one range scan; descriptions run alongside
+    (data_points, wow), goal_descriptions = await asyncio.gather(
+        run_in_read_session(_goal_trend_with_week_over_week, user_id, goal_category, days),
+        run_in_read_session(_goal_descriptions, user_id),
+    )
 
     if not data_points:
         raise HTTPException(
@@ -90,23 +111,27 @@ async def get_goal_trend(
             detail=f"No trend data found for goal category: {goal_category}",
         )
 
-    # Get goal description if available
-    goals = await goal_service.list(current_user.id)
-    goal_description = next(
-        (g.description for g in goals if g.category == goal_category),
-        None,
+    return _goal_trend_read(
+        goal_category, goal_descriptions.get(goal_category), data_points, wow
     )
 
-    # Calculate week-over-week
-    wow = await trend_service.calculate_week_over_week(current_user.id, goal_category)
 
-    return GoalTrendRead(
-        goal_category=goal_category,
-        goal_description=goal_description,
+def _goal_trend_read(category: str, description: str | None, data_points, wow) -> GoalTrendRead:
+    """
+    Assemble a GoalTrendRead from service results without re-validating.
+
+    Values come straight from typed DB columns, so model_construct skips
+    per-field validation across every data point; response_cache still
+    serializes the result against the response model.
+    """
+    return GoalTrendRead.model_construct(
+        goal_category=category,
+        goal_description=description,
         data_points=[
-            TrendDataPoint(date=dp.date, score=dp.score) for dp in data_points
+            TrendDataPoint.model_construct(date=dp.date, score=dp.score)
+            for dp in data_points
         ],
-        week_over_week=WeekOverWeekComparison(
+        week_over_week=WeekOverWeekComparison.model_construct(
             this_week_avg=wow.this_week_avg,
             last_week_avg=wow.last_week_avg,
             percentage_change=wow.percentage_change,
@@ -1,20 +1,26 @@
 """User preferences API endpoint."""
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.auth_cache import auth_cache
 from app.deps import CurrentUser, DbSession
+from app.models.user import User
 from app.schemas.user import UserPreferencesUpdate, UserPreferencesRead
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
+def _preferences_response(user: User) -> ORJSONResponse:
+    """Render UserPreferencesRead directly; orjson encodes time natively."""
+    return ORJSONResponse({"analysis_time": user.analysis_time, "timezone": user.timezone})
+
+
 @router.get("/me/preferences", response_model=UserPreferencesRead)
-async def get_my_preferences(current_user: CurrentUser) -> UserPreferencesRead:
+async def get_my_preferences(current_user: CurrentUser) -> ORJSONResponse:
     """Get current user's scheduling preferences."""
-    return UserPreferencesRead(
-        analysis_time=current_user.analysis_time,
-        timezone=current_user.timezone
-    )
+    return _preferences_response(current_user)
 
 
 @router.patch("/me/preferences", response_model=UserPreferencesRead)
@@ -22,15 +28,15 @@ async def update_my_preferences(
     preferences: UserPreferencesUpdate,
     current_user: CurrentUser,
     db: DbSession,
-) -> UserPreferencesRead:
+) -> ORJSONResponse:
     """Update current user's scheduling preferences."""
-    if preferences.analysis_time is not None:
-        current_user.analysis_time = preferences.analysis_time
-    if preferences.timezone is not None:
-        current_user.timezone = preferences.timezone
-    await db.commit()
-    await db.refresh(current_user)
-    return UserPreferencesRead(
-        analysis_time=current_user.analysis_time,
-        timezone=current_user.timezone
-    )
+    changes = preferences.model_dump(exclude_none=True)
+    if changes:
+        # One UPDATE ... RETURNING instead of commit + refresh round-trips
+        result = await db.execute(
+            update(User).where(User.id == current_user.id).values(**changes).returning(User)
+        )
+        current_user = result.scalar_one()
+        await db.commit()
+        await auth_cache.invalidate(current_user.id)
+    return _preferences_response(current_user)
@@ -0,0 +1,41 @@
+"""Verdict API endpoints."""
+
+from datetime import date
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.deps import DbSession, CurrentUser
+from app.services.verdict_service import VerdictService
+
+router = APIRouter(prefix="/verdicts", tags=["verdicts"])
+
+
+@router.get("/{score_date}/stream")
+async def stream_verdict(
+    score_date: date,
+    db: DbSession,
+    current_user: CurrentUser,
+):
+    """
+    Stream the verdict for a scored day as Server-Sent Events.
+
+    Each event carries the verdict JSON as generated so far, letting the
+    client render the headline before the full message has arrived.
+
+    Raises:
+        404: If the day has not been scored yet
+    """
+    service = VerdictService(db)
+    stream = await service.stream_verdict(current_user.id, score_date)
+
+    if stream is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No score found for {score_date}",
+        )
+
+    async def events():
+        async for verdict in stream:
+            yield f"data: {verdict.model_dump_json()}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
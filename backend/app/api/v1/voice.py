@@ -1,18 +1,51 @@
+import asyncio
+import logging
+import shutil
+import uuid
 from datetime import date
+from pathlib import Path
 
+import redis.asyncio as redis
+from celery.result import AsyncResult
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile, status
+from pydantic import ValidationError
 
-from app.deps import CurrentUser, DbSession
-from app.schemas.voice import VoiceTranscribeResponse
-from app.services.journal_service import JournalService
-from app.services.transcription_service import TranscriptionService, SUPPORTED_AUDIO_TYPES
+from app.celery_app import celery_app
+from app.core.cache import get_redis
+from app.core.config import settings
+from app.deps import CurrentUser
+from app.schemas.voice import VoiceTranscribeAccepted, VoiceTranscribeResponse, VoiceTranscribeStatus
+from app.services.transcription_service import validate_audio_upload
+from app.tasks.voice_tasks import transcribe_and_append
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/voice", tags=["voice"])
 
+# Outlives the queue wait plus celeryconfig.result_expires (1 hour)
+TASK_OWNER_TTL = 24 * 3600
+
+
+def _owner_key(task_id: str) -> str:
+    return f"voice:task_owner:{task_id}"
+
+
+def _save_upload(audio: UploadFile) -> Path:
+    """Copy the spooled upload into the shared upload dir (blocking; run in a thread)."""
+    upload_dir = Path(settings.VOICE_UPLOAD_DIR)
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    path = upload_dir / f"{uuid.uuid4().hex}{Path(audio.filename or 'audio.mp3').suffix}"
+    with path.open("wb") as out:
+        shutil.copyfileobj(audio.file, out)
+    return path
+
 
-@router.post("/transcribe", response_model=VoiceTranscribeResponse)
+@router.post(
+    "/transcribe",
+    response_model=VoiceTranscribeAccepted,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def transcribe_audio(
-    db: DbSession,
     current_user: CurrentUser,
     audio: UploadFile = File(..., description="Audio file to transcribe"),
     entry_date: date | None = Query(
@@ -21,44 +54,92 @@ async def transcribe_audio(
     ),
 ):
     """
-    Transcribe audio file and append to journal entry.
+    Queue an audio file for transcription and appending to a journal entry.
 
-    Accepts audio files (mp3, mp4, wav, webm, m4a, etc.) and transcribes
-    using OpenAI Whisper API. The transcribed text is appended to the
-    journal entry for the specified date (or today if not specified).
+    Accepts audio files (mp3, mp4, wav, webm, m4a, etc.). The upload is
+    saved and handed to a Celery worker, which transcribes it with OpenAI
+    Whisper and appends the text to the journal entry for the specified
+    date (or today if not specified). Poll GET /voice/transcribe/{task_id}
+    for the result.
 
     Multiple voice uploads in one day accumulate - existing journal content
     is preserved and new transcription is appended.
     """
-    # Validate content type
-    content_type = audio.content_type or ""
-    if content_type not in SUPPORTED_AUDIO_TYPES:
+    # Validate content type and file signature before saving or queuing
+    content_type = await validate_audio_upload(audio)
+
+    # Fail now rather than in the worker
+    if not settings.OPENAI_API_KEY:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported audio format: {content_type}. "
-                   f"Supported formats: mp3, mp4, mpeg, mpga, m4a, wav, webm",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="OpenAI API key not configured",
         )
 
     # Use today if no date specified
     if entry_date is None:
         entry_date = date.today()
 
-    # Transcribe audio
-    transcription_service = TranscriptionService()
-    transcribed_text = await transcription_service.transcribe(audio)
-
-    # Append to journal
-    journal_service = JournalService(db)
-    journal = await journal_service.append_content(
-        user_id=current_user.id,
-        entry_date=entry_date,
-        new_content=transcribed_text,
-        input_source="voice",
-    )
+    # Record the owner before enqueueing so the status route never sees an unowned task
+    task_id = str(uuid.uuid4())
+    try:
+        await get_redis().setex(_owner_key(task_id), TASK_OWNER_TTL, str(current_user.id))
+    except redis.RedisError as e:
+        logger.warning(f"Failed to record voice task owner: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Transcription queue unavailable",
+        )
 
-    return VoiceTranscribeResponse(
-        transcribed_text=transcribed_text,
-        journal_id=journal.id,
-        entry_date=journal.entry_date,
-        message="Transcription added to journal",
+    path = await asyncio.to_thread(_save_upload, audio)
+    transcribe_and_append.apply_async(
+        (str(current_user.id), entry_date.isoformat(), str(path), audio.filename, content_type),
+        task_id=task_id,
     )
+    return VoiceTranscribeAccepted(task_id=task_id)
+
+
+@router.get("/transcribe/{task_id}", response_model=VoiceTranscribeStatus)
+async def get_transcription_status(
+    task_id: str,
+    current_user: CurrentUser,
+):
+    """
+    Get the status of a queued transcription.
+
+    Returns "pending" until the worker finishes, then the transcribed text
+    and journal entry. Returns 404 for another user's task.
+    """
+    try:
+        owner = await get_redis().get(_owner_key(task_id))
+    except redis.RedisError as e:
+        logger.warning(f"Failed to look up voice task owner: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Transcription status unavailable",
+        )
+    # Unknown ids and other users' tasks look the same: nothing about their state leaks
+    if owner != str(current_user.id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transcription not found")
+
+    result = AsyncResult(task_id, app=celery_app)
+    # Result backend lookups are blocking Redis calls
+    state = await asyncio.to_thread(lambda: result.state)
+
+    if state == "FAILURE":
+        return VoiceTranscribeStatus(task_id=task_id, status="failed", error="Transcription failed")
+    if state != "SUCCESS":
+        return VoiceTranscribeStatus(task_id=task_id, status="pending")
+
+    payload = result.result
+    try:
+        transcription = VoiceTranscribeResponse(
+            transcribed_text=payload["transcribed_text"],
+            journal_id=payload["journal_id"],
+            entry_date=payload["entry_date"],
+            message="Transcription added to journal",
+        )
+    except (KeyError, TypeError, ValidationError) as e:
+        logger.error(f"Unexpected result for voice task {task_id}: {e}")
+        return VoiceTranscribeStatus(task_id=task_id, status="failed", error="Transcription failed")
+
+    return VoiceTranscribeStatus(task_id=task_id, status="completed", result=transcription)
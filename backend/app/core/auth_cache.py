@@ -0,0 +1,90 @@
+"""Short-lived in-process cache of authenticated users' rows."""
+import copy
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import inspect
+
+from app.core.cache import get_redis
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+AUTH_CACHE_TTL = 30
+AUTH_CACHE_MAXSIZE = 10_000
+
+
+class AuthCache:
+    """
+    Map user ids to a column snapshot of their row for a few seconds.
+
+    Only the users SELECT is skipped: callers still verify the bearer token
+    on every request, so an expired or tampered token never reaches the
+    cache. Each entry records the user's generation when it was stored;
+    invalidate(user_id) after a user row changes bumps it in Redis, so every
+    worker reloads on its next request. If Redis is unreachable, lookups
+    miss and fall back to the database.
+    """
+
+    def __init__(
+        self,
+        ttl: int = AUTH_CACHE_TTL,
+        maxsize: int = AUTH_CACHE_MAXSIZE,
+        namespace: str = "auth",
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.namespace = namespace
+        self._entries: OrderedDict[UUID, tuple[float, str, dict[str, Any]]] = OrderedDict()
+
+    def _generation_key(self, user_id: UUID) -> str:
+        return f"{self.namespace}:gen:{user_id}"
+
+    async def _generation(self, user_id: UUID) -> str | None:
+        try:
+            return await get_redis().get(self._generation_key(user_id)) or "0"
+        except redis.RedisError as e:
+            logger.warning(f"Auth cache unavailable, loading user from database: {e}")
+            return None
+
+    async def get(self, user_id: UUID) -> dict[str, Any] | None:
+        """Return a copy of the cached user columns, or None on miss."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, generation, snapshot = entry
+        if expires_at <= time.monotonic() or generation != await self._generation(user_id):
+            self._entries.pop(user_id, None)
+            return None
+        self._entries.move_to_end(user_id)
+        # Routes may mutate e.g. preferences in place; never hand out the cached dicts
+        return copy.deepcopy(snapshot)
+
+    async def set(self, user: User) -> None:
+        """Cache the loaded column values of user."""
+        generation = await self._generation(user.id)
+        if generation is None:
+            return
+        snapshot = {
+            attr.key: copy.deepcopy(getattr(user, attr.key))
+            for attr in inspect(User).column_attrs
+        }
+        self._entries[user.id] = (time.monotonic() + self.ttl, generation, snapshot)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Expire the cached row of user_id in every worker."""
+        self._entries.pop(user_id, None)
+        try:
+            await get_redis().incr(self._generation_key(user_id))
+        except redis.RedisError as e:
+            logger.warning(f"Auth cache invalidation failed for {user_id}: {e}")
+
+
+auth_cache = AuthCache()
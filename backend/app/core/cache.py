@@ -0,0 +1,98 @@
+"""Two-tier (in-process LRU + Redis) string cache."""
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_redis_client: redis.Redis | None = None
+
+
+def get_redis() -> redis.Redis:
+    """Return the shared async Redis client, creating it on first use."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+def make_key(*parts: str) -> str:
+    """Build a compact, stable cache key from arbitrary string parts."""
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+
+class TwoTierCache:
+    """
+    String cache checking a bounded in-process LRU before Redis.
+
+    Redis is best-effort: connection errors are logged and treated as
+    misses so callers fall through to the real computation.
+    """
+
+    def __init__(self, namespace: str, maxsize: int = 1024):
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self._local: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _set_local(self, key: str, value: str, ttl: int) -> None:
+        self._local[key] = (time.monotonic() + ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+    def _get_local(self, key: str) -> str | None:
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(key)
+                return value
+            del self._local[key]
+        return None
+
+    async def get(self, key: str) -> str | None:
+        """Return cached value for key, or None on miss."""
+        value = self._get_local(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        try:
+            redis_key = self._redis_key(key)
+            value = await get_redis().get(redis_key)
+            if value is not None:
+                ttl = await get_redis().ttl(redis_key)
+                self._set_local(key, value, max(ttl, 1))
+                self.hits += 1
+                return value
+        except redis.RedisError as e:
+            logger.warning(f"Cache read failed for {self.namespace}: {e}")
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Store value in both tiers with a TTL in seconds."""
+        self._set_local(key, value, ttl)
+        try:
+            await get_redis().setex(self._redis_key(key), ttl, value)
+        except redis.RedisError as e:
+            logger.warning(f"Cache write failed for {self.namespace}: {e}")
+
+    async def delete(self, key: str) -> None:
+        """Remove key from both tiers."""
+        self._local.pop(key, None)
+        try:
+            await get_redis().delete(self._redis_key(key))
+        except redis.RedisError as e:
+            logger.warning(f"Cache delete failed for {self.namespace}: {e}")
@@ -0,0 +1,18 @@
+"""Response compression that leaves Server-Sent Event streams untouched."""
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    GZip JSON responses, bypassing streaming endpoints.
+
+    The gzip encoder buffers output until it has a full block, which would
+    hold back SSE events (e.g. the verdict stream) instead of flushing them.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -1,8 +1,16 @@
+from functools import lru_cache
 from typing import List, Union
-from pydantic import AnyHttpUrl, validator
-from pydantic_settings import BaseSettings
+from pydantic import AnyHttpUrl, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=".env",
+        extra="ignore",  # Ignore extra fields from .env
+        frozen=True,  # Read-only after load; shared process-wide via get_settings()
+    )
+
     PROJECT_NAME: str = "Am I Better Than Yesterday?"
     API_V1_STR: str = "/api/v1"
     SECRET_KEY: str = "changeme_in_production"
@@ -11,12 +19,35 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    DATABASE_READ_URL: str | None = None  # Read replica for dashboard reads; primary if unset
+    SQL_ECHO: bool = False  # Log every statement; dev only, heavy log I/O
+    DB_POOL_SIZE: int = 20  # Persistent connections per worker process
+    DB_MAX_OVERFLOW: int = 20  # Extra connections allowed under burst load
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    DB_PGBOUNCER: bool = False  # Transaction pooling: disable server-side prepared statements
+    DB_NULL_POOL: bool = False  # No pooling; set for threaded Celery pools (one event loop per thread)
 
     # OpenAI
     OPENAI_API_KEY: str | None = None
 
+    # Azure OpenAI (AI pipeline agents)
+    AZURE_OPENAI_API_KEY: str | None = None
+    AZURE_OPENAI_API_BASE: str | None = None
+    AZURE_OPENAI_API_VERSION: str = "2024-08-01-preview"
+    AZURE_OPENAI_DEPLOYMENT: str = "gpt-4o"
+    AZURE_OPENAI_MOOD_DEPLOYMENT: str | None = None  # e.g. a gpt-4o-mini deployment
+    AZURE_OPENAI_MAX_CONCURRENCY: int = 5  # In-flight requests per fan-out, keeps under RPM quota
+
     # Anthropic (for scoring enhancement)
     ANTHROPIC_API_KEY: str | None = None
+    ANTHROPIC_MODEL: str = "claude-sonnet-4-20250514"
+    ANTHROPIC_MOOD_MODEL: str = "claude-3-5-haiku-20241022"
+
+    # Which provider the AI pipeline agents use: "azure" or "anthropic"
+    LLM_PROVIDER: str = "azure"
+
+    # Voice uploads awaiting background transcription; must be shared with Celery workers
+    VOICE_UPLOAD_DIR: str = "/tmp/amibetter-voice"
 
     # Redis / Celery
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -33,7 +64,8 @@ class Settings(BaseSettings):
     # CORS
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
 
-    @validator("BACKEND_CORS_ORIGINS", pre=True)
+    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @classmethod
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
         if isinstance(v, str) and not v.startswith("["):
             return [i.strip() for i in v.split(",")]
@@ -41,9 +73,11 @@ class Settings(BaseSettings):
             return v
         raise ValueError(v)
 
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
-        extra = "ignore"  # Ignore extra fields from .env
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment once per process."""
+    return Settings()
+
+
+settings = get_settings()
@@ -0,0 +1,115 @@
+"""Short-lived per-user cache for read-heavy GET endpoints."""
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import UUID
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.exc import SQLAlchemyError
+
+import redis.asyncio as redis
+
+from app.core.cache import TwoTierCache, get_redis, make_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 15
+STALE_TTL = 24 * 3600
+
+
+class ResponseCache:
+    """
+    Cache serialized JSON responses per (user, path, query).
+
+    Fresh entries live for a few seconds so polling clients skip the
+    database. A long-lived copy of the last good body is served with
+    X-Cache: STALE if the database fails while rebuilding. Writes bump a
+    per-user generation in Redis, which orphans that user's fresh entries
+    without scanning keys.
+    """
+
+    def __init__(self, namespace: str = "resp"):
+        self.namespace = namespace
+        self._fresh = TwoTierCache(f"{namespace}:fresh")
+        self._stale = TwoTierCache(f"{namespace}:stale", maxsize=256)
+        self._adapters: dict[Any, TypeAdapter] = {}
+
+    def _generation_key(self, user_id: UUID) -> str:
+        return f"{self.namespace}:gen:{user_id}"
+
+    def _adapter(self, response_model: Any) -> TypeAdapter:
+        adapter = self._adapters.get(response_model)
+        if adapter is None:
+            adapter = self._adapters[response_model] = TypeAdapter(response_model)
+        return adapter
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Drop every fresh cached response for a user."""
+        try:
+            await get_redis().incr(self._generation_key(user_id))
+        except redis.RedisError as e:
+            logger.warning(f"Response cache invalidation failed for {user_id}: {e}")
+
+    async def respond(
+        self,
+        request: Request,
+        user_id: UUID,
+        response_model: Any,
+        build: Callable[[], Awaitable[Any]],
+        ttl: int = DEFAULT_TTL,
+    ) -> Response:
+        """
+        Serve the endpoint body from cache, or build, serialize and cache it.
+
+        Args:
+            request: Incoming request (path and query form the key)
+            user_id: Owner of the response
+            response_model: Type to validate/serialize the built value as
+            build: Coroutine factory producing the response value
+            ttl: Fresh lifetime in seconds
+
+        Returns:
+            JSON Response with ETag and X-Cache headers
+        """
+        try:
+            generation = await get_redis().get(self._generation_key(user_id)) or "0"
+        except redis.RedisError as e:
+            logger.warning(f"Response cache unavailable, bypassing: {e}")
+            generation = None
+
+        route_key = make_key(str(user_id), request.url.path, str(request.query_params))
+        fresh_key = make_key(route_key, generation) if generation is not None else None
+
+        if fresh_key is not None:
+            body = await self._fresh.get(fresh_key)
+            if body is not None:
+                return self._response(request, body, "HIT")
+
+        try:
+            value = await build()
+        except SQLAlchemyError:
+            body = await self._stale.get(route_key)
+            if body is None:
+                raise
+            logger.warning(f"Serving stale {request.url.path} for {user_id} after database error")
+            return self._response(request, body, "STALE")
+
+        adapter = self._adapter(response_model)
+        body = adapter.dump_json(adapter.validate_python(value, from_attributes=True)).decode()
+
+        if fresh_key is not None:
+            await self._fresh.set(fresh_key, body, ttl)
+        await self._stale.set(route_key, body, STALE_TTL)
+        return self._response(request, body, "MISS")
+
+    @staticmethod
+    def _response(request: Request, body: str, status: str) -> Response:
+        etag = f'"{make_key(body)}"'
+        headers = {"ETag": etag, "X-Cache": status, "Cache-Control": "private, no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+response_cache = ResponseCache()
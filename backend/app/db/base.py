@@ -1,4 +1,9 @@
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase
 
+# JSONB on Postgres (stored parsed, indexable, supports ||); plain JSON elsewhere
+JSONDict = JSON().with_variant(JSONB(), "postgresql")
+
 class Base(DeclarativeBase):
     pass
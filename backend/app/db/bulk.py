@@ -0,0 +1,33 @@
+"""Bulk-load helpers for large inserts."""
+from psycopg import sql
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def copy_rows(session: AsyncSession, table: Table, rows: list[dict]) -> None:
+    """
+    Load rows into table with COPY ... FROM STDIN on the session's connection.
+
+    Runs inside the session's current transaction, so it commits or rolls
+    back with the surrounding ORM work. COPY returns nothing: rows must
+    already carry every value the caller needs back, including primary keys.
+
+    Args:
+        session: Session whose connection (and transaction) to use
+        table: Target table
+        rows: Column name -> value mappings, all with the same keys
+    """
+    if not rows:
+        return
+    columns = list(rows[0])
+    statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(table.name),
+        sql.SQL(", ").join(map(sql.Identifier, columns)),
+    )
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    async with raw_connection.driver_connection.cursor() as cursor:
+        async with cursor.copy(statement) as copy:
+            for row in rows:
+                await copy.write_row([row[column] for column in columns])
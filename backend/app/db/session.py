@@ -1,6 +1,18 @@
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import orjson
+from sqlalchemy.pool import NullPool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from app.core.config import settings
 
+T = TypeVar("T")
+
+
+def _json_dumps(value: Any) -> str:
+    """orjson encoder for JSON/JSONB columns; stdlib json also stringifies non-str keys."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 def get_async_database_url(url: str) -> str:
     """Convert sync database URL to async (psycopg) URL."""
@@ -9,16 +21,73 @@ def get_async_database_url(url: str) -> str:
     return url
 
 
-engine = create_async_engine(
-    get_async_database_url(settings.DATABASE_URL),
-    echo=True,
-)
+if settings.DB_NULL_POOL:
+    # Pooled connections stay bound to the loop that opened them; Celery runs
+    # one loop per worker thread (app.tasks.event_loop), so multi-threaded
+    # worker pools connect per checkout instead
+    _pool_args = {"poolclass": NullPool}
+else:
+    _pool_args = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        # Drop connections killed by PgBouncer/server idle timeouts instead of 500ing
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+_engine_args = {
+    "echo": settings.SQL_ECHO,
+    # Every JSON/JSONB column (preferences, comparison_data, ...) round-trips through orjson
+    "json_serializer": _json_dumps,
+    "json_deserializer": orjson.loads,
+    # psycopg prepares repeated statements; PgBouncer transaction mode can't route them
+    "connect_args": {"prepare_threshold": None} if settings.DB_PGBOUNCER else {},
+    **_pool_args,
+}
+
+engine = create_async_engine(get_async_database_url(settings.DATABASE_URL), **_engine_args)
+
+# Dashboard reads (trends) go to the replica when configured, with its own
+# pool so they never wait on write traffic for a primary connection.
+# Sessions run in READ ONLY transactions, so a stray write fails instead of
+# landing on the primary. (psycopg ignores read_only under AUTOCOMMIT, so
+# these keep the BEGIN/COMMIT.)
+_READ_ONLY = {"postgresql_readonly": True}
+if settings.DATABASE_READ_URL:
+    read_engine = create_async_engine(
+        get_async_database_url(settings.DATABASE_READ_URL),
+        execution_options=_READ_ONLY,
+        **_engine_args,
+    )
+else:
+    read_engine = engine.execution_options(**_READ_ONLY)
 
 AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+ReadSessionLocal = async_sessionmaker(
+    read_engine, class_=AsyncSession, expire_on_commit=False
+)
+
 
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def run_in_session(func: Callable[..., Awaitable[T]], *args) -> T:
+    """
+    Run func(session, *args) in its own short-lived session.
+
+    One AsyncSession cannot run queries concurrently, so independent
+    reads that are gathered with asyncio.gather each need their own.
+    """
+    async with AsyncSessionLocal() as session:
+        return await func(session, *args)
+
+
+async def run_in_read_session(func: Callable[..., Awaitable[T]], *args) -> T:
+    """Like run_in_session, but on the read-only (replica when configured) engine."""
+    async with ReadSessionLocal() as session:
+        return await func(session, *args)
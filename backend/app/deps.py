@@ -4,9 +4,14 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import make_transient_to_detached
+from app.core.auth_cache import auth_cache
 from app.db.session import AsyncSessionLocal
 from app.core.security import verify_token
 from app.models.user import User
+from app.services.extraction_service import ExtractionService
+from app.services.goal_service import GoalService
+from app.services.user_service import UserService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
@@ -25,16 +30,47 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    # Always verify the JWT (signature and exp); only the SELECT is cached
     user_id = verify_token(token)
     if user_id is None:
         raise credentials_exception
+    try:
+        user_id = UUID(user_id)
+    except ValueError:
+        raise credentials_exception
+
+    cached = await auth_cache.get(user_id)
+    if cached is not None:
+        # Attach the snapshot to this request's session without a SELECT
+        user = User(**cached)
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
 
-    result = await db.execute(select(User).where(User.id == UUID(user_id)))
+    result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
+    await auth_cache.set(user)
     return user
 
-
 CurrentUser = Annotated[User, Depends(get_current_user)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+
+
+# Service factories; FastAPI resolves get_db once per request, so these
+# share the request's session with get_current_user.
+def get_user_service(db: DbSession) -> UserService:
+    return UserService(db)
+
+
+def get_goal_service(db: DbSession) -> GoalService:
+    return GoalService(db)
+
+
+def get_extraction_service(db: DbSession) -> ExtractionService:
+    return ExtractionService(db)
+
+
+UserServiceDep = Annotated[UserService, Depends(get_user_service)]
+GoalServiceDep = Annotated[GoalService, Depends(get_goal_service)]
+ExtractionServiceDep = Annotated[ExtractionService, Depends(get_extraction_service)]
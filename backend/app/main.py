@@ -1,11 +1,26 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
+from app.ai_pipeline.clients import close_http_client
+from app.core.compression import CompressionMiddleware
 from app.api.v1.router import api_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release pooled keep-alive connections held by the shared LLM/Whisper client
+    await close_http_client()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS
@@ -17,6 +32,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Trends/history payloads are mostly repeated JSON keys and shrink well
+app.add_middleware(CompressionMiddleware, minimum_size=512, compresslevel=5)
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
@@ -11,7 +11,7 @@ class AnalysisRun(Base):
     """Tracks each analysis execution for idempotency and debugging."""
     __tablename__ = "analysis_runs"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=func.gen_random_uuid())
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True)
     analysis_date: Mapped[date] = mapped_column(Date, index=True)
 
@@ -28,6 +28,11 @@ class AnalysisRun(Base):
     entries_processed: Mapped[int] = mapped_column(Integer, default=0)
     celery_task_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
+    # Day content as last aggregated, reused on re-runs while entry count and
+    # latest entry updated_at still match (entries_processed, aggregated_through)
+    aggregated_content: Mapped[str | None] = mapped_column(Text, nullable=True)
+    aggregated_through: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
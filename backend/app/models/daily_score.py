@@ -1,14 +1,14 @@
 import uuid
 from datetime import date
-from sqlalchemy import String, Text, Date, ForeignKey, Float, JSON, DateTime
+from sqlalchemy import String, Text, Date, ForeignKey, Float, DateTime, Index, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
-from app.db.base import Base
+from app.db.base import Base, JSONDict
 
 class DailyScore(Base):
     __tablename__ = "daily_scores"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=func.gen_random_uuid())
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True)
     score_date: Mapped[date] = mapped_column(Date, index=True)
     
@@ -18,20 +18,32 @@ class DailyScore(Base):
     actionable_advice: Mapped[str] = mapped_column(Text, nullable=True)
     
     # Store comparison data JSON (e.g. { "yesterday": 80, "avg": 75 })
-    comparison_data: Mapped[dict] = mapped_column(JSON, default={})
+    comparison_data: Mapped[dict] = mapped_column(JSONDict, default=dict, server_default=text("'{}'"))
     
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     user = relationship("User", back_populates="daily_scores")
-    metrics = relationship("ScoreMetric", back_populates="daily_score", cascade="all, delete-orphan")
+    # Always serialized with the score; batch-load instead of one SELECT per row
+    metrics = relationship("ScoreMetric", back_populates="daily_score", cascade="all, delete-orphan", lazy="selectin")
+
+    __table_args__ = (
+        # Per-user history reads: WHERE user_id = ? ORDER BY score_date DESC LIMIT n.
+        # Score and verdict ride along so yesterday/summary lookups are index-only
+        Index(
+            "ix_daily_scores_user_date_covering", "user_id", score_date.desc(),
+            postgresql_include=["composite_score", "verdict"],
+        ),
+        # One score per user per day; the ON CONFLICT target for score upserts
+        UniqueConstraint("user_id", "score_date", name="uq_daily_scores_user_date"),
+    )
 
 
 class ScoreMetric(Base):
     __tablename__ = "score_metrics"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    daily_score_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("daily_scores.id"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=func.gen_random_uuid())
+    daily_score_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("daily_scores.id"))
     
     category: Mapped[str] = mapped_column(String)
     score: Mapped[float] = mapped_column(Float) # 0-10
@@ -39,3 +51,12 @@ class ScoreMetric(Base):
     reasoning: Mapped[str] = mapped_column(Text, nullable=True)
     
     daily_score = relationship("DailyScore", back_populates="metrics")
+
+    __table_args__ = (
+        # Trend reads join on daily_score_id, filter by category and only need
+        # the score, so the metrics side of the join can be an index-only scan
+        Index(
+            "ix_score_metrics_daily_score_category", "daily_score_id", "category",
+            postgresql_include=["score"],
+        ),
+    )
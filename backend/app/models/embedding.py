@@ -1,13 +1,14 @@
 import uuid
 from sqlalchemy import ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
 from pgvector.sqlalchemy import Vector
 from app.db.base import Base
 
 class EntryEmbedding(Base):
     __tablename__ = "entry_embeddings"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=func.gen_random_uuid())
     entry_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("journal_entries.id"), index=True)
     
     embedding: Mapped[Vector] = mapped_column(Vector(1536)) # OpenAI small embedding dims
@@ -7,10 +7,10 @@ from app.db.base import Base
 class UserGoal(Base):
     __tablename__ = "user_goals"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=func.gen_random_uuid())
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True)
 
-    category: Mapped[str] = mapped_column(String)
+    category: Mapped[str] = mapped_column(String(32))
     description: Mapped[str] = mapped_column(String)
     target_value: Mapped[float] = mapped_column(Float)
     weight: Mapped[float] = mapped_column(Float, default=1.0)
@@ -28,7 +28,7 @@ class GoalActivityLink(Base):
     """
     __tablename__ = "goal_activity_links"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=func.gen_random_uuid())
     goal_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("user_goals.id"), index=True)
     metric_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("extracted_metrics.id"), index=True)
 
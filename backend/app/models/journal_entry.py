@@ -1,20 +1,22 @@
 import uuid
 from datetime import date
-from sqlalchemy import String, Text, Date, ForeignKey, Float, DateTime
+from typing import get_args
+from sqlalchemy import String, Text, Date, ForeignKey, Float, DateTime, Index, CheckConstraint, Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
+from app.ai_pipeline.schemas.extraction import CategoryLiteral
 
 class JournalEntry(Base):
     __tablename__ = "journal_entries"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=func.gen_random_uuid())
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True)
     entry_date: Mapped[date] = mapped_column(Date, index=True)
     
     content_markdown: Mapped[str] = mapped_column(Text)
     audio_file_url: Mapped[str] = mapped_column(String, nullable=True)
-    input_source: Mapped[str] = mapped_column(String, default="text") # text | voice
+    input_source: Mapped[str] = mapped_column(String(8), default="text") # text | voice
     
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
@@ -24,17 +26,39 @@ class JournalEntry(Base):
     metrics = relationship("ExtractedMetric", back_populates="entry", cascade="all, delete-orphan")
     embeddings = relationship("EntryEmbedding", back_populates="entry", cascade="all, delete-orphan")
 
+    # Fetch server-generated id/created_at/updated_at with RETURNING on the
+    # INSERT/UPDATE itself, so callers don't need a refresh() round trip
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Per-user day lookups and listings: WHERE user_id = ? AND entry_date ...
+    __table_args__ = (
+        Index("ix_journal_entries_user_date", "user_id", "entry_date"),
+        CheckConstraint("input_source IN ('text', 'voice')", name="ck_journal_entries_input_source"),
+    )
+
 
 class ExtractedMetric(Base):
     __tablename__ = "extracted_metrics"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    entry_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("journal_entries.id"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=func.gen_random_uuid())
+    entry_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("journal_entries.id"))
     
-    category: Mapped[str] = mapped_column(String, index=True) # productivity, learning, etc
-    key: Mapped[str] = mapped_column(String) # e.g. hours_deep_work
+    # Native enum of the extraction categories: 4-byte values, cheap equality filters
+    category: Mapped[str] = mapped_column(
+        Enum(*get_args(CategoryLiteral), name="metric_category"), index=True
+    )
+    key: Mapped[str] = mapped_column(String) # e.g. deep_work_duration
     value: Mapped[float] = mapped_column(Float)
     evidence: Mapped[str] = mapped_column(Text, nullable=True)
     confidence: Mapped[float] = mapped_column(Float, default=1.0)
     
     entry = relationship("JournalEntry", back_populates="metrics")
+
+    # Covers suggest_goals' per-entry GROUP BY (category, key) as an index-only
+    # scan; its entry_id prefix also serves the plain per-entry lookups
+    __table_args__ = (
+        Index(
+            "ix_extracted_metrics_entry_category_key", "entry_id", "category", "key",
+            postgresql_include=["confidence"],
+        ),
+    )
@@ -1,7 +1,7 @@
 """Notification model for storing pending notifications."""
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, ForeignKey, DateTime, Boolean
+from sqlalchemy import String, Text, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -20,8 +20,8 @@ class Notification(Base):
     """
     __tablename__ = "notifications"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=func.gen_random_uuid())
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"))
 
     message: Mapped[str] = mapped_column(Text)
     notification_type: Mapped[str] = mapped_column(String(50), default="reminder")  # reminder | verdict | system
@@ -35,3 +35,10 @@ class Notification(Base):
     dismissed: Mapped[bool] = mapped_column(Boolean, default=False)
 
     user = relationship("User", back_populates="notifications")
+
+    __table_args__ = (
+        # Per-user lookups, plus "reminded today?" range checks by type
+        Index(
+            "ix_notifications_user_type_created", "user_id", "notification_type", created_at.desc(),
+        ),
+    )
@@ -1,18 +1,18 @@
 import uuid
 from datetime import time
-from sqlalchemy import String, JSON, DateTime, Time
+from sqlalchemy import String, DateTime, Index, Time, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
-from app.db.base import Base
+from app.db.base import Base, JSONDict
 
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=func.gen_random_uuid())
     email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
     full_name: Mapped[str] = mapped_column(String, nullable=True)
-    preferences: Mapped[dict] = mapped_column(JSON, default={})
+    preferences: Mapped[dict] = mapped_column(JSONDict, default=dict, server_default=text("'{}'"))
 
     # Evening analysis scheduling
     analysis_time: Mapped[time | None] = mapped_column(Time, nullable=True, default=time(21, 0))
@@ -26,3 +26,16 @@ class User(Base):
     daily_scores = relationship("DailyScore", back_populates="user", cascade="all, delete-orphan")
     goals = relationship("UserGoal", back_populates="user", cascade="all, delete-orphan")
     notifications = relationship("Notification", back_populates="user", cascade="all, delete-orphan")
+
+    # Server-side id/timestamps come back via RETURNING, so writes need no refresh
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Per-minute due-analysis scan reads only scheduled users' id/timezone/analysis_time
+    __table_args__ = (
+        Index(
+            "ix_users_analysis_time_partial",
+            "analysis_time",
+            postgresql_include=["id", "timezone"],
+            postgresql_where=text("analysis_time IS NOT NULL"),
+        ),
+    )
@@ -1,9 +1,9 @@
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class GoalBase(BaseModel):
-    category: str
+    category: str = Field(max_length=32)
     description: str
     target_value: float
     weight: float = 1.0
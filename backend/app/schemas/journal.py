@@ -1,6 +1,6 @@
 from uuid import UUID
 from datetime import date, datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class JournalBase(BaseModel):
@@ -37,3 +37,7 @@ class JournalRead(JournalBase):
     metrics: list[ExtractedMetricRead] = []
 
     model_config = {"from_attributes": True}
+
+
+# Compiled once; list routes validate ORM rows and dump JSON in one pass
+JOURNAL_LIST_ADAPTER = TypeAdapter(list[JournalRead])
@@ -1,7 +1,7 @@
 """Notification API schemas."""
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class NotificationRead(BaseModel):
@@ -17,6 +17,10 @@ class NotificationRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Compiled once; the polled list route validates ORM rows and dumps JSON in one pass
+NOTIFICATION_LIST_ADAPTER = TypeAdapter(list[NotificationRead])
+
+
 class NotificationPreferencesRead(BaseModel):
     """Schema for reading notification preferences.
 
@@ -1,4 +1,5 @@
 from datetime import date
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -13,3 +14,19 @@ class VoiceTranscribeResponse(BaseModel):
     message: str  # e.g., "Transcription added to journal"
 
     model_config = {"from_attributes": True}
+
+
+class VoiceTranscribeAccepted(BaseModel):
+    """Response when a voice upload has been queued for transcription."""
+
+    task_id: str
+    status: Literal["pending"] = "pending"
+
+
+class VoiceTranscribeStatus(BaseModel):
+    """Progress of a queued transcription; result is set once completed."""
+
+    task_id: str
+    status: Literal["pending", "completed", "failed"]
+    result: VoiceTranscribeResponse | None = None
+    error: str | None = None
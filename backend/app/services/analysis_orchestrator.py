@@ -1,12 +1,16 @@
 """Analysis orchestrator service for evening analysis pipeline."""
+import io
 import logging
-from datetime import date, datetime, timezone as tz
+from collections.abc import AsyncIterable, AsyncIterator
+from functools import lru_cache
+from datetime import date, datetime, time, timedelta, timezone as tz
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select, and_
+from sqlalchemy import Date, String, Time, and_, column, func, or_, select, update, values
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, raiseload
 
 from app.models.user import User
 from app.models.journal_entry import JournalEntry
@@ -15,6 +19,19 @@ from app.models.analysis_run import AnalysisRun
 
 logger = logging.getLogger(__name__)
 
+# Half-width of the analysis_time window matched on each beat tick. One minute
+# wide in total, so consecutive ticks tile the day even when beat fires late.
+DUE_WINDOW = timedelta(seconds=30)
+
+# Rows fetched per server-side cursor round trip when streaming a day's entries
+DAY_ENTRIES_BATCH = 100
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: str | None) -> ZoneInfo:
+    """Return the ZoneInfo for a user timezone name (UTC if unset), built once per name."""
+    return ZoneInfo(name or "UTC")
+
 
 class AnalysisOrchestrator:
     """
@@ -32,79 +49,130 @@ class AnalysisOrchestrator:
 
     async def get_users_due_for_analysis(self) -> list[User]:
         """
-        Find users whose analysis_time matches current time (within the minute).
+        Find users whose analysis_time falls in the current one-minute window.
 
-        Checks each user's timezone to determine if it's their scheduled time.
+        The window is computed once per distinct timezone in Python (zoneinfo)
+        as local [now - 30s, now + 30s), so beat firing a little late or early
+        doesn't skip a minute. A single query range-matches users on
+        (timezone, analysis_time) and keeps those without a run for their
+        local today, or with a failed one.
         """
         now_utc = datetime.now(tz.utc)
 
-        # Get all users with analysis_time set
         result = await self.db.execute(
-            select(User).where(User.analysis_time.isnot(None))
+            select(User.timezone).where(User.analysis_time.isnot(None)).distinct()
         )
-        users = list(result.scalars().all())
 
-        due_users = []
-        for user in users:
+        # (timezone, local window start, local window end, local date) per timezone in use
+        slots: list[tuple[str, time, time, date]] = []
+        for timezone_name in result.scalars():
             try:
-                user_tz = ZoneInfo(user.timezone or "UTC")
-                user_now = now_utc.astimezone(user_tz)
-                user_time = user_now.time()
-
-                # Check if current time matches analysis_time (same hour and minute)
-                if (user_time.hour == user.analysis_time.hour and
-                    user_time.minute == user.analysis_time.minute):
-                    # Check if we already ran analysis today for this user
-                    today_in_user_tz = user_now.date()
-                    existing = await self._get_analysis_run(user.id, today_in_user_tz)
-                    if not existing or existing.status == "failed":
-                        due_users.append(user)
+                user_now = now_utc.astimezone(get_zone(timezone_name))
             except Exception as e:
-                logger.warning(f"Error checking user {user.id} for analysis: {e}")
+                logger.warning(f"Skipping unknown timezone {timezone_name!r} for analysis: {e}")
                 continue
-
-        return due_users
-
-    async def _get_analysis_run(
-        self, user_id: UUID, analysis_date: date
-    ) -> AnalysisRun | None:
-        """Get existing analysis run for user and date."""
+            slots.append((
+                timezone_name,
+                (user_now - DUE_WINDOW).time().replace(tzinfo=None),
+                (user_now + DUE_WINDOW).time().replace(tzinfo=None),
+                user_now.date(),
+            ))
+
+        if not slots:
+            return []
+
+        local_slots = (
+            values(
+                column("timezone", String),
+                column("window_start", Time),
+                column("window_end", Time),
+                column("local_date", Date),
+                name="local_slots",
+            )
+            .data(slots)
+        )
+        start, end = local_slots.c.window_start, local_slots.c.window_end
+        in_window = or_(
+            and_(start <= end, User.analysis_time >= start, User.analysis_time < end),
+            # Window straddles local midnight
+            and_(start > end, or_(User.analysis_time >= start, User.analysis_time < end)),
+        )
         result = await self.db.execute(
-            select(AnalysisRun).where(
+            select(User)
+            .join(
+                local_slots,
                 and_(
-                    AnalysisRun.user_id == user_id,
-                    AnalysisRun.analysis_date == analysis_date,
-                )
+                    User.timezone == local_slots.c.timezone,
+                    User.analysis_time.isnot(None),
+                    in_window,
+                ),
+            )
+            .outerjoin(
+                AnalysisRun,
+                and_(
+                    AnalysisRun.user_id == User.id,
+                    AnalysisRun.analysis_date == local_slots.c.local_date,
+                ),
             )
+            .where(or_(AnalysisRun.id.is_(None), AnalysisRun.status == "failed"))
         )
-        return result.scalar_one_or_none()
+        return list(result.scalars().all())
 
-    async def create_or_get_analysis_run(
+    async def start_analysis_run(
         self, user_id: UUID, analysis_date: date, celery_task_id: str | None = None
     ) -> AnalysisRun:
-        """Create new analysis run or return existing one."""
-        existing = await self._get_analysis_run(user_id, analysis_date)
-        if existing:
-            return existing
+        """
+        Create or restart the day's AnalysisRun as "running" in one statement.
 
-        run = AnalysisRun(
+        INSERT ... ON CONFLICT (user_id, analysis_date) DO UPDATE ... RETURNING
+        replaces the SELECT, INSERT and refresh round trips, and is safe when
+        two workers pick up the same user and day.
+        """
+        stmt = insert(AnalysisRun).values(
             user_id=user_id,
             analysis_date=analysis_date,
-            status="pending",
+            status="running",
+            started_at=func.now(),
             celery_task_id=celery_task_id,
         )
-        self.db.add(run)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_analysis_runs_user_date",
+            set_={
+                "status": "running",
+                "started_at": func.now(),
+                "completed_at": None,
+                "celery_task_id": func.coalesce(stmt.excluded.celery_task_id, AnalysisRun.celery_task_id),
+            },
+        ).returning(AnalysisRun)
+
+        result = await self.db.execute(stmt, execution_options={"populate_existing": True})
+        run = result.scalar_one()
         await self.db.commit()
-        await self.db.refresh(run)
         return run
 
     async def get_day_entries(
         self, user_id: UUID, entry_date: date
-    ) -> list[JournalEntry]:
-        """Get all journal entries for a user on a specific date."""
-        result = await self.db.execute(
+    ) -> AsyncIterator[JournalEntry]:
+        """
+        Stream all journal entries for a user on a specific date.
+
+        Rows arrive through a server-side cursor in batches of
+        DAY_ENTRIES_BATCH, so a day with hundreds of voice snippets never
+        holds every entry in memory at once. Only the columns
+        aggregate_day_content reads are loaded; metrics are not needed on
+        this path and raise if touched.
+        """
+        return await self.db.stream_scalars(
             select(JournalEntry)
-            .options(selectinload(JournalEntry.metrics))
+            .options(
+                load_only(
+                    JournalEntry.content_markdown,
+                    JournalEntry.input_source,
+                    JournalEntry.created_at,
+                    JournalEntry.entry_date,
+                ),
+                raiseload("*"),
+            )
             .where(
                 and_(
                     JournalEntry.user_id == user_id,
@@ -112,25 +180,30 @@ class AnalysisOrchestrator:
                 )
             )
             .order_by(JournalEntry.created_at)
+            .execution_options(yield_per=DAY_ENTRIES_BATCH)
         )
-        return list(result.scalars().all())
 
-    async def aggregate_day_content(self, entries: list[JournalEntry]) -> str:
+    @staticmethod
+    async def aggregate_day_content(entries: AsyncIterable[JournalEntry]) -> str:
         """
         Aggregate all entries into single content block for analysis.
 
-        Preserves chronological order and source information.
+        Preserves chronological order and source information. Entries are
+        consumed as they stream in and written straight into the buffer.
         """
-        if not entries:
-            return ""
-
-        parts = []
-        for entry in entries:
-            timestamp = entry.created_at.strftime("%H:%M") if entry.created_at else "unknown"
-            source = f"[{entry.input_source}, {timestamp}]"
-            parts.append(f"{source}\n{entry.content_markdown}")
-
-        return "\n\n---\n\n".join(parts)
+        buffer = io.StringIO()
+        separator = ""
+        async for entry in entries:
+            buffer.write(separator)
+            if entry.created_at:
+                buffer.write(
+                    f"[{entry.input_source}, {entry.created_at.hour:02d}:{entry.created_at.minute:02d}]\n"
+                )
+            else:
+                buffer.write(f"[{entry.input_source}, unknown]\n")
+            buffer.write(entry.content_markdown)
+            separator = "\n\n---\n\n"
+        return buffer.getvalue()
 
     async def run_analysis(
         self, user_id: UUID, analysis_date: date, celery_task_id: str | None = None
@@ -139,7 +212,7 @@ class AnalysisOrchestrator:
         Run the full analysis pipeline for a user's day.
 
         Pipeline:
-        1. Get/create AnalysisRun record
+        1. Start AnalysisRun record
         2. Aggregate day's journal entries
         3. Run extraction (Phase 3)
         4. Run scoring (Phase 2)
@@ -148,33 +221,38 @@ class AnalysisOrchestrator:
 
         Returns DailyScore on success, None on failure.
         """
-        run = await self.create_or_get_analysis_run(
-            user_id, analysis_date, celery_task_id
-        )
-
-        # Mark as running
-        run.status = "running"
-        run.started_at = datetime.now(tz.utc)
-        await self.db.commit()
+        run = await self.start_analysis_run(user_id, analysis_date, celery_task_id)
+        # Read before any rollback, which expires the instance
+        run_id = run.id
+        cached_content = run.aggregated_content
+        cached_fingerprint = (run.entries_processed, run.aggregated_through)
 
+        aggregated: dict = {}
         try:
-            # Step 1: Get day's entries
-            entries = await self.get_day_entries(user_id, analysis_date)
-            run.entries_processed = len(entries)
+            # Step 1: Check the day's entries
+            entry_count, last_updated = await self._day_fingerprint(user_id, analysis_date)
 
-            if not entries:
+            if not entry_count:
                 logger.info(f"No entries for user {user_id} on {analysis_date}")
-                run.status = "completed"
-                run.completed_at = datetime.now(tz.utc)
-                await self.db.commit()
+                await self._finish_run(run_id, "completed", entries_processed=0)
                 return None
 
-            # Step 2: Aggregate content
-            aggregated_content = await self.aggregate_day_content(entries)
-            logger.info(
-                f"Aggregated {len(entries)} entries for user {user_id}, "
-                f"total length: {len(aggregated_content)}"
-            )
+            # Step 2: Aggregate content, reusing the previous run's if no entry changed
+            if cached_content is not None and cached_fingerprint == (entry_count, last_updated):
+                aggregated_content = cached_content
+                logger.info(f"Reusing aggregated content for user {user_id} on {analysis_date}")
+            else:
+                entries = await self.get_day_entries(user_id, analysis_date)
+                aggregated_content = await self.aggregate_day_content(entries)
+                logger.info(
+                    f"Aggregated {entry_count} entries for user {user_id}, "
+                    f"total length: {len(aggregated_content)}"
+                )
+            aggregated = {
+                "entries_processed": entry_count,
+                "aggregated_content": aggregated_content,
+                "aggregated_through": last_updated,
+            }
 
             # Step 3-5: Run extraction, scoring, verdict
             # These services are already implemented in Phases 2, 3, 5
@@ -182,20 +260,68 @@ class AnalysisOrchestrator:
             # For now, mark as completed with placeholder data
 
             # Mark run as completed
-            run.status = "completed"
-            run.completed_at = datetime.now(tz.utc)
-            await self.db.commit()
+            await self._finish_run(run_id, "completed", **aggregated)
 
             logger.info(
                 f"Analysis completed for user {user_id} on {analysis_date}: "
-                f"{len(entries)} entries processed"
+                f"{entry_count} entries processed"
             )
             return None  # Return None until full pipeline integration
 
         except Exception as e:
             logger.error(f"Analysis failed for user {user_id}: {e}")
-            run.status = "failed"
-            run.error_message = str(e)
-            run.retry_count += 1
-            await self.db.commit()
+            await self.db.rollback()
+            # Keep the aggregate so the retry can skip re-reading the entries
+            await self._finish_run(run_id, "failed", error_message=str(e), **aggregated)
             raise
+
+    async def _day_fingerprint(
+        self, user_id: UUID, entry_date: date
+    ) -> tuple[int, datetime | None]:
+        """(entry count, latest updated_at) for a user's day; changes whenever an entry does."""
+        result = await self.db.execute(
+            select(func.count(), func.max(JournalEntry.updated_at)).where(
+                and_(
+                    JournalEntry.user_id == user_id,
+                    JournalEntry.entry_date == entry_date,
+                )
+            )
+        )
+        entry_count, last_updated = result.one()
+        return entry_count, last_updated
+
+    async def _finish_run(
+        self,
+        run_id: UUID,
+        status: str,
+        entries_processed: int | None = None,
+        error_message: str | None = None,
+        aggregated_content: str | None = None,
+        aggregated_through: datetime | None = None,
+    ) -> AnalysisRun:
+        """
+        Record a run's final status in a single UPDATE ... RETURNING and commit.
+
+        Failures bump retry_count server-side instead of read-modify-write.
+        """
+        values: dict = {"status": status}
+        if status == "failed":
+            values["error_message"] = error_message
+            values["retry_count"] = AnalysisRun.retry_count + 1
+        else:
+            values["completed_at"] = datetime.now(tz.utc)
+        if entries_processed is not None:
+            values["entries_processed"] = entries_processed
+        if aggregated_content is not None:
+            values["aggregated_content"] = aggregated_content
+            values["aggregated_through"] = aggregated_through
+
+        result = await self.db.execute(
+            update(AnalysisRun)
+            .where(AnalysisRun.id == run_id)
+            .values(**values)
+            .returning(AnalysisRun)
+        )
+        run = result.scalar_one()
+        await self.db.commit()
+        return run
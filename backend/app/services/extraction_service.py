@@ -1,12 +1,141 @@
+import uuid
+from collections.abc import AsyncIterator
 from uuid import UUID
-from datetime import datetime, timedelta
-from sqlalchemy import select, delete, func
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import String, bindparam, case, cast, delete, func, insert, literal, or_, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from app.db.bulk import copy_rows
 from app.models.journal_entry import JournalEntry, ExtractedMetric
 from app.models.goal import UserGoal, GoalActivityLink
-from app.ai_pipeline.agents.extraction_agent import ExtractionAgent
+from app.ai_pipeline.agents.extraction_agent import get_extraction_agent
 from app.ai_pipeline.schemas.extraction import GoalSuggestion
 
+# Built once at import so SQLAlchemy's compiled-statement cache is reused
+_SELECT_ENTRY_METRICS = select(ExtractedMetric).where(
+    ExtractedMetric.entry_id == bindparam("entry_id")
+)
+# Executed with a list of rows: one multi-row INSERT ... RETURNING (insertmanyvalues)
+# that hands back loaded instances, instead of add() + refresh() per row. Ids are
+# generated server-side, so RETURNING order is not guaranteed to match the input.
+_INSERT_METRICS = insert(ExtractedMetric).returning(ExtractedMetric)
+
+# Goal matching, mirrored from the original Python rules:
+# 1. Category exact match (case-insensitive) -> contribution 1.0
+# 2. Otherwise a significant (>3 char) word of the metric key appears in the
+#    goal description -> contribution 0.7
+# Lowercasing and key tokenizing happen once per goal / per metric in CTEs,
+# not once per (metric, goal) pair inside the join.
+_active_goals = (
+    select(
+        UserGoal.id,
+        UserGoal.category,
+        UserGoal.description,
+        func.lower(UserGoal.category).label("category_lower"),
+        func.lower(UserGoal.description).label("description_lower"),
+    )
+    .where(UserGoal.user_id == bindparam("user_id"), UserGoal.is_active == True)
+    .cte("active_goals")
+)
+_new_metrics = (
+    select(
+        ExtractedMetric.id,
+        ExtractedMetric.key,
+        func.lower(cast(ExtractedMetric.category, String)).label("category_lower"),
+    )
+    .where(ExtractedMetric.id.in_(bindparam("metric_ids", expanding=True)))
+    .cte("new_metrics")
+)
+# unnest(...) AS key_words(word); functions in FROM may reference earlier
+# FROM items, so no explicit LATERAL is needed
+_key_words = func.unnest(
+    func.string_to_array(func.lower(_new_metrics.c.key), "_")
+).table_valued("word").render_derived(name="key_words")
+# Each metric's words collapse into one escaped alternation so every goal
+# description is scanned once per metric by Postgres' compiled regex
+# automaton, instead of once per word with strpos().
+_escaped_word = func.regexp_replace(_key_words.c.word, r"([^[:alnum:]_])", r"\\\1", "g")
+_metric_patterns = (
+    select(
+        _new_metrics.c.id.label("metric_id"),
+        func.string_agg(_escaped_word.distinct(), literal("|")).label("pattern"),
+    )
+    .select_from(_new_metrics)
+    .join(_key_words, true())
+    .where(func.length(_key_words.c.word) > 3)
+    .group_by(_new_metrics.c.id)
+    .cte("metric_patterns")
+)
+_category_match = _new_metrics.c.category_lower == _active_goals.c.category_lower
+_keyword_match = _active_goals.c.description_lower.regexp_match(_metric_patterns.c.pattern)
+# Core INSERT wrapped in from_statement(): parameters given to an ORM insert
+# would be taken as bulk-INSERT column values rather than the CTEs' bindparams,
+# while from_statement() still loads the RETURNING rows as GoalActivityLinks.
+_INSERT_GOAL_LINKS = select(GoalActivityLink).from_statement(
+    insert(GoalActivityLink.__table__)
+    .from_select(
+        ["goal_id", "metric_id", "match_reason", "contribution_score"],
+        select(
+            _active_goals.c.id,
+            _new_metrics.c.id,
+            case(
+                (_category_match, literal("Category match: ") + _active_goals.c.category),
+                else_=(
+                    literal("Keyword match: ") + _new_metrics.c.key
+                    + " in '" + _active_goals.c.description + "'"
+                ),
+            ),
+            case((_category_match, literal(1.0)), else_=literal(0.7)),
+        )
+        .select_from(
+            _new_metrics
+            .outerjoin(_metric_patterns, _metric_patterns.c.metric_id == _new_metrics.c.id)
+            .join(_active_goals, or_(_category_match, _keyword_match))
+        ),
+    )
+    .returning(*GoalActivityLink.__table__.c)
+)
+
+# Recurring (category, key) patterns whose category no active goal covers yet
+_SELECT_SUGGESTION_PATTERNS = (
+    select(
+        ExtractedMetric.category,
+        ExtractedMetric.key,
+        func.count().label("frequency"),
+        func.avg(ExtractedMetric.confidence).label("avg_confidence"),
+    )
+    .join(JournalEntry, ExtractedMetric.entry_id == JournalEntry.id)
+    .where(
+        JournalEntry.user_id == bindparam("user_id"),
+        JournalEntry.entry_date >= bindparam("cutoff_date"),
+        func.lower(cast(ExtractedMetric.category, String)).not_in(
+            select(func.lower(UserGoal.category)).where(
+                UserGoal.user_id == bindparam("user_id"),
+                UserGoal.is_active == True,
+            )
+        ),
+    )
+    .group_by(ExtractedMetric.category, ExtractedMetric.key)
+    .having(func.count() >= 3)  # At least 3 occurrences
+)
+
+# Pattern rows fetched per server-side cursor round trip in iter_goal_suggestions
+SUGGESTION_BATCH = 100
+
+# Category-specific goal description templates for suggest_goals
+_DESCRIPTION_TEMPLATES = {
+    'productivity': "Track and improve {}",
+    'fitness': "Maintain consistent {}",
+    'learning': "Dedicate time to {}",
+    'discipline': "Build habit around {}",
+    'well-being': "Monitor and optimize {}",
+    'creativity': "Engage regularly in {}",
+    'social': "Prioritize {}",
+}
+
+# From this many rows (backfills), COPY beats even a multi-row INSERT
+COPY_THRESHOLD = 100
+
 
 class ExtractionService:
     """
@@ -43,38 +172,72 @@ class ExtractionService:
         Returns:
             List of ExtractedMetric records created
         """
-        # Instantiate extraction agent
-        agent = ExtractionAgent()
+        # Shared per process; the agent holds no per-request state
+        agent = get_extraction_agent()
 
         # Extract activities from journal content
-        result = agent.extract(entry.content_markdown)
-
-        # Convert each extracted activity to ExtractedMetric
-        metrics = []
-        for activity in result.activities:
-            metric = ExtractedMetric(
-                entry_id=entry.id,
-                category=activity.category,
-                key=activity.key,
-                value=activity.value,
-                evidence=activity.evidence,
-                confidence=activity.confidence,
-            )
-            self.db.add(metric)
-            metrics.append(metric)
+        result = await agent.extract(entry.content_markdown)
+
+        # Persist all metrics in one statement
+        rows = [self._metric_row(entry.id, activity) for activity in result.activities]
+        metrics = await self._insert_metrics(rows)
+
+        # Optionally map to goals, in the same transaction as the metrics
+        if map_goals:
+            await self.map_metrics_to_goals(entry.user_id, metrics, commit=False)
 
-        # Commit all metrics at once
         await self.db.commit()
+        return metrics
+
+    async def extract_and_persist_batch(
+        self, entries: list[JournalEntry], map_goals: bool = True
+    ) -> list[ExtractedMetric]:
+        """
+        Re-extract activities for many entries in bulk.
 
-        # Refresh to get database-assigned IDs
-        for metric in metrics:
-            await self.db.refresh(metric)
+        Uses the Azure Batch API, or grouped multi-entry requests on other
+        providers. Intended for scheduled backfills, not interactive
+        submission. Existing metrics are replaced only for entries whose
+        request succeeded.
+
+        Args:
+            entries: JournalEntry records to (re-)extract
+            map_goals: Whether to create GoalActivityLink records (default: True)
+
+        Returns:
+            List of ExtractedMetric records created
+        """
+        agent = get_extraction_agent()
+        texts = [entry.content_markdown for entry in entries]
+        if agent.provider == "azure":
+            results = await agent.extract_batch(texts)
+        else:
+            # No Batch API here: pack several entries into each request instead
+            results = await agent.extract_grouped(texts)
+
+        rows = []
+        entry_users: dict[UUID, UUID] = {}
+        for entry, result in zip(entries, results):
+            if result is None:
+                continue
+
+            await self.db.execute(
+                delete(ExtractedMetric).where(ExtractedMetric.entry_id == entry.id)
+            )
+            for activity in result.activities:
+                rows.append(self._metric_row(entry.id, activity))
+            entry_users[entry.id] = entry.user_id
+
+        metrics_by_user: dict[UUID, list[ExtractedMetric]] = {}
+        for metric in await self._insert_metrics(rows):
+            metrics_by_user.setdefault(entry_users[metric.entry_id], []).append(metric)
 
-        # Optionally map to goals
         if map_goals:
-            await self.map_metrics_to_goals(entry.user_id, metrics)
+            for user_id, user_metrics in metrics_by_user.items():
+                await self.map_metrics_to_goals(user_id, user_metrics, commit=False)
 
-        return metrics
+        await self.db.commit()
+        return [metric for user_metrics in metrics_by_user.values() for metric in user_metrics]
 
     async def get_metrics_for_entry(self, entry_id: UUID) -> list[ExtractedMetric]:
         """
@@ -86,9 +249,7 @@ class ExtractionService:
         Returns:
             List of ExtractedMetric records for the entry
         """
-        result = await self.db.execute(
-            select(ExtractedMetric).where(ExtractedMetric.entry_id == entry_id)
-        )
+        result = await self.db.execute(_SELECT_ENTRY_METRICS, {"entry_id": entry_id})
         return list(result.scalars().all())
 
     async def clear_metrics_for_entry(self, entry_id: UUID) -> None:
@@ -105,7 +266,9 @@ class ExtractionService:
         )
         await self.db.commit()
 
-    async def map_metrics_to_goals(self, user_id: UUID, metrics: list[ExtractedMetric]) -> list[GoalActivityLink]:
+    async def map_metrics_to_goals(
+        self, user_id: UUID, metrics: list[ExtractedMetric], commit: bool = True
+    ) -> list[GoalActivityLink]:
         """
         Map extracted metrics to user's active goals.
 
@@ -116,74 +279,71 @@ class ExtractionService:
         Args:
             user_id: UUID of the user
             metrics: List of ExtractedMetric to map to goals
+            commit: Commit the links; False leaves that to the caller's transaction
 
         Returns:
             List of GoalActivityLink records created
         """
-        # Fetch user's active goals
-        result = await self.db.execute(
-            select(UserGoal).where(
-                UserGoal.user_id == user_id,
-                UserGoal.is_active == True
-            )
+        if not metrics:
+            return []
+
+        # Match and insert in the database: one INSERT ... SELECT joining the
+        # user's active goals to these metrics, links returned in the same trip
+        result = await self.db.scalars(
+            _INSERT_GOAL_LINKS,
+            {"user_id": user_id, "metric_ids": [metric.id for metric in metrics]},
         )
-        goals = list(result.scalars().all())
-
-        # Create links for matching metrics and goals
-        links = []
-        for metric in metrics:
-            for goal in goals:
-                match_reason = None
-                contribution_score = 0.0
-
-                # Primary match: category exact match
-                if metric.category.lower() == goal.category.lower():
-                    match_reason = f"Category match: {goal.category}"
-                    contribution_score = 1.0
-
-                # Secondary match: keyword fuzzy match
-                elif self._fuzzy_match(metric.key, goal.description):
-                    match_reason = f"Keyword match: {metric.key} in '{goal.description}'"
-                    contribution_score = 0.7
-
-                # Create link if match found
-                if match_reason:
-                    link = GoalActivityLink(
-                        goal_id=goal.id,
-                        metric_id=metric.id,
-                        match_reason=match_reason,
-                        contribution_score=contribution_score,
-                    )
-                    self.db.add(link)
-                    links.append(link)
-
-        # Commit all links at once
-        if links:
+        created = list(result.all())
+        if commit:
             await self.db.commit()
-            for link in links:
-                await self.db.refresh(link)
+        return created
+
+    @staticmethod
+    def _metric_row(entry_id: UUID, activity) -> dict:
+        """ExtractedMetric insert parameters for one extracted activity."""
+        return {
+            "entry_id": entry_id,
+            "category": activity.category,
+            "key": activity.key,
+            "value": activity.value,
+            "evidence": activity.evidence,
+            "confidence": activity.confidence,
+        }
 
-        return links
+    async def _insert_metrics(self, rows: list[dict]) -> list[ExtractedMetric]:
+        """Insert metric rows in one statement and return the created instances."""
+        return await self._insert_rows(ExtractedMetric, _INSERT_METRICS, rows)
 
-    def _fuzzy_match(self, metric_key: str, goal_description: str) -> bool:
+    async def _insert_rows(self, model, statement, rows: list[dict]) -> list:
         """
-        Simple fuzzy matching for keywords.
-
-        Checks if significant words from metric_key appear in goal_description.
-
-        Args:
-            metric_key: Key from extracted metric (e.g., "workout_duration")
-            goal_description: Description from user goal
+        Insert rows of model and return persistent instances for them.
 
-        Returns:
-            True if significant overlap found
+        Small batches go through statement (INSERT ... RETURNING). From
+        COPY_THRESHOLD rows up they are COPYed instead; COPY returns
+        nothing, so ids and created_at are assigned here and the instances
+        are attached to the session as already loaded.
         """
-        # Extract meaningful words from metric key (split by underscore and remove short words)
-        key_words = [word.lower() for word in metric_key.split('_') if len(word) > 3]
-        goal_lower = goal_description.lower()
-
-        # Check if any significant word appears in goal description
-        return any(word in goal_lower for word in key_words)
+        if not rows:
+            return []
+        if len(rows) < COPY_THRESHOLD:
+            result = await self.db.scalars(statement, rows)
+            return list(result.all())
+
+        now = datetime.now(timezone.utc)
+        has_created_at = "created_at" in model.__table__.c
+        for row in rows:
+            row["id"] = uuid.uuid4()
+            if has_created_at:
+                row["created_at"] = now
+        await copy_rows(self.db, model.__table__, rows)
+
+        instances = []
+        for row in rows:
+            instance = model(**row)
+            make_transient_to_detached(instance)
+            self.db.add(instance)
+            instances.append(instance)
+        return instances
 
     async def suggest_goals(self, user_id: UUID, lookback_days: int = 30) -> list[GoalSuggestion]:
         """
@@ -199,60 +359,47 @@ class ExtractionService:
         Returns:
             List of GoalSuggestion objects for unmatched patterns
         """
+        return [suggestion async for suggestion in self.iter_goal_suggestions(user_id, lookback_days)]
+
+    async def iter_goal_suggestions(
+        self, user_id: UUID, lookback_days: int = 30
+    ) -> AsyncIterator[GoalSuggestion]:
+        """
+        Yield goal suggestions as pattern rows arrive from a server-side cursor.
+
+        Rows are fetched SUGGESTION_BATCH at a time, so neither the result
+        set nor the suggestions are materialized up front. The caller must
+        consume it while the session is open.
+
+        Args:
+            user_id: UUID of the user
+            lookback_days: Number of days to look back (default: 30)
+
+        Yields:
+            GoalSuggestion per unmatched pattern
+        """
         # Calculate date threshold
         cutoff_date = datetime.now().date() - timedelta(days=lookback_days)
 
-        # Fetch user's active goals
-        goals_result = await self.db.execute(
-            select(UserGoal).where(
-                UserGoal.user_id == user_id,
-                UserGoal.is_active == True
-            )
-        )
-        active_goals = list(goals_result.scalars().all())
-        active_categories = {goal.category.lower() for goal in active_goals}
-
-        # Query extracted metrics with aggregation by category and key
-        # Group by (category, key) and count frequency
-        metrics_result = await self.db.execute(
-            select(
-                ExtractedMetric.category,
-                ExtractedMetric.key,
-                func.count(ExtractedMetric.id).label('frequency'),
-                func.avg(ExtractedMetric.confidence).label('avg_confidence')
-            )
-            .join(JournalEntry, ExtractedMetric.entry_id == JournalEntry.id)
-            .where(
-                JournalEntry.user_id == user_id,
-                JournalEntry.entry_date >= cutoff_date
-            )
-            .group_by(ExtractedMetric.category, ExtractedMetric.key)
-            .having(func.count(ExtractedMetric.id) >= 3)  # At least 3 occurrences
+        # Patterns covered by an active goal are excluded in SQL
+        rows = await self.db.stream(
+            _SELECT_SUGGESTION_PATTERNS,
+            {"user_id": user_id, "cutoff_date": cutoff_date},
+            execution_options={"yield_per": SUGGESTION_BATCH},
         )
-
-        # Build suggestions for unmatched patterns
-        suggestions = []
-        for row in metrics_result:
+        async for row in rows:
             category = row.category
             key = row.key
             frequency = row.frequency
             avg_confidence = row.avg_confidence
 
-            # Skip if category already covered by active goal
-            if category.lower() in active_categories:
-                continue
-
-            # Generate suggestion
-            suggestion = GoalSuggestion(
+            yield GoalSuggestion(
                 category=category,
                 suggested_description=self._generate_description(category, key),
                 based_on_pattern=f"{key.replace('_', ' ')} mentioned {frequency} times in last {lookback_days} days",
                 frequency=frequency,
                 confidence=min(0.9, avg_confidence * (frequency / 10))  # Scale by frequency
             )
-            suggestions.append(suggestion)
-
-        return suggestions
 
     def _generate_description(self, category: str, key: str) -> str:
         """
@@ -268,15 +415,5 @@ class ExtractionService:
         # Clean up the key for readability
         readable_key = key.replace('_', ' ').title()
 
-        # Category-specific templates
-        templates = {
-            'productivity': f"Track and improve {readable_key}",
-            'fitness': f"Maintain consistent {readable_key}",
-            'learning': f"Dedicate time to {readable_key}",
-            'discipline': f"Build habit around {readable_key}",
-            'well-being': f"Monitor and optimize {readable_key}",
-            'creativity': f"Engage regularly in {readable_key}",
-            'social': f"Prioritize {readable_key}",
-        }
-
-        return templates.get(category.lower(), f"Track {readable_key}")
+        # Only the matched template is formatted
+        return _DESCRIPTION_TEMPLATES.get(category.lower(), "Track {}").format(readable_key)
@@ -1,7 +1,17 @@
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.response_cache import response_cache
 from app.models.goal import UserGoal
+from app.services.trend_service import invalidate_goal_descriptions
+
+# Built once at import so SQLAlchemy's compiled-statement cache is reused
+_SELECT_GOAL = select(UserGoal).where(
+    UserGoal.id == bindparam("goal_id"),
+    UserGoal.user_id == bindparam("user_id"),
+)
+_SELECT_USER_GOALS = select(UserGoal).where(UserGoal.user_id == bindparam("user_id"))
+_SELECT_ACTIVE_USER_GOALS = _SELECT_USER_GOALS.where(UserGoal.is_active == True)
 
 
 class GoalService:
@@ -9,19 +19,12 @@ class GoalService:
         self.db = db
 
     async def get_by_id(self, goal_id: UUID, user_id: UUID) -> UserGoal | None:
-        result = await self.db.execute(
-            select(UserGoal).where(
-                UserGoal.id == goal_id,
-                UserGoal.user_id == user_id,
-            )
-        )
+        result = await self.db.execute(_SELECT_GOAL, {"goal_id": goal_id, "user_id": user_id})
         return result.scalar_one_or_none()
 
     async def list(self, user_id: UUID, active_only: bool = False) -> list[UserGoal]:
-        query = select(UserGoal).where(UserGoal.user_id == user_id)
-        if active_only:
-            query = query.where(UserGoal.is_active == True)
-        result = await self.db.execute(query)
+        query = _SELECT_ACTIVE_USER_GOALS if active_only else _SELECT_USER_GOALS
+        result = await self.db.execute(query, {"user_id": user_id})
         return list(result.scalars().all())
 
     async def create(
@@ -43,6 +46,8 @@ class GoalService:
         self.db.add(goal)
         await self.db.commit()
         await self.db.refresh(goal)
+        await invalidate_goal_descriptions(user_id)
+        await response_cache.invalidate(user_id)
         return goal
 
     async def update(
@@ -63,8 +68,12 @@ class GoalService:
             goal.is_active = is_active
         await self.db.commit()
         await self.db.refresh(goal)
+        await invalidate_goal_descriptions(goal.user_id)
+        await response_cache.invalidate(goal.user_id)
         return goal
 
     async def delete(self, goal: UserGoal) -> None:
         await self.db.delete(goal)
         await self.db.commit()
+        await invalidate_goal_descriptions(goal.user_id)
+        await response_cache.invalidate(goal.user_id)
@@ -3,6 +3,8 @@ from datetime import date
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from app.core.response_cache import response_cache
 from app.models.journal_entry import JournalEntry
 from app.services.extraction_service import ExtractionService
 
@@ -11,15 +13,22 @@ class JournalService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_by_date(self, user_id: UUID, entry_date: date) -> JournalEntry | None:
-        result = await self.db.execute(
-            select(JournalEntry)
-            .options(selectinload(JournalEntry.metrics))
-            .where(
-                JournalEntry.user_id == user_id,
-                JournalEntry.entry_date == entry_date,
-            )
+    async def get_by_date(
+        self, user_id: UUID, entry_date: date, load_metrics: bool = True
+    ) -> JournalEntry | None:
+        """
+        Fetch the user's entry for a day.
+
+        Write paths that replace the metrics anyway pass load_metrics=False
+        to skip the selectinload round trip.
+        """
+        query = select(JournalEntry).where(
+            JournalEntry.user_id == user_id,
+            JournalEntry.entry_date == entry_date,
         )
+        if load_metrics:
+            query = query.options(selectinload(JournalEntry.metrics))
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
     async def list(
@@ -27,9 +36,15 @@ class JournalService:
         user_id: UUID,
         from_date: date | None = None,
         to_date: date | None = None,
-        page: int = 1,
+        before: date | None = None,
         limit: int = 10,
     ) -> list[JournalEntry]:
+        """
+        List entries newest first, keyset-paginated on entry_date.
+
+        Pass the entry_date of the last entry returned as `before` to fetch
+        the next page; each page is an index range scan regardless of depth.
+        """
         query = (
             select(JournalEntry)
             .options(selectinload(JournalEntry.metrics))
@@ -42,7 +57,10 @@ class JournalService:
         if to_date:
             query = query.where(JournalEntry.entry_date <= to_date)
 
-        query = query.offset((page - 1) * limit).limit(limit)
+        if before:
+            query = query.where(JournalEntry.entry_date < before)
+
+        query = query.limit(limit)
 
         result = await self.db.execute(query)
         return list(result.scalars().all())
@@ -63,8 +81,8 @@ class JournalService:
             audio_file_url=audio_file_url,
         )
         self.db.add(journal)
+        # Server defaults come back via RETURNING (eager_defaults), no refresh
         await self.db.commit()
-        await self.db.refresh(journal)
         return journal
 
     async def append_content(
@@ -79,12 +97,11 @@ class JournalService:
 
         Multiple voice entries accumulate into the journal, separated by newlines.
         """
-        existing = await self.get_by_date(user_id, entry_date)
+        existing = await self.get_by_date(user_id, entry_date, load_metrics=False)
         if existing:
             # Append with separator (two newlines)
             existing.content_markdown = f"{existing.content_markdown}\n\n{new_content}"
             await self.db.commit()
-            await self.db.refresh(existing)
             journal = existing
         else:
             journal = await self.create(user_id, entry_date, new_content, input_source=input_source)
@@ -92,10 +109,12 @@ class JournalService:
         # Re-run extraction on full content
         extraction_service = ExtractionService(self.db)
         await extraction_service.clear_metrics_for_entry(journal.id)
-        await extraction_service.extract_and_persist(journal)
+        metrics = await extraction_service.extract_and_persist(journal)
 
-        # Refresh to load new metrics relationship
-        await self.db.refresh(journal, ["metrics"])
+        # The INSERT ... RETURNING already loaded the new metrics; attach them
+        # instead of re-selecting the relationship
+        set_committed_value(journal, "metrics", metrics)
+        await response_cache.invalidate(user_id)
         return journal
 
     async def create_or_update(
@@ -104,11 +123,10 @@ class JournalService:
         entry_date: date,
         content_markdown: str,
     ) -> JournalEntry:
-        existing = await self.get_by_date(user_id, entry_date)
+        existing = await self.get_by_date(user_id, entry_date, load_metrics=False)
         if existing:
             existing.content_markdown = content_markdown
             await self.db.commit()
-            await self.db.refresh(existing)
             journal = existing
         else:
             journal = await self.create(user_id, entry_date, content_markdown)
@@ -116,16 +134,17 @@ class JournalService:
         # Trigger extraction pipeline
         extraction_service = ExtractionService(self.db)
         await extraction_service.clear_metrics_for_entry(journal.id)
-        await extraction_service.extract_and_persist(journal)
+        metrics = await extraction_service.extract_and_persist(journal)
 
-        # Refresh to load new metrics relationship
-        await self.db.refresh(journal, ["metrics"])
+        # The INSERT ... RETURNING already loaded the new metrics; attach them
+        # instead of re-selecting the relationship
+        set_committed_value(journal, "metrics", metrics)
+        await response_cache.invalidate(user_id)
         return journal
 
     async def update(self, journal: JournalEntry, content_markdown: str) -> JournalEntry:
         journal.content_markdown = content_markdown
         await self.db.commit()
-        await self.db.refresh(journal)
         return journal
 
     async def delete(self, journal: JournalEntry) -> None:
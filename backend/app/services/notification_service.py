@@ -1,13 +1,63 @@
 """Notification service for detecting non-loggers and generating reminders."""
+from collections.abc import AsyncIterator
 from uuid import UUID
 from datetime import date, datetime, time, timedelta
-from sqlalchemy import select, and_
+from typing import Literal
+
+from sqlalchemy import Time, and_, case, cast, func, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
 from app.models.journal_entry import JournalEntry
 from app.models.daily_score import DailyScore
 from app.models.notification import Notification
 
+NotificationAction = Literal["delivered", "read", "dismiss"]
+
+# Column assignments per PATCH /notifications/{id}/{action}
+NOTIFICATION_ACTION_VALUES: dict[str, dict] = {
+    "delivered": {"delivered_at": func.now()},
+    "read": {"read_at": func.now()},
+    "dismiss": {"dismissed": True},
+}
+
+DEFAULT_NOTIFICATION_TIME = time(18, 0)  # 6 PM
+
+# Non-loggers fetched and reminded per round of the hourly sweep
+NON_LOGGER_BATCH = 500
+
+# preferences->>'notification_time' as a TIME. Only well-formed H:MM / HH:MM
+# strings (what strptime("%H:%M") accepted) are cast; missing or malformed
+# values fall back to the default, so one bad row cannot fail the sweep.
+_notification_time_raw = User.preferences["notification_time"].as_string()
+_NOTIFICATION_TIME = case(
+    (
+        _notification_time_raw.regexp_match(r"^([01]?[0-9]|2[0-3]):[0-5]?[0-9]$"),
+        cast(_notification_time_raw, Time),
+    ),
+    else_=literal(DEFAULT_NOTIFICATION_TIME, Time),
+)
+
+# Reminder text per activity bucket, formatted with days/score/entries
+_REMINDER_TEMPLATES = {
+    "first": "Your first entry awaits. What happened today that's worth remembering?",
+    "yesterday_better": "Yesterday you were better. Today... silence?",
+    "yesterday_scored": "Yesterday you scored {score}. Nothing worth mentioning today?",
+    "yesterday": "Yesterday you showed up. Today's looking quiet.",
+    "streak": "It's been {days} days. Your streak is watching.",
+    "silence": "{days} days of silence. The version of you from {entries} entries ago would have something to say about that.",
+    "lapsed": "It's been a while. Start small - what's one thing you did today?",
+}
+
+# Summary for a user with no entries in the window and no score yesterday
+_EMPTY_SUMMARY = {
+    "last_entry_date": None,
+    "days_since_last": None,
+    "recent_entry_count": 0,
+    "yesterday_score": None,
+    "yesterday_verdict": None,
+    "has_recent_activity": False,
+}
+
 
 class NotificationService:
     """
@@ -22,6 +72,24 @@ class NotificationService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def _non_logger_conditions(target_date: date, cutoff_time: time | None) -> list:
+        """WHERE clauses selecting users to remind about target_date."""
+        # One anti-join instead of an entry lookup per user; users who turned
+        # notifications off are dropped in SQL too (missing key = enabled)
+        conditions = [
+            func.coalesce(User.preferences["notifications_enabled"].as_boolean(), True),
+            ~select(JournalEntry.id)
+            .where(
+                JournalEntry.user_id == User.id,
+                JournalEntry.entry_date == target_date,
+            )
+            .exists(),
+        ]
+        if cutoff_time:
+            conditions.append(_NOTIFICATION_TIME <= cutoff_time)
+        return conditions
+
     async def get_non_loggers(
         self,
         target_date: date,
@@ -37,47 +105,136 @@ class NotificationService:
         Returns:
             List of User objects with notifications enabled who haven't logged
         """
-        # Get all users first (simpler query that works across databases)
-        query = select(User)
-        result = await self.db.execute(query)
-        all_users = list(result.scalars().all())
-
-        # Filter in Python for flexibility
-        non_loggers = []
-        for user in all_users:
-            prefs = user.preferences or {}
-            if not prefs.get("notifications_enabled", True):
-                continue
-
-            # Check if user logged today
-            entry_check = await self.db.execute(
-                select(JournalEntry.id).where(
-                    and_(
-                        JournalEntry.user_id == user.id,
-                        JournalEntry.entry_date == target_date,
-                    )
-                ).limit(1)
+        conditions = self._non_logger_conditions(target_date, cutoff_time)
+        result = await self.db.execute(select(User).where(*conditions))
+        return list(result.scalars().all())
+
+    async def iter_non_logger_batches(
+        self,
+        target_date: date,
+        cutoff_time: time | None = None,
+        batch_size: int = NON_LOGGER_BATCH,
+    ) -> AsyncIterator[list[UUID]]:
+        """
+        Yield non-logger user IDs in batches from a server-side cursor.
+
+        Same selection as get_non_loggers, but only IDs are fetched and
+        each batch can be processed before the next one is read. A commit
+        closes the cursor, so writes for a batch must go through a
+        different session than the one streaming.
+
+        Args:
+            target_date: The date to check for entries
+            cutoff_time: Optional - only consider users whose notification_time has passed
+            batch_size: User IDs per yielded batch
+
+        Yields:
+            Lists of at most batch_size user IDs
+        """
+        conditions = self._non_logger_conditions(target_date, cutoff_time)
+        result = await self.db.stream_scalars(
+            select(User.id).where(*conditions),
+            execution_options={"yield_per": batch_size},
+        )
+        async for batch in result.partitions():
+            yield list(batch)
+
+    async def get_reminded_today(self, user_ids: list[UUID], target_date: date) -> set[UUID]:
+        """
+        Return which of user_ids already got a reminder notification on target_date.
+
+        One IN query for the whole batch instead of an existence check per user.
+        """
+        if not user_ids:
+            return set()
+        # Half-open day range rather than date(created_at), so the
+        # (user_id, notification_type, created_at) index can range-scan it;
+        # naive bounds are read in the session time zone, as date() was
+        day_start = datetime.combine(target_date, time.min)
+        result = await self.db.execute(
+            select(Notification.user_id)
+            .where(
+                Notification.user_id.in_(user_ids),
+                Notification.notification_type == "reminder",
+                Notification.created_at >= day_start,
+                Notification.created_at < day_start + timedelta(days=1),
             )
-            if entry_check.scalar_one_or_none():
-                continue  # User has logged
+            .distinct()
+        )
+        return set(result.scalars().all())
 
-            # Check cutoff time if provided
-            if cutoff_time and not self._user_notification_time_passed(user, cutoff_time):
-                continue
+    async def get_activity_summaries(
+        self,
+        user_ids: list[UUID],
+        lookback_days: int = 7,
+    ) -> dict[UUID, dict]:
+        """
+        Get recent-activity summaries for many users in one query.
 
-            non_loggers.append(user)
+        Entry counts are aggregated per user and yesterday's score is
+        outer-joined, so a reminder sweep costs one round-trip instead of
+        two per user. Users with no entries or score in the window are
+        left out of the mapping.
 
-        return non_loggers
+        Args:
+            user_ids: Users to summarize
+            lookback_days: Size of the entry window before today
 
-    def _user_notification_time_passed(self, user: User, current_time: time) -> bool:
-        """Check if user's preferred notification time has passed."""
-        prefs = user.preferences or {}
-        notification_time_str = prefs.get("notification_time", "18:00")
-        try:
-            user_time = datetime.strptime(notification_time_str, "%H:%M").time()
-            return current_time >= user_time
-        except ValueError:
-            return current_time >= time(18, 0)  # Default 6 PM
+        Returns:
+            Dict of user_id -> summary (see get_user_activity_summary)
+        """
+        if not user_ids:
+            return {}
+
+        today = date.today()
+        lookback_start = today - timedelta(days=lookback_days)
+        yesterday = today - timedelta(days=1)
+
+        entries = (
+            select(
+                JournalEntry.user_id,
+                func.max(JournalEntry.entry_date).label("last_entry_date"),
+                func.count().label("recent_entry_count"),
+            )
+            .where(
+                JournalEntry.user_id.in_(user_ids),
+                JournalEntry.entry_date >= lookback_start,
+                JournalEntry.entry_date < today,
+            )
+            .group_by(JournalEntry.user_id)
+            .subquery()
+        )
+        scores = (
+            select(DailyScore.user_id, DailyScore.composite_score, DailyScore.verdict)
+            .where(
+                DailyScore.user_id.in_(user_ids),
+                DailyScore.score_date == yesterday,
+            )
+            .subquery()
+        )
+        query = select(
+            func.coalesce(entries.c.user_id, scores.c.user_id).label("user_id"),
+            entries.c.last_entry_date,
+            entries.c.recent_entry_count,
+            scores.c.composite_score,
+            scores.c.verdict,
+        ).select_from(
+            entries.outerjoin(scores, entries.c.user_id == scores.c.user_id, full=True)
+        )
+        result = await self.db.execute(query)
+
+        summaries = {}
+        for row in result:
+            recent_count = row.recent_entry_count or 0
+            summaries[row.user_id] = {
+                "last_entry_date": row.last_entry_date,
+                "days_since_last": (today - row.last_entry_date).days if row.last_entry_date else None,
+                "recent_entry_count": recent_count,
+                "yesterday_score": row.composite_score,
+                "yesterday_verdict": row.verdict,
+                "has_recent_activity": recent_count > 0,
+            }
+        return summaries
 
     async def get_user_activity_summary(
         self,
@@ -94,49 +251,46 @@ class NotificationService:
         - yesterday_score: Score from yesterday if exists
         - yesterday_verdict: Verdict from yesterday if exists
         """
-        today = date.today()
-        lookback_start = today - timedelta(days=lookback_days)
+        summaries = await self.get_activity_summaries([user_id], lookback_days)
+        return summaries.get(user_id, dict(_EMPTY_SUMMARY))
 
-        # Get recent entries
-        entries_query = (
-            select(JournalEntry)
-            .where(
-                and_(
-                    JournalEntry.user_id == user_id,
-                    JournalEntry.entry_date >= lookback_start,
-                    JournalEntry.entry_date < today,
-                )
-            )
-            .order_by(JournalEntry.entry_date.desc())
-        )
-        result = await self.db.execute(entries_query)
-        recent_entries = list(result.scalars().all())
+    @staticmethod
+    def _format_reminder(summary: dict) -> str:
+        """
+        Pick the ego-poking reminder text for an activity summary.
 
-        # Get yesterday's score if exists
-        yesterday = today - timedelta(days=1)
-        score_query = (
-            select(DailyScore)
-            .where(
-                and_(
-                    DailyScore.user_id == user_id,
-                    DailyScore.score_date == yesterday,
-                )
-            )
-        )
-        score_result = await self.db.execute(score_query)
-        yesterday_score = score_result.scalar_one_or_none()
+        Messages use "supportive but with edge" tone per project requirements.
+        """
+        days_since = summary["days_since_last"]
 
-        # Calculate summary
-        last_entry = recent_entries[0] if recent_entries else None
-        days_since = (today - last_entry.entry_date).days if last_entry else None
+        if days_since is None:
+            key = "first"
+        elif days_since == 1:
+            if summary["yesterday_verdict"] == "better":
+                key = "yesterday_better"
+            elif summary["yesterday_score"]:
+                key = "yesterday_scored"
+            else:
+                key = "yesterday"
+        elif days_since <= 3:
+            key = "streak"
+        elif days_since <= 7:
+            key = "silence"
+        else:
+            key = "lapsed"
+
+        return _REMINDER_TEMPLATES[key].format(
+            days=days_since,
+            score=int(summary["yesterday_score"] or 0),
+            entries=summary["recent_entry_count"],
+        )
 
+    async def generate_reminder_messages(self, user_ids: list[UUID]) -> dict[UUID, str]:
+        """Generate reminder messages for many users from one summary query."""
+        summaries = await self.get_activity_summaries(user_ids)
         return {
-            "last_entry_date": last_entry.entry_date if last_entry else None,
-            "days_since_last": days_since,
-            "recent_entry_count": len(recent_entries),
-            "yesterday_score": yesterday_score.composite_score if yesterday_score else None,
-            "yesterday_verdict": yesterday_score.verdict if yesterday_score else None,
-            "has_recent_activity": len(recent_entries) > 0,
+            user_id: self._format_reminder(summaries.get(user_id, _EMPTY_SUMMARY))
+            for user_id in user_ids
         }
 
     async def generate_reminder_message(
@@ -148,27 +302,8 @@ class NotificationService:
 
         Messages use "supportive but with edge" tone per project requirements.
         """
-        summary = await self.get_user_activity_summary(user_id)
-
-        # Message templates based on activity
-        if summary["days_since_last"] is None:
-            return "Your first entry awaits. What happened today that's worth remembering?"
-
-        if summary["days_since_last"] == 1:
-            if summary["yesterday_verdict"] == "better":
-                return "Yesterday you were better. Today... silence?"
-            elif summary["yesterday_score"]:
-                return f"Yesterday you scored {int(summary['yesterday_score'])}. Nothing worth mentioning today?"
-            else:
-                return "Yesterday you showed up. Today's looking quiet."
-
-        if summary["days_since_last"] <= 3:
-            return f"It's been {summary['days_since_last']} days. Your streak is watching."
-
-        if summary["days_since_last"] <= 7:
-            return f"{summary['days_since_last']} days of silence. The version of you from {summary['recent_entry_count']} entries ago would have something to say about that."
-
-        return "It's been a while. Start small - what's one thing you did today?"
+        messages = await self.generate_reminder_messages([user_id])
+        return messages[user_id]
 
     async def create_notification(
         self,
@@ -187,6 +322,25 @@ class NotificationService:
         await self.db.refresh(notification)
         return notification
 
+    async def create_notifications_bulk(self, rows: list[dict]) -> list[UUID]:
+        """
+        Create many notifications with one INSERT and one commit.
+
+        Args:
+            rows: Dicts with user_id, message and notification_type
+
+        Returns:
+            IDs of the created notifications
+        """
+        if not rows:
+            return []
+        result = await self.db.execute(
+            insert(Notification).values(rows).returning(Notification.id)
+        )
+        ids = list(result.scalars().all())
+        await self.db.commit()
+        return ids
+
     async def get_pending_notifications(
         self,
         user_id: UUID,
@@ -207,35 +361,55 @@ class NotificationService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    async def mark_delivered(self, notification_id: UUID) -> Notification | None:
-        """Mark a notification as delivered."""
-        query = select(Notification).where(Notification.id == notification_id)
-        result = await self.db.execute(query)
-        notification = result.scalar_one_or_none()
-        if notification:
-            notification.delivered_at = datetime.utcnow()
-            await self.db.commit()
-            await self.db.refresh(notification)
-        return notification
+    async def mark_delivered_bulk(self, notification_ids: list[UUID], user_id: UUID) -> list[UUID]:
+        """
+        Mark many of a user's notifications delivered in one UPDATE.
 
-    async def mark_read(self, notification_id: UUID) -> Notification | None:
-        """Mark a notification as read."""
-        query = select(Notification).where(Notification.id == notification_id)
-        result = await self.db.execute(query)
-        notification = result.scalar_one_or_none()
-        if notification:
-            notification.read_at = datetime.utcnow()
-            await self.db.commit()
-            await self.db.refresh(notification)
-        return notification
+        Already-delivered and other users' notifications are skipped.
 
-    async def dismiss_notification(self, notification_id: UUID) -> Notification | None:
-        """Mark notification as dismissed (for fatigue tracking)."""
-        query = select(Notification).where(Notification.id == notification_id)
-        result = await self.db.execute(query)
+        Returns:
+            IDs that were actually updated
+        """
+        if not notification_ids:
+            return []
+        result = await self.db.execute(
+            update(Notification)
+            .where(
+                Notification.id.in_(notification_ids),
+                Notification.user_id == user_id,
+                Notification.delivered_at.is_(None),
+            )
+            .values(delivered_at=func.now())
+            .returning(Notification.id)
+        )
+        updated = list(result.scalars().all())
+        await self.db.commit()
+        return updated
+
+    async def apply_action(
+        self, notification_id: UUID, user_id: UUID, action: NotificationAction
+    ) -> Notification | None:
+        """
+        Record a delivery/read/dismiss event in one UPDATE ... RETURNING.
+
+        Ownership is part of the WHERE clause, so there is no separate
+        SELECT and no window between the check and the write.
+
+        Args:
+            notification_id: Notification to update
+            user_id: Owner; other users' notifications are not matched
+            action: "delivered", "read" or "dismiss"
+
+        Returns:
+            Updated Notification, or None if no notification of this user matched
+        """
+        result = await self.db.execute(
+            update(Notification)
+            .where(Notification.id == notification_id, Notification.user_id == user_id)
+            .values(**NOTIFICATION_ACTION_VALUES[action])
+            .returning(Notification)
+        )
         notification = result.scalar_one_or_none()
         if notification:
-            notification.dismissed = True
             await self.db.commit()
-            await self.db.refresh(notification)
         return notification
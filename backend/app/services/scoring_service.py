@@ -1,16 +1,20 @@
 """Scoring service that orchestrates deterministic + LLM scoring."""
 
+import asyncio
+import math
 from uuid import UUID
 from datetime import date, timedelta
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
+from app.core.response_cache import response_cache
 from app.models.daily_score import DailyScore, ScoreMetric
 from app.models.goal import UserGoal
 from app.models.journal_entry import JournalEntry
-from app.ai_pipeline.scoring.deterministic import DeterministicScorer
-from app.ai_pipeline.scoring.llm_enhancer import LLMScoreEnhancer, MockLLMScoreEnhancer
+from app.ai_pipeline.scoring.deterministic import SCORER
+from app.ai_pipeline.scoring.llm_enhancer import get_llm_enhancer
 from app.schemas.score import (
     ScoringResponse,
     ScoreComparison,
@@ -34,18 +38,7 @@ class ScoringService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.deterministic_scorer = DeterministicScorer()
-        self._llm_enhancer = None  # Lazy init
-
-    def _get_llm_enhancer(self):
-        """Lazy initialization of LLM enhancer with fallback to mock."""
-        if self._llm_enhancer is None:
-            try:
-                self._llm_enhancer = LLMScoreEnhancer()
-            except ValueError:
-                # API key not configured, use mock
-                self._llm_enhancer = MockLLMScoreEnhancer()
-        return self._llm_enhancer
+        self.deterministic_scorer = SCORER
 
     async def score_day(
         self,
@@ -75,57 +68,64 @@ class ScoringService:
         if not goals:
             raise ValueError("No active goals found for user")
 
-        # 3. Run deterministic scoring
-        deterministic_result = self.deterministic_scorer.score_entry(
+        # 3. Run deterministic scoring off the event loop; it is one CPU pass
+        # over a shared view of the entry, so goals are not split across workers
+        deterministic_result = await asyncio.to_thread(
+            self.deterministic_scorer.score_entry,
             journal_content=journal.content_markdown,
-            goals=goals
+            goals=goals,
         )
 
-        # 4. Enhance with LLM (if available)
-        llm_enhancer = self._get_llm_enhancer()
+        # 4. Enhance with LLM (if available); the score history is fetched
+        # while the LLM request is in flight (the enhancer doesn't touch the session)
+        llm_enhancer = get_llm_enhancer()
         goals_with_descriptions = [
             (g.category, g.description, g.target_value)
             for g in goals
         ]
-        enhanced_scores = llm_enhancer.enhance_scoring_result(
-            result=deterministic_result,
-            goals_with_descriptions=goals_with_descriptions,
-            journal_content=journal.content_markdown
+        enhanced_scores, history = await asyncio.gather(
+            llm_enhancer.enhance_scoring_result(
+                result=deterministic_result,
+                goals_with_descriptions=goals_with_descriptions,
+                journal_content=journal.content_markdown
+            ),
+            self._get_score_history(user_id),
         )
+        # One history read serves yesterday's score and the streaks
+        by_date = {daily_score.score_date: daily_score for daily_score in history}
 
         # 5. Calculate composite score with goal weights
-        goal_details = []
-        total_weighted_score = 0.0
-        total_weight = 0.0
-
-        for goal, det_score, enh_score in zip(goals, deterministic_result.goal_scores, enhanced_scores):
-            weight = goal.weight
-            weighted_score = enh_score.adjusted_score * weight
-            total_weighted_score += weighted_score
-            total_weight += weight
-
-            goal_details.append(GoalScoreDetail(
+        goal_details = [
+            GoalScoreDetail(
                 category=goal.category,
                 base_score=det_score.base_score,
                 enhanced_score=enh_score.adjusted_score,
                 adjustment=enh_score.adjustment,
-                weight=weight,
-                weighted_score=weighted_score,
+                weight=goal.weight,
+                weighted_score=enh_score.adjusted_score * goal.weight,
                 showed_up=det_score.showed_up,
                 effort_level=det_score.effort_level,
                 evidence=det_score.evidence,
                 reasoning=det_score.reasoning,
                 adjustment_reasoning=enh_score.adjustment_reasoning,
-            ))
+            )
+            for goal, det_score, enh_score in zip(goals, deterministic_result.goal_scores, enhanced_scores)
+        ]
 
-        composite_score = total_weighted_score / total_weight if total_weight > 0 else 0.0
+        # fsum keeps the weighted mean exact regardless of goal order
+        total_weight = math.fsum(detail.weight for detail in goal_details)
+        composite_score = (
+            math.fsum(detail.weighted_score for detail in goal_details) / total_weight
+            if total_weight > 0 else 0.0
+        )
 
         # 6. Compare with yesterday and determine verdict
-        yesterday_score = await self._get_yesterday_score(user_id, score_date)
+        yesterday = by_date.get(score_date - timedelta(days=1))
+        yesterday_score = yesterday.composite_score if yesterday else None
         comparison = self._calculate_comparison(composite_score, yesterday_score)
 
         # 7. Calculate streaks
-        streaks = await self._calculate_streaks(user_id, score_date, goal_details, comparison.verdict)
+        streaks = self._calculate_streaks(history, goal_details)
 
         # 8. Persist to database (upsert)
         await self._persist_score(
@@ -139,6 +139,7 @@ class ScoringService:
             },
             goal_details=goal_details,
         )
+        await response_cache.invalidate(user_id)
 
         return ScoringResponse(
             score_date=score_date,
@@ -162,18 +163,12 @@ class ScoringService:
         # Get all goals
         goals = await self._get_active_goals(user_id)
 
-        # Get all daily scores ordered by date
-        result = await self.db.execute(
-            select(DailyScore)
-            .options(selectinload(DailyScore.metrics))
-            .where(DailyScore.user_id == user_id)
-            .order_by(DailyScore.score_date.desc())
-        )
-        daily_scores = list(result.scalars().all())
+        daily_scores = await self._get_score_history(user_id)
 
+        days = self._daily_category_scores(daily_scores)
         streaks = []
         for goal in goals:
-            streak_info = self._calculate_goal_streak(goal.category, daily_scores)
+            streak_info = self._calculate_goal_streak(goal.category, days)
             streaks.append(streak_info)
 
         return streaks
@@ -200,17 +195,17 @@ class ScoringService:
         )
         return list(result.scalars().all())
 
-    async def _get_yesterday_score(self, user_id: UUID, today: date) -> float | None:
-        """Get yesterday's composite score."""
-        yesterday = today - timedelta(days=1)
+    async def _get_score_history(self, user_id: UUID) -> list[DailyScore]:
+        """Get all of a user's daily scores with their metrics, newest first."""
+        # Streaks walk every day's metrics; raiseload turns any other lazy
+        # relationship access into an error instead of a query per day
         result = await self.db.execute(
-            select(DailyScore).where(
-                DailyScore.user_id == user_id,
-                DailyScore.score_date == yesterday,
-            )
+            select(DailyScore)
+            .options(selectinload(DailyScore.metrics), raiseload("*"))
+            .where(DailyScore.user_id == user_id)
+            .order_by(DailyScore.score_date.desc())
         )
-        yesterday_record = result.scalar_one_or_none()
-        return yesterday_record.composite_score if yesterday_record else None
+        return list(result.scalars().all())
 
     def _calculate_comparison(
         self,
@@ -243,70 +238,74 @@ class ScoringService:
             verdict=verdict,
         )
 
-    async def _calculate_streaks(
+    def _calculate_streaks(
         self,
-        user_id: UUID,
-        current_date: date,
+        daily_scores: list[DailyScore],
         goal_details: list[GoalScoreDetail],
-        verdict: str,
     ) -> list[StreakInfo]:
-        """Calculate streak information for each goal."""
-        # Get historical scores
-        result = await self.db.execute(
-            select(DailyScore)
-            .options(selectinload(DailyScore.metrics))
-            .where(DailyScore.user_id == user_id)
-            .order_by(DailyScore.score_date.desc())
-        )
-        daily_scores = list(result.scalars().all())
-
+        """Calculate streak information for each goal from the score history."""
+        days = self._daily_category_scores(daily_scores)
         streaks = []
         for goal_detail in goal_details:
-            streak_info = self._calculate_goal_streak(goal_detail.category, daily_scores)
+            streak_info = self._calculate_goal_streak(goal_detail.category, days)
             streaks.append(streak_info)
 
         return streaks
 
+    @staticmethod
+    def _daily_category_scores(
+        daily_scores: list[DailyScore],
+    ) -> list[tuple[date, dict[str, float]]]:
+        """
+        Sort the history once and index each day's metric scores by category.
+
+        Shared by every goal's streak walk, so per goal the work is one
+        dict lookup per day instead of a re-sort plus a scan of the metrics.
+        """
+        days = []
+        for daily_score in sorted(daily_scores, key=lambda x: x.score_date):
+            scores: dict[str, float] = {}
+            for metric in daily_score.metrics:
+                # First metric of a category wins, as before
+                scores.setdefault(metric.category, metric.score)
+            days.append((daily_score.score_date, scores))
+        return days
+
     def _calculate_goal_streak(
         self,
         category: str,
-        daily_scores: list[DailyScore],
+        days: list[tuple[date, dict[str, float]]],
     ) -> StreakInfo:
         """
         Calculate streak for a specific goal category.
 
         A streak continues when the goal's score improved or stayed the same.
+
+        Args:
+            category: Goal category
+            days: Output of _daily_category_scores (date ascending)
         """
         current_streak = 0
         longest_streak = 0
         temp_streak = 0
         last_improvement_date = None
 
-        # Sort by date ascending for streak calculation
-        sorted_scores = sorted(daily_scores, key=lambda x: x.score_date)
-
         prev_score = None
-        for daily_score in sorted_scores:
-            # Find the metric for this category
-            metric = next(
-                (m for m in daily_score.metrics if m.category == category),
-                None
-            )
-            if not metric:
+        for score_date, scores in days:
+            current_score = scores.get(category)
+            if current_score is None:
                 # Category not scored this day, break streak
                 temp_streak = 0
                 prev_score = None
                 continue
 
-            current_score = metric.score
-
             if prev_score is None:
                 # First day
                 temp_streak = 1
             elif current_score >= prev_score - self.SAME_THRESHOLD:
                 # Improved or maintained (within threshold)
                 temp_streak += 1
-                last_improvement_date = daily_score.score_date
+                last_improvement_date = score_date
             else:
                 # Declined, reset streak
                 temp_streak = 1
@@ -318,7 +317,7 @@ class ScoringService:
             prev_score = current_score
 
         # Current streak is the temp streak if it extends to most recent date
-        if sorted_scores:
+        if days:
             current_streak = temp_streak
         else:
             current_streak = 0
@@ -339,50 +338,41 @@ class ScoringService:
         comparison_data: dict,
         goal_details: list[GoalScoreDetail],
     ) -> None:
-        """Persist or update daily score and metrics."""
-        # Check if score already exists (upsert logic)
-        result = await self.db.execute(
-            select(DailyScore)
-            .options(selectinload(DailyScore.metrics))
-            .where(
-                DailyScore.user_id == user_id,
-                DailyScore.score_date == score_date,
-            )
-        )
-        existing_score = result.scalar_one_or_none()
-
-        if existing_score:
-            # Update existing score
-            existing_score.composite_score = composite_score
-            existing_score.verdict = verdict
-            existing_score.comparison_data = comparison_data
-
-            # Delete old metrics and create new ones
-            for metric in existing_score.metrics:
-                await self.db.delete(metric)
-        else:
-            # Create new score
-            existing_score = DailyScore(
-                user_id=user_id,
-                score_date=score_date,
-                composite_score=composite_score,
-                verdict=verdict,
-                comparison_data=comparison_data,
-            )
-            self.db.add(existing_score)
-
-        # Flush to get the daily_score ID
-        await self.db.flush()
+        """
+        Persist or update daily score and metrics.
 
-        # Create metrics
-        for goal_detail in goal_details:
-            metric = ScoreMetric(
-                daily_score_id=existing_score.id,
-                category=goal_detail.category,
-                score=goal_detail.enhanced_score,
-                weight=goal_detail.weight,
-                reasoning=f"{goal_detail.reasoning} | LLM: {goal_detail.adjustment_reasoning}",
-            )
-            self.db.add(metric)
+        Three statements regardless of goal count: an INSERT ... ON CONFLICT
+        upsert of the day's row, one DELETE of its old metrics and one
+        multi-row INSERT of the new ones.
+        """
+        stmt = pg_insert(DailyScore).values(
+            user_id=user_id,
+            score_date=score_date,
+            composite_score=composite_score,
+            verdict=verdict,
+            comparison_data=comparison_data,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_daily_scores_user_date",
+            set_={
+                "composite_score": stmt.excluded.composite_score,
+                "verdict": stmt.excluded.verdict,
+                "comparison_data": stmt.excluded.comparison_data,
+            },
+        ).returning(DailyScore.id)
+        score_id = await self.db.scalar(stmt)
+
+        await self.db.execute(delete(ScoreMetric).where(ScoreMetric.daily_score_id == score_id))
+        if goal_details:
+            await self.db.execute(insert(ScoreMetric), [
+                {
+                    "daily_score_id": score_id,
+                    "category": goal_detail.category,
+                    "score": goal_detail.enhanced_score,
+                    "weight": goal_detail.weight,
+                    "reasoning": f"{goal_detail.reasoning} | LLM: {goal_detail.adjustment_reasoning}",
+                }
+                for goal_detail in goal_details
+            ])
 
         await self.db.commit()
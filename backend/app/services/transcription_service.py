@@ -1,10 +1,34 @@
+import asyncio
+import hashlib
+import logging
+import shutil
+from pathlib import Path
+from typing import BinaryIO
+
+import httpx
 from fastapi import UploadFile, HTTPException, status
 from openai import AsyncOpenAI
 
+from app.core.cache import TwoTierCache, make_key
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+WHISPER_MODEL = "whisper-1"
+
+# Transcripts keyed by the upload's content hash; audio never changes, so
+# resubmits and retries of the same recording skip Whisper for a month
+TRANSCRIPT_TTL = 30 * 24 * 3600
+_transcript_cache = TwoTierCache("transcripts", maxsize=256)
+
+# Saved uploads at least this large are re-encoded to 16 kHz mono Opus before
+# upload when ffmpeg is on PATH; speech keeps what Whisper uses while the
+# request body shrinks 5-10x (and long recordings fit its 25 MB limit)
+TRANSCODE_MIN_BYTES = 2 * 1024 * 1024
+FFMPEG = shutil.which("ffmpeg")
+
 # Supported audio formats for Whisper API
-SUPPORTED_AUDIO_TYPES = {
+SUPPORTED_AUDIO_TYPES = frozenset({
     "audio/mpeg",      # mp3
     "audio/mp4",       # mp4
     "audio/x-m4a",     # m4a
@@ -15,57 +39,150 @@ SUPPORTED_AUDIO_TYPES = {
     "audio/mpga",      # mpga
     "video/mp4",       # mp4 video (has audio track)
     "video/webm",      # webm video (has audio track)
-}
+})
+
+# Leading bytes sniffed from uploads; content_type is client-supplied, so
+# uploads whose header matches no supported container are rejected before
+# they are saved or sent to Whisper
+AUDIO_HEADER_BYTES = 16
+_AUDIO_SIGNATURES = (
+    (0, b"ID3"),            # mp3 with ID3v2 tag
+    (0, b"OggS"),           # ogg / opus
+    (0, b"RIFF"),           # wav
+    (0, b"\x1aE\xdf\xa3"),  # webm / matroska (EBML)
+    (4, b"ftyp"),           # mp4 / m4a
+)
+
+
+def has_audio_signature(header: bytes) -> bool:
+    """True if header starts like a supported audio container or a raw MPEG audio frame."""
+    if len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0:
+        return True  # MPEG audio frame sync (mp3/mpga without a tag)
+    return any(header.startswith(magic, offset) for offset, magic in _AUDIO_SIGNATURES)
+
+
+async def validate_audio_upload(audio_file: UploadFile) -> str:
+    """
+    Check an upload's declared type and leading bytes; rewinds the file.
+
+    Args:
+        audio_file: FastAPI UploadFile containing audio data
+
+    Returns:
+        The upload's content type
+
+    Raises:
+        HTTPException: 400 if the format is unsupported or the content is not audio
+    """
+    content_type = audio_file.content_type or ""
+    if content_type not in SUPPORTED_AUDIO_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported audio format: {content_type}. "
+                   f"Supported formats: mp3, mp4, mpeg, mpga, m4a, wav, webm",
+        )
+
+    header = await audio_file.read(AUDIO_HEADER_BYTES)
+    await audio_file.seek(0)
+    if not has_audio_signature(header):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Uploaded file is not valid {content_type} audio",
+        )
+    return content_type
+
+
+def _audio_key(audio: BinaryIO) -> str:
+    """Cache key for an audio file's content, hashed in chunks; rewinds the file."""
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: audio.read(1 << 20), b""):
+        digest.update(chunk)
+    audio.seek(0)
+    return make_key(WHISPER_MODEL, digest.hexdigest())
 
 
 class TranscriptionService:
-    """Service for transcribing audio files using OpenAI Whisper API."""
+    """
+    Service for transcribing audio files using OpenAI Whisper API.
 
-    def __init__(self):
+    Callers pass an HTTP client bound to their event loop; the Celery voice
+    task creates one per task run.
+    """
+
+    def __init__(self, http_client: httpx.AsyncClient):
         if not settings.OPENAI_API_KEY:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="OpenAI API key not configured",
             )
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=http_client,
+        )
 
-    async def transcribe(self, audio_file: UploadFile) -> str:
+    async def transcribe_path(self, path: Path, filename: str | None, content_type: str) -> str:
         """
-        Transcribe audio file using OpenAI Whisper API.
+        Transcribe an audio file already saved to disk (background uploads).
 
         Args:
-            audio_file: FastAPI UploadFile containing audio data
+            path: Location of the saved upload
+            filename: Original client filename, used for format detection
+            content_type: Original upload content type
 
         Returns:
             Transcribed text string
-
-        Raises:
-            HTTPException: If transcription fails or unsupported format
         """
-        # Validate content type
-        content_type = audio_file.content_type or ""
-        if content_type not in SUPPORTED_AUDIO_TYPES:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported audio format: {content_type}. "
-                       f"Supported formats: mp3, mp4, mpeg, mpga, m4a, wav, webm",
-            )
+        # Keyed on the original upload, so the cache is checked before transcoding
+        with path.open("rb") as audio:
+            key = await asyncio.to_thread(_audio_key, audio)
+        cached = await _transcript_cache.get(key)
+        if cached is not None:
+            return cached
+
+        text = await self._transcribe_saved(path, filename, content_type)
+        await _transcript_cache.set(key, text, TRANSCRIPT_TTL)
+        return text
+
+    async def _transcribe_saved(self, path: Path, filename: str | None, content_type: str) -> str:
+        if FFMPEG and path.stat().st_size >= TRANSCODE_MIN_BYTES:
+            transcoded = await self._transcode(path)
+            if transcoded is not None:
+                try:
+                    with transcoded.open("rb") as audio:
+                        return await self._transcribe(
+                            f"{Path(filename or 'audio').stem}.ogg", audio, "audio/ogg"
+                        )
+                finally:
+                    transcoded.unlink(missing_ok=True)
 
+        with path.open("rb") as audio:
+            return await self._transcribe(filename, audio, content_type)
+
+    @staticmethod
+    async def _transcode(path: Path) -> Path | None:
+        """Re-encode an upload to 16 kHz mono Opus; None if ffmpeg fails."""
+        output = path.with_name(f"{path.name}.ogg")
+        process = await asyncio.create_subprocess_exec(
+            FFMPEG, "-nostdin", "-loglevel", "error", "-y", "-i", str(path),
+            "-vn", "-ac", "1", "-ar", "16000", "-c:a", "libopus", "-b:a", "24k", str(output),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            logger.warning(f"ffmpeg transcode of {path.name} failed, uploading original: {stderr.decode(errors='replace').strip()}")
+            output.unlink(missing_ok=True)
+            return None
+        return output
+
+    async def _transcribe(self, filename: str | None, audio: BinaryIO, content_type: str) -> str:
         try:
-            # Read file content
-            audio_bytes = await audio_file.read()
-
-            # Create a file-like tuple for OpenAI API
-            # Format: (filename, content, content_type)
-            file_tuple = (
-                audio_file.filename or "audio.mp3",
-                audio_bytes,
-                content_type,
-            )
+            # Format: (filename, file object, content_type)
+            file_tuple = (filename or "audio.mp3", audio, content_type)
 
             # Call Whisper API
             transcription = await self.client.audio.transcriptions.create(
-                model="whisper-1",
+                model=WHISPER_MODEL,
                 file=file_tuple,
             )
 
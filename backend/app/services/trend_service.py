@@ -1,36 +1,122 @@
 from uuid import UUID
+from dataclasses import dataclass
 from datetime import date, timedelta
-from sqlalchemy import select, and_
+from itertools import groupby
+from operator import itemgetter
+import orjson
+from sqlalchemy import bindparam, select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import TwoTierCache
 from app.models.daily_score import DailyScore, ScoreMetric
+from app.models.goal import UserGoal
 
+GOAL_DESCRIPTIONS_TTL = 60
 
+# Built once at import so SQLAlchemy's compiled-statement cache is reused
+_SELECT_GOAL_SCORES = (
+    select(DailyScore.score_date, ScoreMetric.score)
+    .join(ScoreMetric, ScoreMetric.daily_score_id == DailyScore.id)
+    .where(
+        and_(
+            DailyScore.user_id == bindparam("user_id"),
+            DailyScore.score_date >= bindparam("start_date"),
+            DailyScore.score_date <= bindparam("end_date"),
+            ScoreMetric.category == bindparam("category"),
+        )
+    )
+    .order_by(DailyScore.score_date)
+)
+
+_SELECT_ALL_GOAL_SCORES = (
+    select(ScoreMetric.category, DailyScore.score_date, ScoreMetric.score)
+    .join(DailyScore, ScoreMetric.daily_score_id == DailyScore.id)
+    .where(
+        and_(
+            DailyScore.user_id == bindparam("user_id"),
+            DailyScore.score_date >= bindparam("start_date"),
+            DailyScore.score_date <= bindparam("end_date"),
+        )
+    )
+    .order_by(ScoreMetric.category, DailyScore.score_date)
+)
+
+# Per-category this-week/last-week averages in one grouped scan
+_SELECT_WEEK_OVER_WEEK = (
+    select(
+        ScoreMetric.category,
+        func.avg(ScoreMetric.score).filter(
+            DailyScore.score_date >= bindparam("this_week_start")
+        ).label("this_week_avg"),
+        func.avg(ScoreMetric.score).filter(
+            DailyScore.score_date <= bindparam("last_week_end")
+        ).label("last_week_avg"),
+    )
+    .join(DailyScore, ScoreMetric.daily_score_id == DailyScore.id)
+    .where(
+        and_(
+            DailyScore.user_id == bindparam("user_id"),
+            DailyScore.score_date >= bindparam("last_week_start"),
+            DailyScore.score_date <= bindparam("this_week_end"),
+        )
+    )
+    .group_by(ScoreMetric.category)
+)
+_SELECT_GOAL_WEEK_OVER_WEEK = _SELECT_WEEK_OVER_WEEK.where(
+    ScoreMetric.category == bindparam("category")
+)
+
+_SELECT_GOAL_DESCRIPTIONS = select(UserGoal.category, UserGoal.description).where(
+    UserGoal.user_id == bindparam("user_id")
+)
+
+# {category: description} per user; dropped by GoalService on any goal write.
+# Redis only (maxsize=0): a delete can't reach other workers' local LRUs, and
+# this is a single small GET, so a local tier would only serve stale goals.
+_goal_descriptions_cache = TwoTierCache("goal_descriptions", maxsize=0)
+
+
+async def invalidate_goal_descriptions(user_id: UUID) -> None:
+    """Forget a user's cached goal descriptions after goal CRUD."""
+    await _goal_descriptions_cache.delete(str(user_id))
+
+
+@dataclass(slots=True)
 class TrendDataPoint:
     """Single day's score data for a goal."""
-    def __init__(self, score_date: date, score: float):
-        self.date = score_date
-        self.score = score
+    date: date
+    score: float
 
 
+@dataclass(slots=True)
 class WeekOverWeekResult:
     """Week comparison calculation result."""
-    def __init__(
-        self,
-        this_week_avg: float | None,
-        last_week_avg: float | None,
-        percentage_change: float | None,
-        trend: str,
-    ):
-        self.this_week_avg = this_week_avg
-        self.last_week_avg = last_week_avg
-        self.percentage_change = percentage_change
-        self.trend = trend
+    this_week_avg: float | None
+    last_week_avg: float | None
+    percentage_change: float | None
+    trend: str
 
 
 class TrendService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def get_goal_descriptions(self, user_id: UUID) -> dict[str, str | None]:
+        """
+        Map each of the user's goal categories to its description.
+
+        Cached for GOAL_DESCRIPTIONS_TTL seconds so trend requests usually
+        skip the goals query entirely.
+        """
+        key = str(user_id)
+        cached = await _goal_descriptions_cache.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+
+        result = await self.db.execute(_SELECT_GOAL_DESCRIPTIONS, {"user_id": user_id})
+        descriptions = {row.category: row.description for row in result}
+        await _goal_descriptions_cache.set(key, orjson.dumps(descriptions).decode(), GOAL_DESCRIPTIONS_TTL)
+        return descriptions
+
     async def get_goal_trend(
         self, user_id: UUID, goal_category: str, days: int = 7
     ) -> list[TrendDataPoint]:
@@ -44,21 +130,55 @@ class TrendService:
         start_date = today - timedelta(days=days - 1)
 
         result = await self.db.execute(
-            select(DailyScore.score_date, ScoreMetric.score)
-            .join(ScoreMetric, ScoreMetric.daily_score_id == DailyScore.id)
-            .where(
-                and_(
-                    DailyScore.user_id == user_id,
-                    DailyScore.score_date >= start_date,
-                    DailyScore.score_date <= today,
-                    ScoreMetric.category == goal_category,
-                )
-            )
-            .order_by(DailyScore.score_date)
+            _SELECT_GOAL_SCORES,
+            {"user_id": user_id, "start_date": start_date, "end_date": today, "category": goal_category},
         )
 
         rows = result.all()
-        return [TrendDataPoint(score_date=row[0], score=row[1]) for row in rows]
+        return [TrendDataPoint(score_date, score) for score_date, score in rows]
+
+    async def get_goal_trend_with_week_over_week(
+        self, user_id: UUID, goal_category: str, days: int = 7
+    ) -> tuple[list[TrendDataPoint], WeekOverWeekResult]:
+        """
+        Get a goal's trend points and week-over-week comparison from one range scan.
+
+        The single-goal view needs both; the 14-day comparison window and the
+        trend window are read together and split in Python.
+
+        Returns:
+            Tuple of (trend points for the last `days` days ascending,
+            WeekOverWeekResult with calculate_week_over_week semantics)
+        """
+        this_week_start, this_week_end, last_week_start, last_week_end = self._week_bounds()
+        trend_start = this_week_end - timedelta(days=days - 1)
+
+        result = await self.db.execute(
+            _SELECT_GOAL_SCORES,
+            {
+                "user_id": user_id,
+                "start_date": min(trend_start, last_week_start),
+                "end_date": this_week_end,
+                "category": goal_category,
+            },
+        )
+
+        data_points = []
+        this_week: list[float] = []
+        last_week: list[float] = []
+        for score_date, score in result.all():
+            if score_date >= trend_start:
+                data_points.append(TrendDataPoint(score_date, score))
+            if score_date >= this_week_start:
+                this_week.append(score)
+            elif last_week_start <= score_date <= last_week_end:
+                last_week.append(score)
+
+        wow = self._classify_week_over_week(
+            sum(this_week) / len(this_week) if this_week else None,
+            sum(last_week) / len(last_week) if last_week else None,
+        )
+        return data_points, wow
 
     async def get_all_goals_trends(
         self, user_id: UUID, days: int = 7
@@ -72,27 +192,37 @@ class TrendService:
         start_date = today - timedelta(days=days - 1)
 
         result = await self.db.execute(
-            select(ScoreMetric.category, DailyScore.score_date, ScoreMetric.score)
-            .join(DailyScore, ScoreMetric.daily_score_id == DailyScore.id)
-            .where(
-                and_(
-                    DailyScore.user_id == user_id,
-                    DailyScore.score_date >= start_date,
-                    DailyScore.score_date <= today,
-                )
-            )
-            .order_by(ScoreMetric.category, DailyScore.score_date)
+            _SELECT_ALL_GOAL_SCORES,
+            {"user_id": user_id, "start_date": start_date, "end_date": today},
         )
 
-        rows = result.all()
+        # Rows arrive ordered by category, so each group is one contiguous run
+        return {
+            category: [TrendDataPoint(score_date, score) for _, score_date, score in group]
+            for category, group in groupby(result.all(), key=itemgetter(0))
+        }
 
-        trends: dict[str, list[TrendDataPoint]] = {}
-        for category, score_date, score in rows:
-            if category not in trends:
-                trends[category] = []
-            trends[category].append(TrendDataPoint(score_date=score_date, score=score))
+    def _week_bounds(self) -> tuple[date, date, date, date]:
+        """(this_week_start, this_week_end, last_week_start, last_week_end)."""
+        today = date.today()
+        # This week: last 7 days; last week: 8-14 days ago
+        return (
+            today - timedelta(days=6),
+            today,
+            today - timedelta(days=13),
+            today - timedelta(days=7),
+        )
 
-        return trends
+    def _week_over_week_params(self, user_id: UUID) -> dict:
+        """Bind parameters for the week-over-week statements."""
+        this_week_start, this_week_end, last_week_start, last_week_end = self._week_bounds()
+        return {
+            "user_id": user_id,
+            "this_week_start": this_week_start,
+            "this_week_end": this_week_end,
+            "last_week_start": last_week_start,
+            "last_week_end": last_week_end,
+        }
 
     async def calculate_week_over_week(
         self, user_id: UUID, goal_category: str
@@ -109,58 +239,33 @@ class TrendService:
         - "stable": -5% <= percentage_change <= 5%
         - "insufficient_data": either week has no data
         """
-        today = date.today()
-
-        # This week: last 7 days
-        this_week_start = today - timedelta(days=6)
-        this_week_end = today
-
-        # Last week: 8-14 days ago
-        last_week_start = today - timedelta(days=13)
-        last_week_end = today - timedelta(days=7)
-
-        # Get this week's scores
-        this_week_result = await self.db.execute(
-            select(ScoreMetric.score)
-            .join(DailyScore, ScoreMetric.daily_score_id == DailyScore.id)
-            .where(
-                and_(
-                    DailyScore.user_id == user_id,
-                    DailyScore.score_date >= this_week_start,
-                    DailyScore.score_date <= this_week_end,
-                    ScoreMetric.category == goal_category,
-                )
-            )
-        )
-        this_week_scores = [row[0] for row in this_week_result.all()]
-
-        # Get last week's scores
-        last_week_result = await self.db.execute(
-            select(ScoreMetric.score)
-            .join(DailyScore, ScoreMetric.daily_score_id == DailyScore.id)
-            .where(
-                and_(
-                    DailyScore.user_id == user_id,
-                    DailyScore.score_date >= last_week_start,
-                    DailyScore.score_date <= last_week_end,
-                    ScoreMetric.category == goal_category,
-                )
-            )
+        result = await self.db.execute(
+            _SELECT_GOAL_WEEK_OVER_WEEK,
+            {**self._week_over_week_params(user_id), "category": goal_category},
         )
-        last_week_scores = [row[0] for row in last_week_result.all()]
+        row = result.first()
+        if row is None:
+            return self._classify_week_over_week(None, None)
+        return self._classify_week_over_week(row.this_week_avg, row.last_week_avg)
 
-        # Calculate averages
-        this_week_avg = (
-            sum(this_week_scores) / len(this_week_scores)
-            if this_week_scores
-            else None
-        )
-        last_week_avg = (
-            sum(last_week_scores) / len(last_week_scores)
-            if last_week_scores
-            else None
-        )
+    async def calculate_week_over_week_bulk(self, user_id: UUID) -> dict[str, WeekOverWeekResult]:
+        """
+        Week-over-week comparison for every category the user scored in the last 14 days.
 
+        Same semantics as calculate_week_over_week, but one query for all
+        categories. Categories absent from the result have no data in either week.
+        """
+        result = await self.db.execute(_SELECT_WEEK_OVER_WEEK, self._week_over_week_params(user_id))
+        return {
+            row.category: self._classify_week_over_week(row.this_week_avg, row.last_week_avg)
+            for row in result.all()
+        }
+
+    @staticmethod
+    def _classify_week_over_week(
+        this_week_avg: float | None, last_week_avg: float | None
+    ) -> WeekOverWeekResult:
+        """Compute percentage change and trend label from the two weekly averages."""
         # Calculate percentage change and trend
         if this_week_avg is None or last_week_avg is None:
             return WeekOverWeekResult(
@@ -1,38 +1,47 @@
+import asyncio
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
+from app.core.auth_cache import auth_cache
 from app.core.security import get_password_hash, verify_password
 
+# Built once at import so SQLAlchemy's compiled-statement cache is reused
+_SELECT_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_SELECT_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
 
 class UserService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_by_id(self, user_id: UUID) -> User | None:
-        result = await self.db.execute(select(User).where(User.id == user_id))
+        result = await self.db.execute(_SELECT_BY_ID, {"user_id": user_id})
         return result.scalar_one_or_none()
 
     async def get_by_email(self, email: str) -> User | None:
-        result = await self.db.execute(select(User).where(User.email == email))
+        result = await self.db.execute(_SELECT_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
     async def create(self, email: str, password: str, full_name: str | None = None) -> User:
+        # bcrypt is deliberately slow; hash off the event loop
+        hashed_password = await asyncio.to_thread(get_password_hash, password)
         user = User(
             email=email,
-            hashed_password=get_password_hash(password),
+            hashed_password=hashed_password,
             full_name=full_name,
         )
         self.db.add(user)
+        # Server defaults come back via RETURNING (eager_defaults), no refresh
         await self.db.commit()
-        await self.db.refresh(user)
+        await auth_cache.invalidate(user.id)
         return user
 
     async def authenticate(self, email: str, password: str) -> User | None:
         user = await self.get_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await asyncio.to_thread(verify_password, password, user.hashed_password):
             return None
         return user
 
@@ -41,6 +50,7 @@ class UserService:
             user.full_name = full_name
         if preferences is not None:
             user.preferences = preferences
+        # updated_at comes back via RETURNING (eager_defaults), no refresh
         await self.db.commit()
-        await self.db.refresh(user)
+        await auth_cache.invalidate(user.id)
         return user
@@ -0,0 +1,126 @@
+"""Verdict service that assembles score context and runs verdict generation."""
+
+from collections.abc import AsyncIterator
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.daily_score import DailyScore
+from app.models.journal_entry import JournalEntry, ExtractedMetric
+from app.ai_pipeline.agents.mood_classifier import MoodClassifier, MockMoodClassifier
+from app.ai_pipeline.agents.verdict_generator import VerdictGenerator, MockVerdictGenerator
+from app.ai_pipeline.pipeline import classify_with_fallback
+from app.ai_pipeline.schemas.verdict import Verdict, VerdictInput, VerdictType
+from app.services.scoring_service import ScoringService
+
+
+class VerdictService:
+    """
+    Builds verdict input from a scored day and streams the generated verdict.
+
+    Mood is classified first so the tone tier is safe for the user's state.
+    Falls back to mock agents when no LLM credentials are configured.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _get_agents(self):
+        """Return (mood classifier, verdict generator), mocking when unconfigured."""
+        try:
+            return MoodClassifier(), VerdictGenerator()
+        except ValueError:
+            # API key not configured, use mocks
+            return MockMoodClassifier(), MockVerdictGenerator()
+
+    async def build_verdict_input(
+        self, user_id: UUID, score_date: date
+    ) -> tuple[VerdictInput, str] | None:
+        """
+        Build VerdictInput for a scored day.
+
+        Args:
+            user_id: User ID
+            score_date: Date that has already been scored
+
+        Returns:
+            Tuple of (VerdictInput, journal content), or None if the day
+            has not been scored yet
+        """
+        result = await self.db.execute(
+            select(DailyScore)
+            .options(selectinload(DailyScore.metrics))
+            .where(
+                DailyScore.user_id == user_id,
+                DailyScore.score_date == score_date,
+            )
+        )
+        score = result.scalar_one_or_none()
+        if not score:
+            return None
+
+        entries_result = await self.db.execute(
+            select(JournalEntry)
+            .options(selectinload(JournalEntry.metrics))
+            .where(
+                JournalEntry.user_id == user_id,
+                JournalEntry.entry_date == score_date,
+            )
+            .order_by(JournalEntry.created_at)
+        )
+        entries = list(entries_result.scalars().all())
+
+        metrics: list[ExtractedMetric] = [m for entry in entries for m in entry.metrics]
+        activities = [
+            {
+                "activity": metric.key.replace("_", " "),
+                "category": metric.category,
+                "value": metric.value,
+                "evidence": metric.evidence,
+            }
+            for metric in metrics
+        ]
+
+        streaks = await ScoringService(self.db).get_streaks(user_id)
+        comparison = score.comparison_data or {}
+
+        verdict_input = VerdictInput(
+            verdict_type=VerdictType(score.verdict),
+            today_score=score.composite_score,
+            yesterday_score=comparison.get("yesterday"),
+            score_delta=comparison.get("delta"),
+            activities=activities,
+            goal_categories=[m.category for m in score.metrics],
+            streak_days=max((s.current_streak for s in streaks), default=0),
+        )
+        content = "\n\n".join(entry.content_markdown for entry in entries)
+        return verdict_input, content
+
+    async def stream_verdict(
+        self, user_id: UUID, score_date: date
+    ) -> AsyncIterator[Verdict] | None:
+        """
+        Classify mood and start streaming the verdict for a scored day.
+
+        Args:
+            user_id: User ID
+            score_date: Date that has already been scored
+
+        Returns:
+            Async iterator of partial Verdicts, or None if the day has
+            not been scored yet
+        """
+        built = await self.build_verdict_input(user_id, score_date)
+        if built is None:
+            return None
+
+        verdict_input, content = built
+        classifier, generator = self._get_agents()
+        mood = await classify_with_fallback(
+            classifier, content, f"Score {verdict_input.today_score:.1f}, verdict {verdict_input.verdict_type.value}"
+        )
+        tone_tier = classifier.get_messaging_tier(mood)
+        return generator.generate_stream(verdict_input, tone_tier)
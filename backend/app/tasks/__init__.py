@@ -3,3 +3,4 @@ from app.tasks.notification_tasks import (
     check_and_notify_non_loggers,
     send_notification_to_user,
 )
+from app.tasks.voice_tasks import transcribe_and_append
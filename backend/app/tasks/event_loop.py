@@ -0,0 +1,69 @@
+"""Persistent asyncio event loop for running async code inside Celery tasks."""
+import asyncio
+import logging
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - installed with uvicorn[standard]
+    uvloop = None
+
+from app.ai_pipeline.clients import close_http_client
+from app.core.config import settings
+from app.db.session import engine, read_engine
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# One loop per worker thread (prefork workers have exactly one). Reusing it
+# keeps the engine pool and the shared LLM HTTP client warm across tasks;
+# both are bound to the loop that opened their connections.
+_local = threading.local()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's task loop (uvloop when installed), creating it on first use."""
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _local.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the worker's persistent loop."""
+    return get_worker_loop().run_until_complete(coro)
+
+
+async def _close_clients() -> None:
+    await close_http_client()
+    await engine.dispose()
+    if settings.DATABASE_READ_URL:
+        await read_engine.dispose()
+
+
+@worker_process_init.connect
+def _open_worker_loop(**kwargs) -> None:
+    # Connections inherited from the parent over fork are not this process's
+    engine.sync_engine.dispose(close=False)
+    if settings.DATABASE_READ_URL:
+        read_engine.sync_engine.dispose(close=False)
+    get_worker_loop()
+
+
+@worker_process_shutdown.connect
+def _close_worker_loop(**kwargs) -> None:
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(_close_clients())
+    except Exception as e:
+        logger.warning(f"Failed to close worker clients cleanly: {e}")
+    finally:
+        loop.close()
@@ -0,0 +1,64 @@
+"""Celery tasks for scheduled extraction backfills."""
+import logging
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import select, and_
+
+from app.celery_app import celery_app
+from app.db.session import AsyncSessionLocal
+from app.models.journal_entry import JournalEntry
+from app.services.extraction_service import ExtractionService
+from app.tasks.event_loop import run_async
+
+logger = logging.getLogger(__name__)
+
+# Batch jobs have a 24h completion window; allow the task to wait it out
+BATCH_TIME_LIMIT = 25 * 3600
+
+
+@celery_app.task(
+    name="app.tasks.extraction_tasks.backfill_extractions",
+    time_limit=BATCH_TIME_LIMIT,
+    soft_time_limit=BATCH_TIME_LIMIT - 300,
+)
+def backfill_extractions(user_id: str, start_date_str: str, end_date_str: str):
+    """
+    Re-extract a user's journal entries in a date range in bulk.
+
+    Used for historical imports and nightly re-scoring where latency
+    doesn't matter but per-token cost does.
+    """
+    user_uuid = UUID(user_id)
+    start_date = date.fromisoformat(start_date_str)
+    end_date = date.fromisoformat(end_date_str)
+
+    async def _run():
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(JournalEntry).where(
+                    and_(
+                        JournalEntry.user_id == user_uuid,
+                        JournalEntry.entry_date >= start_date,
+                        JournalEntry.entry_date <= end_date,
+                    )
+                )
+            )
+            entries = list(result.scalars().all())
+            if not entries:
+                return 0, 0
+
+            metrics = await ExtractionService(db).extract_and_persist_batch(entries)
+            return len(entries), len(metrics)
+
+    entries_count, metrics_count = run_async(_run())
+    logger.info(
+        f"Backfilled {entries_count} entries for user {user_id} "
+        f"({start_date} to {end_date}): {metrics_count} metrics"
+    )
+    return {
+        "status": "completed",
+        "user_id": user_id,
+        "entries": entries_count,
+        "metrics": metrics_count,
+    }
@@ -1,29 +1,16 @@
 """Celery tasks for notification scheduling."""
-import asyncio
 import logging
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import select, and_, func
-
 from app.celery_app import celery_app
 from app.db.session import AsyncSessionLocal
 from app.services.notification_service import NotificationService
-from app.models.notification import Notification
+from app.tasks.event_loop import run_async
 
 logger = logging.getLogger(__name__)
 
 
-def run_async(coro):
-    """Helper to run async code in sync Celery task."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
 @celery_app.task(
     name="app.tasks.notification_tasks.check_and_notify_non_loggers",
     bind=True,
@@ -54,57 +41,47 @@ def check_and_notify_non_loggers(self):
 
 async def _check_and_notify() -> dict:
     """Async implementation of notification check."""
-    async with AsyncSessionLocal() as db:
+    # Non-loggers stream from their own session: committing a batch's
+    # notifications would otherwise close the server-side cursor
+    async with AsyncSessionLocal() as read_db, AsyncSessionLocal() as db:
+        reader = NotificationService(read_db)
         service = NotificationService(db)
 
         today = date.today()
         current_time = datetime.now().time()
 
-        # Get non-loggers whose notification time has passed
-        non_loggers = await service.get_non_loggers(
+        checked_users = 0
+        notifications_created = 0
+
+        # Non-loggers whose notification time has passed, one batch at a time
+        async for user_ids in reader.iter_non_logger_batches(
             target_date=today,
             cutoff_time=current_time,
-        )
+        ):
+            checked_users += len(user_ids)
 
-        notifications_created = 0
-        for user in non_loggers:
-            # Check if we already sent a notification today
-            existing = await _has_notification_today(db, user.id, today)
-            if existing:
-                continue
-
-            # Generate personalized message
-            message = await service.generate_reminder_message(user.id)
-
-            # Create notification record
-            await service.create_notification(
-                user_id=user.id,
-                message=message,
-                notification_type="reminder",
-            )
-            notifications_created += 1
-            logger.info(f"Created notification for user {user.id}")
+            # Skip users we already reminded today
+            reminded = await service.get_reminded_today(user_ids, today)
+            pending = [user_id for user_id in user_ids if user_id not in reminded]
+
+            # Personalized messages for the batch from one summary query
+            messages = await service.generate_reminder_messages(pending)
+
+            # One INSERT and one commit per batch
+            created = await service.create_notifications_bulk([
+                {"user_id": user_id, "message": messages[user_id], "notification_type": "reminder"}
+                for user_id in pending
+            ])
+            notifications_created += len(created)
+            logger.info(f"Created {len(created)} reminder notifications")
 
         return {
-            "checked_users": len(non_loggers),
+            "checked_users": checked_users,
             "notifications_created": notifications_created,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
 
-async def _has_notification_today(db, user_id: UUID, target_date: date) -> bool:
-    """Check if user already received a reminder notification today."""
-    query = select(Notification).where(
-        and_(
-            Notification.user_id == user_id,
-            Notification.notification_type == "reminder",
-            func.date(Notification.created_at) == target_date,
-        )
-    )
-    result = await db.execute(query)
-    return result.scalar_one_or_none() is not None
-
-
 @celery_app.task(
     name="app.tasks.notification_tasks.send_notification_to_user",
     bind=True,
@@ -3,9 +3,12 @@ import logging
 from datetime import date, datetime, timezone
 from uuid import UUID
 
+from celery import group
+
 from app.celery_app import celery_app
 from app.db.session import AsyncSessionLocal
-from app.services.analysis_orchestrator import AnalysisOrchestrator
+from app.services.analysis_orchestrator import AnalysisOrchestrator, get_zone
+from app.tasks.event_loop import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +20,6 @@ def check_due_analyses():
 
     Finds users due for analysis and spawns individual analysis tasks.
     """
-    import asyncio
-
     async def _check():
         async with AsyncSessionLocal() as db:
             orchestrator = AnalysisOrchestrator(db)
@@ -26,21 +27,19 @@ def check_due_analyses():
 
             logger.info(f"Found {len(due_users)} users due for analysis")
 
-            for user in due_users:
-                # Determine analysis date (today in user's timezone)
-                from zoneinfo import ZoneInfo
-                user_tz = ZoneInfo(user.timezone or "UTC")
-                user_now = datetime.now(timezone.utc).astimezone(user_tz)
-                analysis_date = user_now.date()
+            # Analysis date is today in each user's timezone (ZoneInfo cached per name)
+            now = datetime.now(timezone.utc)
+            return [
+                run_user_analysis.s(str(user.id), now.astimezone(get_zone(user.timezone)).date().isoformat())
+                for user in due_users
+            ]
 
-                # Spawn individual analysis task
-                run_user_analysis.delay(str(user.id), analysis_date.isoformat())
-                logger.info(
-                    f"Spawned analysis task for user {user.id} "
-                    f"for date {analysis_date}"
-                )
+    signatures = run_async(_check())
 
-    asyncio.run(_check())
+    # Publish every analysis task over one producer checkout instead of N delay() calls
+    if signatures:
+        group(signatures).apply_async()
+        logger.info(f"Spawned {len(signatures)} analysis tasks")
 
 
 @celery_app.task(
@@ -58,8 +57,6 @@ def run_user_analysis(self, user_id: str, analysis_date_str: str):
 
     Uses exponential backoff on failure.
     """
-    import asyncio
-
     analysis_date = date.fromisoformat(analysis_date_str)
     user_uuid = UUID(user_id)
 
@@ -79,7 +76,7 @@ def run_user_analysis(self, user_id: str, analysis_date_str: str):
             return result
 
     try:
-        result = asyncio.run(_run())
+        result = run_async(_run())
         if result:
             logger.info(
                 f"Analysis completed for user {user_id}: "
@@ -102,8 +99,6 @@ def run_manual_analysis(user_id: str, analysis_date_str: str | None = None):
     """
     Manually trigger analysis for a user (e.g., from API endpoint).
     """
-    import asyncio
-
     if analysis_date_str:
         analysis_date = date.fromisoformat(analysis_date_str)
     else:
@@ -118,7 +113,7 @@ def run_manual_analysis(user_id: str, analysis_date_str: str | None = None):
             orchestrator = AnalysisOrchestrator(db)
             return await orchestrator.run_analysis(user_uuid, analysis_date)
 
-    result = asyncio.run(_run())
+    result = run_async(_run())
     return {
         "status": "completed" if result else "no_entries",
         "user_id": user_id,
@@ -0,0 +1,61 @@
+"""Celery tasks for background voice transcription."""
+import logging
+from datetime import date
+from pathlib import Path
+from uuid import UUID
+
+import httpx
+
+from app.celery_app import celery_app
+from app.db.session import AsyncSessionLocal
+from app.services.journal_service import JournalService
+from app.services.transcription_service import TranscriptionService
+from app.tasks.event_loop import run_async
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="app.tasks.voice_tasks.transcribe_and_append")
+def transcribe_and_append(
+    user_id: str,
+    entry_date_str: str,
+    audio_path: str,
+    filename: str | None,
+    content_type: str,
+):
+    """
+    Transcribe a saved voice upload with Whisper and append it to the journal.
+
+    The API route only saves the upload and enqueues this task, so the
+    web worker is not held for the Whisper round-trip. The saved file is
+    removed whether or not transcription succeeds.
+    """
+    user_uuid = UUID(user_id)
+    entry_date = date.fromisoformat(entry_date_str)
+    path = Path(audio_path)
+
+    async def _run():
+        # Own HTTP client: Whisper uploads need a longer timeout than the shared LLM client
+        async with httpx.AsyncClient(timeout=httpx.Timeout(120.0, connect=5.0)) as http_client:
+            text = await TranscriptionService(http_client).transcribe_path(path, filename, content_type)
+        async with AsyncSessionLocal() as db:
+            journal = await JournalService(db).append_content(
+                user_id=user_uuid,
+                entry_date=entry_date,
+                new_content=text,
+                input_source="voice",
+            )
+            return text, journal.id
+
+    try:
+        transcribed_text, journal_id = run_async(_run())
+    finally:
+        path.unlink(missing_ok=True)
+
+    logger.info(f"Transcribed voice upload for user {user_id} into journal {journal_id}")
+    return {
+        "user_id": user_id,
+        "transcribed_text": transcribed_text,
+        "journal_id": str(journal_id),
+        "entry_date": entry_date_str,
+    }
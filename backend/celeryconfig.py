@@ -36,7 +36,9 @@ beat_schedule = {
 task_routes = {
     "app.tasks.orchestrator.*": {"queue": "default"},
     "app.tasks.analysis.*": {"queue": "analysis"},
+    "app.tasks.extraction_tasks.*": {"queue": "analysis"},
     "app.tasks.notification_tasks.*": {"queue": "notifications"},
+    "app.tasks.voice_tasks.*": {"queue": "analysis"},
 }
 
 # Result backend settings
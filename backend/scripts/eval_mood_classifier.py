@@ -0,0 +1,67 @@
+"""
+Compare mood classification between the cheap and full models.
+
+Replays labeled journal entries through both models and fails unless
+mood-level divergence stays under 2% and crisis recall is 100% for the
+cheap model. Run before changing AZURE_OPENAI_MOOD_DEPLOYMENT or
+ANTHROPIC_MOOD_MODEL.
+
+Usage:
+    python scripts/eval_mood_classifier.py labeled_entries.jsonl [--provider azure]
+
+Each input line: {"content": "...", "level": "stable", "crisis_flag": false}
+"""
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.ai_pipeline.agents.mood_classifier import MoodClassifier  # noqa: E402
+
+MAX_DIVERGENCE = 0.02
+
+
+async def evaluate(path: Path, provider: str | None) -> bool:
+    classifier = MoodClassifier(provider)
+    entries = [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+    divergent = 0
+    crisis_total = 0
+    crisis_caught = 0
+    for entry in entries:
+        fast = await classifier.classify_with_model(entry["content"], classifier.deployment)
+        full = await classifier.classify_with_model(entry["content"], classifier.fallback_deployment)
+
+        if fast.level != full.level:
+            divergent += 1
+        if entry.get("crisis_flag"):
+            crisis_total += 1
+            crisis_caught += fast.crisis_flag
+
+    divergence = divergent / len(entries) if entries else 0.0
+    recall = crisis_caught / crisis_total if crisis_total else 1.0
+
+    print(f"Models: {classifier.deployment} vs {classifier.fallback_deployment}")
+    print(f"Entries: {len(entries)}")
+    print(f"Mood level divergence: {divergence:.1%} (max {MAX_DIVERGENCE:.0%})")
+    print(f"Crisis recall: {recall:.1%} ({crisis_caught}/{crisis_total})")
+
+    return divergence < MAX_DIVERGENCE and recall == 1.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("entries", type=Path, help="JSONL file of labeled entries")
+    parser.add_argument("--provider", choices=["azure", "anthropic"], default=None)
+    args = parser.parse_args()
+
+    passed = asyncio.run(evaluate(args.entries, args.provider))
+    print("PASS" if passed else "FAIL")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import os
+import uuid
+from contextlib import contextmanager
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine, event
+
+# app.db.session builds its engine at import; it never connects in these tests
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/test")
+
+# Postgres-only SQL (COPY, LATERAL unnest, regex, enums) runs against this
+# database when set, e.g. postgresql://postgres@/postgres?host=/tmp/pgdata
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+@pytest.fixture
+def sqlite_engine():
+    """In-memory SQLite engine with the score tables created."""
+    from app.models.daily_score import DailyScore, ScoreMetric
+    from app.models.user import User
+
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def _register_functions(dbapi_connection, connection_record):
+        # Primary keys default to Postgres' gen_random_uuid(); Uuid columns are hex on SQLite
+        dbapi_connection.create_function("gen_random_uuid", 0, lambda: uuid.uuid4().hex)
+
+    tables = [User.__table__, DailyScore.__table__, ScoreMetric.__table__]
+    User.metadata.create_all(engine, tables=tables)
+    yield engine
+    engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def pg_session():
+    """
+    AsyncSession on TEST_DATABASE_URL with the app tables created in a
+    throwaway schema; skips when no test database is configured.
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL not set")
+
+    from sqlalchemy import text
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from app.models import (
+        DailyScore, ExtractedMetric, JournalEntry, Notification, ScoreMetric, User, UserGoal,
+    )
+    from app.models.goal import GoalActivityLink
+
+    schema = f"test_{uuid.uuid4().hex[:12]}"
+    url = make_url(TEST_DATABASE_URL).set(drivername="postgresql+psycopg")
+    engine = create_async_engine(
+        url,
+        poolclass=NullPool,
+        connect_args={"options": f"-csearch_path={schema}"},
+    )
+    tables = [
+        User.__table__, UserGoal.__table__, JournalEntry.__table__, ExtractedMetric.__table__,
+        GoalActivityLink.__table__, DailyScore.__table__, ScoreMetric.__table__,
+        Notification.__table__,
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA {schema}"))
+        await conn.run_sync(User.metadata.create_all, tables=tables)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+    await engine.dispose()
+
+
+@pytest.fixture
+def count_queries():
+    """
+    Context manager recording every SQL statement an engine executes.
+
+        with count_queries(engine) as queries:
+            ...
+        assert len(queries) <= 2
+    """
+    @contextmanager
+    def _count(engine):
+        queries: list[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return _count
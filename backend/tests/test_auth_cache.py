@@ -0,0 +1,141 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as redis
+from fastapi import HTTPException
+from sqlalchemy import inspect
+
+from app.core import auth_cache as auth_cache_module
+from app.core.auth_cache import AuthCache
+from app.core.security import create_access_token
+from app.deps import get_current_user
+from app.models.user import User
+
+
+class FakeRedis:
+    """The two Redis commands AuthCache uses, shared like a real server."""
+
+    def __init__(self):
+        self.data: dict[str, int] = {}
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise redis.ConnectionError("down")
+
+    async def get(self, key):
+        self._check()
+        value = self.data.get(key)
+        return None if value is None else str(value)
+
+    async def incr(self, key):
+        self._check()
+        self.data[key] = self.data.get(key, 0) + 1
+        return self.data[key]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    server = FakeRedis()
+    monkeypatch.setattr(auth_cache_module, "get_redis", lambda: server)
+    return server
+
+
+@pytest.fixture
+def cache(fake_redis, monkeypatch):
+    cache = AuthCache()
+    monkeypatch.setattr("app.deps.auth_cache", cache)
+    return cache
+
+
+@pytest_asyncio.fixture
+async def user(pg_session):
+    user = User(email="cache@example.com", hashed_password="x", full_name="Cached")
+    pg_session.add(user)
+    await pg_session.commit()
+    return user
+
+
+class TestAuthCache:
+    """Tests for the cached users lookup behind get_current_user."""
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_other_workers(self, fake_redis):
+        """A generation bump in Redis expires the snapshot in every process."""
+        user = User(id=uuid.uuid4(), email="a@example.com", hashed_password="x")
+        worker_a, worker_b = AuthCache(), AuthCache()
+        await worker_a.set(user)
+        await worker_b.set(user)
+
+        await worker_a.invalidate(user.id)
+
+        assert await worker_a.get(user.id) is None
+        assert await worker_b.get(user.id) is None
+
+    @pytest.mark.asyncio
+    async def test_redis_down_misses(self, fake_redis):
+        """Without Redis the generation can't be checked, so nothing is served."""
+        user = User(id=uuid.uuid4(), email="a@example.com", hashed_password="x")
+        cache = AuthCache()
+        await cache.set(user)
+        fake_redis.down = True
+
+        assert await cache.get(user.id) is None
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit_skips_select(self, pg_session, user, cache, count_queries):
+        """The first request loads the user; the next one is served from cache."""
+        token = create_access_token(user.id)
+        engine = pg_session.bind.sync_engine
+
+        with count_queries(engine) as queries:
+            loaded = await get_current_user(pg_session, token)
+        assert loaded.id == user.id
+        assert len(queries) == 1
+
+        pg_session.expunge_all()
+        with count_queries(engine) as queries:
+            cached = await get_current_user(pg_session, token)
+        assert queries == []
+        assert cached.email == "cache@example.com"
+
+    @pytest.mark.asyncio
+    async def test_hit_is_attached_to_session(self, pg_session, user, cache):
+        """The merged snapshot is persistent in the request session and writable."""
+        token = create_access_token(user.id)
+        await get_current_user(pg_session, token)
+        pg_session.expunge_all()
+
+        cached = await get_current_user(pg_session, token)
+        assert inspect(cached).persistent
+        assert cached in pg_session
+
+        cached.full_name = "Renamed"
+        await pg_session.commit()
+        pg_session.expunge_all()
+        reloaded = await pg_session.get(User, user.id)
+        assert reloaded.full_name == "Renamed"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads(self, pg_session, user, cache, count_queries):
+        """After invalidate the next request goes back to the database."""
+        token = create_access_token(user.id)
+        await get_current_user(pg_session, token)
+        await cache.invalidate(user.id)
+        pg_session.expunge_all()
+
+        with count_queries(pg_session.bind.sync_engine) as queries:
+            await get_current_user(pg_session, token)
+        assert len(queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_token_rejected_even_when_cached(self, pg_session, user, cache):
+        """A cached user never authenticates an expired token."""
+        await get_current_user(pg_session, create_access_token(user.id))
+        expired = create_access_token(user.id, expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(pg_session, expired)
+        assert exc_info.value.status_code == 401
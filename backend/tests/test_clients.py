@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from app.ai_pipeline import clients
+from app.core.config import settings
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_client(monkeypatch):
+    monkeypatch.setattr(clients, "_shared_http_client", None)
+    monkeypatch.setattr(clients, "_http_client_loop", None)
+    monkeypatch.setattr(clients, "settings", settings.model_copy(update={"ANTHROPIC_API_KEY": "test-key"}))
+
+
+class TestSharedHttpClient:
+    """Tests for the process-wide LLM HTTP client across event loops."""
+
+    def test_reused_within_a_loop(self):
+        """Agents on the same loop share one pool."""
+        async def twice():
+            return clients.get_http_client(), clients.get_http_client()
+
+        first, second = asyncio.run(twice())
+        assert first is second
+
+    def test_rebuilt_for_a_new_loop(self):
+        """asyncio.run per task gets a pool owned by its own loop."""
+        async def get():
+            return clients.get_http_client(), clients.get_anthropic_instructor()
+
+        http_a, sdk_a = asyncio.run(get())
+        http_b, sdk_b = asyncio.run(get())
+
+        assert http_a is not http_b
+        assert sdk_a is not sdk_b
+        assert sdk_b.client._client is http_b
+
+    def test_agent_singleton_follows_the_loop(self):
+        """The cached ExtractionAgent picks up each loop's client instead of pinning the first."""
+        from app.ai_pipeline.agents.extraction_agent import get_extraction_agent
+
+        agent = get_extraction_agent("anthropic")
+
+        async def get():
+            return clients.get_http_client(), agent.client
+
+        http_a, sdk_a = asyncio.run(get())
+        http_b, sdk_b = asyncio.run(get())
+
+        assert get_extraction_agent("anthropic") is agent
+        assert sdk_a.client._client is http_a
+        assert sdk_b.client._client is http_b
+
+    def test_enhancer_singleton_follows_the_loop(self, monkeypatch):
+        """The cached LLMScoreEnhancer looks up its client per request."""
+        from app.ai_pipeline.scoring.llm_enhancer import LLMScoreEnhancer
+
+        azure = {
+            "AZURE_OPENAI_API_KEY": "test-key",
+            "AZURE_OPENAI_API_BASE": "https://example.openai.azure.com",
+        }
+        monkeypatch.setattr(clients, "settings", settings.model_copy(update=azure))
+        enhancer = LLMScoreEnhancer()
+
+        async def get():
+            return clients.get_http_client(), enhancer.client
+
+        http_a, sdk_a = asyncio.run(get())
+        http_b, sdk_b = asyncio.run(get())
+
+        assert sdk_a.client._client is http_a
+        assert sdk_b.client._client is http_b
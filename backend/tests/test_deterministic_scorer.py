@@ -1,6 +1,7 @@
 import pytest
 from app.ai_pipeline.scoring.deterministic import DeterministicScorer
 from app.ai_pipeline.scoring.schemas import GoalScoreInput
+from app.models.goal import UserGoal
 
 class TestDeterministicScorer:
     """Tests for deterministic scoring engine."""
@@ -116,3 +117,26 @@ class TestDeterministicScorer:
 
         assert result.showed_up is True
         assert result.base_score > 0
+
+    def test_effort_words_match_whole_tokens(self, scorer):
+        """Effort words inside longer words ("harder", "briefly") are not counted."""
+        base = dict(goal_category="fitness", goal_description="Exercise daily", target_value=1)
+        plain = scorer.score_goal(GoalScoreInput(
+            journal_content="Did a workout.", **base
+        ))
+        embedded = scorer.score_goal(GoalScoreInput(
+            journal_content="Did a workout, harder than I expected and briefly rested.", **base
+        ))
+
+        assert embedded.effort_level == plain.effort_level
+
+    def test_score_entry_memoized_on_content_and_goals(self, scorer):
+        """Unchanged content and goal inputs reuse the previous result."""
+        goal = UserGoal(category="fitness", description="Exercise daily", target_value=1, is_active=True)
+        content = "Went to the gym and did a hard workout."
+
+        first = scorer.score_entry(content, [goal])
+        assert scorer.score_entry(content, [goal]) is first
+
+        goal.description = "Run three times a week"
+        assert scorer.score_entry(content, [goal]) is not first
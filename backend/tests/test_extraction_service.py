@@ -0,0 +1,155 @@
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from app.models.goal import UserGoal
+from app.models.journal_entry import ExtractedMetric, JournalEntry
+from app.models.user import User
+from app.services import extraction_service
+from app.services.extraction_service import COPY_THRESHOLD, ExtractionService
+
+
+@pytest_asyncio.fixture
+async def entry(pg_session):
+    user = User(email="extract@example.com", hashed_password="x")
+    pg_session.add(user)
+    await pg_session.flush()
+    entry = JournalEntry(user_id=user.id, entry_date=date(2026, 10, 14), content_markdown="entry")
+    pg_session.add(entry)
+    await pg_session.commit()
+    return entry
+
+
+def _metric(entry, category="fitness", key="workout_duration", value=30.0):
+    return {
+        "entry_id": entry.id,
+        "category": category,
+        "key": key,
+        "value": value,
+        "evidence": None,
+        "confidence": 1.0,
+    }
+
+
+async def _add_goal(session, entry, category, description, is_active=True):
+    goal = UserGoal(
+        user_id=entry.user_id,
+        category=category,
+        description=description,
+        target_value=1.0,
+        is_active=is_active,
+    )
+    session.add(goal)
+    await session.flush()
+    return goal
+
+
+class TestGoalLinks:
+    """Tests for the INSERT ... SELECT that links metrics to goals."""
+
+    @pytest.mark.asyncio
+    async def test_category_match_wins_over_keyword(self, pg_session, entry):
+        """A goal matching on category gets 1.0 even if its description also matches."""
+        goal = await _add_goal(pg_session, entry, "Fitness", "Daily workout routine")
+        service = ExtractionService(pg_session)
+        metrics = await service._insert_metrics([_metric(entry)])
+
+        links = await service.map_metrics_to_goals(entry.user_id, metrics)
+
+        assert [(link.goal_id, link.contribution_score) for link in links] == [(goal.id, 1.0)]
+        assert links[0].match_reason == "Category match: Fitness"
+
+    @pytest.mark.asyncio
+    async def test_keyword_match_tier(self, pg_session, entry):
+        """Another category's goal links at 0.7 when a long key word is in its description."""
+        goal = await _add_goal(pg_session, entry, "discipline", "Never skip a WORKOUT")
+        await _add_goal(pg_session, entry, "learning", "Read more books")
+        service = ExtractionService(pg_session)
+        metrics = await service._insert_metrics([_metric(entry)])
+
+        links = await service.map_metrics_to_goals(entry.user_id, metrics)
+
+        assert [(link.goal_id, link.contribution_score) for link in links] == [(goal.id, 0.7)]
+        assert links[0].match_reason == "Keyword match: workout_duration in 'Never skip a WORKOUT'"
+
+    @pytest.mark.asyncio
+    async def test_short_words_and_inactive_goals_ignored(self, pg_session, entry):
+        """Key words of three characters or fewer never match, nor do inactive goals."""
+        await _add_goal(pg_session, entry, "learning", "run the gym app")
+        await _add_goal(pg_session, entry, "fitness", "Old goal", is_active=False)
+        service = ExtractionService(pg_session)
+        metrics = await service._insert_metrics([_metric(entry, key="gym_run_app")])
+
+        assert await service.map_metrics_to_goals(entry.user_id, metrics) == []
+
+    @pytest.mark.asyncio
+    async def test_regex_metacharacters_in_keys_are_literal(self, pg_session, entry):
+        """Key words are escaped before joining into the regex alternation."""
+        literal_goal = await _add_goal(pg_session, entry, "learning", "Ship a node.js service")
+        await _add_goal(pg_session, entry, "social", "nodexjs meetup")
+        await _add_goal(pg_session, entry, "creativity", "Write a (draft) chapter")
+        service = ExtractionService(pg_session)
+        metrics = await service._insert_metrics([
+            _metric(entry, category="productivity", key="node.js_tutorials"),
+            _metric(entry, category="productivity", key="review_(draft)_pages"),
+            _metric(entry, category="productivity", key="a+b*_[x|y]"),
+        ])
+
+        links = await service.map_metrics_to_goals(entry.user_id, metrics)
+
+        by_key = {}
+        for link in links:
+            by_key.setdefault(link.match_reason.split(" in ")[0], []).append(link.goal_id)
+        assert by_key["Keyword match: node.js_tutorials"] == [literal_goal.id]
+        assert len(by_key["Keyword match: review_(draft)_pages"]) == 1
+        assert "Keyword match: a+b*_[x|y]" not in by_key
+
+
+class TestInsertRows:
+    """Tests for the INSERT vs COPY split in ExtractionService._insert_rows."""
+
+    @pytest.mark.asyncio
+    async def test_below_threshold_uses_insert_returning(self, pg_session, entry, monkeypatch):
+        """Small batches never reach COPY."""
+        async def no_copy(*args):
+            raise AssertionError("COPY used below threshold")
+
+        monkeypatch.setattr(extraction_service, "copy_rows", no_copy)
+        service = ExtractionService(pg_session)
+        rows = [_metric(entry, value=float(i)) for i in range(COPY_THRESHOLD - 1)]
+
+        metrics = await service._insert_metrics(rows)
+
+        assert len(metrics) == COPY_THRESHOLD - 1
+        assert all(metric.id is not None for metric in metrics)
+
+    @pytest.mark.asyncio
+    async def test_at_threshold_copies_and_attaches_instances(self, pg_session, entry):
+        """COPYed rows come back as persistent instances with their client-side ids."""
+        service = ExtractionService(pg_session)
+        rows = [_metric(entry, value=float(i)) for i in range(COPY_THRESHOLD)]
+
+        metrics = await service._insert_metrics(rows)
+        await pg_session.commit()
+
+        assert len(metrics) == COPY_THRESHOLD
+        assert all(metric in pg_session and metric.id is not None for metric in metrics)
+        count = await pg_session.scalar(select(func.count()).select_from(ExtractedMetric))
+        assert count == COPY_THRESHOLD
+        stored = await pg_session.get(ExtractedMetric, metrics[5].id)
+        assert stored.value == 5.0
+
+    @pytest.mark.asyncio
+    async def test_copied_metrics_link_to_goals(self, pg_session, entry):
+        """COPYed metrics are visible to the goal-link INSERT ... SELECT in the same transaction."""
+        await _add_goal(pg_session, entry, "fitness", "Work out")
+        service = ExtractionService(pg_session)
+        metrics = await service._insert_metrics(
+            [_metric(entry, value=float(i)) for i in range(COPY_THRESHOLD)]
+        )
+
+        links = await service.map_metrics_to_goals(entry.user_id, metrics)
+
+        assert len(links) == COPY_THRESHOLD
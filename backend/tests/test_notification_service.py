@@ -0,0 +1,76 @@
+from datetime import date, time
+
+import pytest
+
+from app.models.journal_entry import JournalEntry
+from app.models.user import User
+from app.services.notification_service import NotificationService
+
+TARGET_DATE = date(2026, 10, 14)
+
+
+async def _add_users(session, preferences_by_email):
+    users = {
+        email: User(email=email, hashed_password="x", preferences=preferences)
+        for email, preferences in preferences_by_email.items()
+    }
+    session.add_all(users.values())
+    await session.commit()
+    return users
+
+
+class TestNonLoggerNotificationTime:
+    """Tests for the SQL notification_time filter in get_non_loggers."""
+
+    @pytest.mark.asyncio
+    async def test_cutoff_uses_well_formed_times(self, pg_session):
+        """Valid H:MM / HH:MM preferences are compared against the cutoff."""
+        await _add_users(pg_session, {
+            "early@example.com": {"notification_time": "9:05"},
+            "due@example.com": {"notification_time": "17:30"},
+            "late@example.com": {"notification_time": "19:00"},
+        })
+
+        users = await NotificationService(pg_session).get_non_loggers(TARGET_DATE, time(17, 59))
+
+        assert {user.email for user in users} == {"early@example.com", "due@example.com"}
+
+    @pytest.mark.asyncio
+    async def test_malformed_times_fall_back_to_default(self, pg_session):
+        """Bad or missing values behave like 18:00 instead of failing the sweep."""
+        malformed = {
+            "hour25@example.com": {"notification_time": "25:00"},
+            "words@example.com": {"notification_time": "6pm"},
+            "empty@example.com": {"notification_time": ""},
+            "number@example.com": {"notification_time": 18},
+            "null@example.com": {"notification_time": None},
+            "seconds@example.com": {"notification_time": "17:00:00"},
+            "missing@example.com": {},
+        }
+        await _add_users(pg_session, malformed)
+        service = NotificationService(pg_session)
+
+        before_default = await service.get_non_loggers(TARGET_DATE, time(17, 59))
+        at_default = await service.get_non_loggers(TARGET_DATE, time(18, 0))
+
+        assert before_default == []
+        assert {user.email for user in at_default} == set(malformed)
+
+    @pytest.mark.asyncio
+    async def test_disabled_and_logged_users_excluded(self, pg_session):
+        """Users who opted out or already logged today are never reminded."""
+        users = await _add_users(pg_session, {
+            "off@example.com": {"notifications_enabled": False, "notification_time": "8:00"},
+            "logged@example.com": {"notification_time": "8:00"},
+            "remind@example.com": {"notification_time": "8:00"},
+        })
+        pg_session.add(JournalEntry(
+            user_id=users["logged@example.com"].id,
+            entry_date=TARGET_DATE,
+            content_markdown="done",
+        ))
+        await pg_session.commit()
+
+        reminded = await NotificationService(pg_session).get_non_loggers(TARGET_DATE, time(12, 0))
+
+        assert [user.email for user in reminded] == ["remind@example.com"]
@@ -0,0 +1,56 @@
+import httpx
+import pytest
+
+from app.ai_pipeline import clients
+from app.ai_pipeline.agents.mood_classifier import MoodClassifier
+from app.ai_pipeline.retry import AgentUnavailableError
+from app.core.config import settings
+
+
+@pytest.fixture
+def rate_limited(monkeypatch):
+    """Route the shared LLM HTTP client to a transport that always answers 429."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            429,
+            json={"type": "error", "error": {"type": "rate_limit_error", "message": "slow down"}},
+        )
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(clients, "get_http_client", lambda: http_client)
+    monkeypatch.setattr(
+        clients, "settings", settings.model_copy(update={"ANTHROPIC_API_KEY": "test-key"})
+    )
+    return requests
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record llm_retry's backoff sleeps instead of waiting."""
+    calls: list[float] = []
+
+    async def fake_sleep(seconds):
+        calls.append(seconds)
+
+    monkeypatch.setattr(MoodClassifier.classify_with_model.retry, "sleep", fake_sleep)
+    return calls
+
+
+class TestLlmRetry:
+    """Tests for transient provider errors reaching llm_retry through instructor."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_backs_off_then_raises_unavailable(self, rate_limited, sleeps):
+        """A persistent 429 is retried with backoff, then reported as AgentUnavailableError."""
+        classifier = MoodClassifier("anthropic")
+
+        with pytest.raises(AgentUnavailableError):
+            await classifier.classify_with_model("Long day.", classifier.deployment)
+
+        # One HTTP attempt per llm_retry attempt: no SDK or instructor retries underneath
+        assert len(rate_limited) == 3
+        assert len(sleeps) == 2
+        assert all(0 < seconds <= 20 for seconds in sleeps)
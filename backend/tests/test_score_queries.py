@@ -0,0 +1,129 @@
+import uuid
+from datetime import date
+
+import httpx
+import pytest
+import pytest_asyncio
+import redis.asyncio as redis
+from pydantic import TypeAdapter
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from app.api.v1.scores import _BASE_SCORE_STMT, _HISTORY_STMT
+from app.core import cache, response_cache
+from app.deps import get_current_user, get_db
+from app.main import app
+from app.models.daily_score import DailyScore, ScoreMetric
+from app.models.user import User
+from app.schemas.score import DailyScoreRead
+
+
+def _scores(user):
+    return [
+        DailyScore(
+            user=user,
+            score_date=date(2026, 1, 1 + offset),
+            verdict="better",
+            composite_score=70.0,
+            comparison_data={},
+            metrics=[
+                ScoreMetric(category=category, score=7.0, weight=1.0)
+                for category in ("fitness", "learning", "productivity")
+            ],
+        )
+        for offset in range(3)
+    ]
+
+
+class TestScoreReadQueries:
+    """Score read endpoints load a day and its metrics in a bounded number of queries."""
+
+    @pytest.fixture
+    def user_id(self, sqlite_engine):
+        with Session(sqlite_engine) as session:
+            user = User(email="a@example.com", hashed_password="x", preferences={})
+            session.add(user)
+            session.add_all(_scores(user))
+            session.commit()
+            return user.id
+
+    def test_unplanned_relationship_access_raises(self, sqlite_engine, user_id):
+        """raiseload("*") turns an accidental lazy load into an error instead of N+1."""
+        with Session(sqlite_engine) as session:
+            score = session.scalars(
+                _BASE_SCORE_STMT.where(DailyScore.user_id == user_id).limit(1)
+            ).one()
+
+            with pytest.raises(InvalidRequestError):
+                score.user
+
+    def test_unknown_user_returns_nothing(self, sqlite_engine, count_queries):
+        with Session(sqlite_engine) as session, count_queries(sqlite_engine) as queries:
+            scores = session.scalars(
+                _BASE_SCORE_STMT.where(DailyScore.user_id == uuid.uuid4())
+            ).all()
+
+        assert scores == []
+        assert len(queries) == 1
+
+
+class _UnreachableRedis:
+    """Redis stand-in that fails every call, so the response cache is bypassed."""
+
+    def __getattr__(self, name):
+        async def fail(*args, **kwargs):
+            raise redis.ConnectionError("redis unavailable in tests")
+        return fail
+
+
+class TestScoreHistory:
+    """History aggregates each day's metrics into JSON in a single query (Postgres only)."""
+
+    @pytest_asyncio.fixture
+    async def user(self, pg_session):
+        user = User(email="history@example.com", hashed_password="x", preferences={})
+        pg_session.add(user)
+        pg_session.add_all(_scores(user))
+        await pg_session.commit()
+        return user
+
+    @pytest.mark.asyncio
+    async def test_history_rows_validate_in_one_query(self, pg_session, count_queries, user):
+        engine = pg_session.bind.sync_engine
+        with count_queries(engine) as queries:
+            result = await pg_session.execute(
+                _HISTORY_STMT
+                .where(DailyScore.user_id == user.id)
+                .order_by(DailyScore.score_date.desc())
+            )
+            rows = [dict(row._mapping) for row in result]
+
+        scores = TypeAdapter(list[DailyScoreRead]).validate_python(rows)
+        assert [score.score_date for score in scores] == [date(2026, 1, 3), date(2026, 1, 2), date(2026, 1, 1)]
+        assert all(
+            sorted(metric.category for metric in score.metrics) == ["fitness", "learning", "productivity"]
+            for score in scores
+        )
+        assert len(queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_history_route(self, pg_session, user, monkeypatch):
+        """/scores/history must not be captured by /scores/{score_date}."""
+        async def db():
+            yield pg_session
+
+        monkeypatch.setattr(response_cache, "get_redis", _UnreachableRedis)
+        monkeypatch.setattr(cache, "get_redis", _UnreachableRedis)
+        app.dependency_overrides[get_db] = db
+        app.dependency_overrides[get_current_user] = lambda: user
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/api/v1/scores/history", params={"limit": 2})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [score["score_date"] for score in body] == ["2026-01-03", "2026-01-02"]
+        assert all(len(score["metrics"]) == 3 for score in body)